@@ -0,0 +1,47 @@
+"""
+Question construction benchmark
+
+Compares building typed questions in two passes (generic ``Question`` first,
+then ``QuestionFactory``) against the single pass used by
+``QualtricsSurveyFile``, over the bundled test templates.
+
+Usage: python -m benchmarks.construction [repeat]
+"""
+
+import sys
+import timeit
+
+from benchmarks.templates import load_elements
+from pyqsf.core.question import Question, QuestionFactory, get_question_class
+
+
+def two_pass(elements):
+    """Generic question first, then typed question"""
+    for element in elements:
+        question = Question(element)
+        QuestionFactory(question.question_type, question.data)
+
+
+def single_pass(elements):
+    """Typed question only"""
+    for element in elements:
+        get_question_class(element)(element)
+
+
+def main(repeat: int = 2000) -> None:
+    """Runs the benchmark and prints per-question cost"""
+    elements = load_elements()
+    total = len(elements) * repeat
+    results = {}
+    for func in (two_pass, single_pass):
+        seconds = min(
+            timeit.repeat(lambda f=func: f(elements), number=repeat, repeat=3)
+        )
+        results[func.__name__] = seconds
+        print(f"{func.__name__:<12} {seconds * 1e6 / total:8.2f} us/question")
+    saving = 1 - results["single_pass"] / results["two_pass"]
+    print(f"{'saving':<12} {saving:8.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,230 @@
+"""
+Synthetic survey generator
+
+Builds QSF documents of arbitrary size for benchmarks. The survey entry and
+the elements the object model does not parse (options, scoring, statistics,
+...) are taken from a bundled template, blocks, flow and questions are
+generated: a mix of MC questions with large ``Choices`` maps, Matrix, TE and
+DB questions spread over many blocks with page breaks, and a flow nesting
+every block in groups, branches and randomizers.
+
+Usage: python -m benchmarks.generator questions [output]
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pyqsf.core.writer import encode
+
+TEMPLATE = (
+    Path(__file__).parent.parent / "tests" / "templates" / "employee_exit_interview.qsf"
+)
+MODEL_ELEMENTS = ("BL", "FL", "SQ")
+QUESTIONS_PER_BLOCK = 20
+QUESTIONS_PER_PAGE = 4
+WORDS = (
+    "how likely satisfied would you recommend our company service product "
+    "experience rate overall quality value support price team role"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "?"
+
+
+def _labels(rng: random.Random, count: int) -> Dict[str, Dict[str, str]]:
+    return {str(i): {"Display": _text(rng, 3)} for i in range(1, count + 1)}
+
+
+def _question(
+    survey_id: str, number: int, rng: random.Random, choices: int
+) -> Dict[str, Any]:
+    question_id = f"QID{number}"
+    text = _text(rng, rng.randint(6, 20))
+    payload: Dict[str, Any] = {
+        "Configuration": {"QuestionDescriptionOption": "UseText"},
+        "DataExportTag": f"Q{number}",
+        "Language": {},
+        "NextAnswerId": 1,
+        "NextChoiceId": 1,
+        "QuestionDescription": text[:100],
+        "QuestionID": question_id,
+        "QuestionText": text,
+        "Validation": {"Settings": {"Type": "None"}},
+    }
+    kind = number % 10
+    if kind < 6:
+        count = rng.randint(2, choices)
+        payload.update(
+            {
+                "ChoiceOrder": list(range(1, count + 1)),
+                "Choices": _labels(rng, count),
+                "NextChoiceId": count + 1,
+                "QuestionType": "MC",
+                "Selector": "MAVR" if kind == 5 else "SAVR",
+                "SubSelector": "TX",
+            }
+        )
+    elif kind < 8:
+        rows, columns = rng.randint(2, 10), rng.randint(3, 7)
+        payload.update(
+            {
+                "AnswerOrder": list(range(1, columns + 1)),
+                "Answers": _labels(rng, columns),
+                "ChoiceOrder": list(range(1, rows + 1)),
+                "Choices": _labels(rng, rows),
+                "NextAnswerId": columns + 1,
+                "NextChoiceId": rows + 1,
+                "QuestionType": "Matrix",
+                "Selector": "Likert",
+                "SubSelector": "SingleAnswer",
+            }
+        )
+    elif kind == 8:
+        payload.update({"QuestionType": "TE", "Selector": "SL"})
+    else:
+        payload.update({"QuestionType": "DB", "Selector": "TB"})
+    return {
+        "SurveyID": survey_id,
+        "Element": "SQ",
+        "PrimaryAttribute": question_id,
+        "SecondaryAttribute": text[:100],
+        "TertiaryAttribute": None,
+        "Payload": payload,
+    }
+
+
+def _block(block_id: str, question_ids: List[str]) -> Dict[str, Any]:
+    elements: List[Dict[str, str]] = []
+    for index, question_id in enumerate(question_ids):
+        if index and index % QUESTIONS_PER_PAGE == 0:
+            elements.append({"Type": "Page Break"})
+        elements.append({"QuestionID": question_id, "Type": "Question"})
+    return {
+        "BlockElements": elements,
+        "Description": f"Block {block_id}",
+        "ID": block_id,
+        "Type": "Standard",
+    }
+
+
+def _flow_node(block_id: str, number: int, depth: int) -> Dict[str, Any]:
+    node: Dict[str, Any] = {
+        "FlowID": f"FL_{number}_0",
+        "ID": block_id,
+        "Type": "Standard",
+    }
+    for level in range(1, depth + 1):
+        flow_id = f"FL_{number}_{level}"
+        if level % 3 == 1:
+            node = {"Type": "Group", "FlowID": flow_id, "Flow": [node]}
+        elif level % 3 == 2:
+            node = {
+                "Type": "BlockRandomizer",
+                "FlowID": flow_id,
+                "SubSet": 1,
+                "Flow": [node],
+            }
+        else:
+            expression = {
+                "LogicType": "EmbeddedField",
+                "LeftOperand": "Segment",
+                "Operator": "NotEqualTo",
+                "RightOperand": "None",
+                "Type": "Expression",
+            }
+            node = {
+                "Type": "Branch",
+                "FlowID": flow_id,
+                "BranchLogic": {
+                    "0": {"0": expression, "Type": "If"},
+                    "Type": "BooleanExpression",
+                },
+                "Flow": [node],
+            }
+    return node
+
+
+def generate_survey(
+    questions: int, choices: int = 200, depth: int = 3, seed: int = 0
+) -> Dict[str, Any]:
+    """Returns a QSF document with the given number of questions
+
+    MC questions get up to ``choices`` choices, every block is nested
+    ``depth`` flow nodes deep.
+    """
+
+    rng = random.Random(seed)
+    template = json.loads(TEMPLATE.read_text(encoding="utf-8-sig"))
+    survey_id = template["SurveyEntry"]["SurveyID"]
+    elements = [
+        _question(survey_id, number, rng, choices) for number in range(1, questions + 1)
+    ]
+
+    blocks: Dict[str, Any] = {
+        "1": {
+            "BlockElements": [],
+            "Description": "Trash / Unused Questions",
+            "ID": "BL_trash",
+            "Type": "Trash",
+        }
+    }
+    flow = []
+    for start in range(0, questions, QUESTIONS_PER_BLOCK):
+        number = start // QUESTIONS_PER_BLOCK + 1
+        block_id = f"BL_{number}"
+        question_ids = [
+            e["PrimaryAttribute"] for e in elements[start : start + QUESTIONS_PER_BLOCK]
+        ]
+        blocks[str(number + 1)] = _block(block_id, question_ids)
+        flow.append(_flow_node(block_id, number, depth))
+
+    header = {"SurveyID": survey_id, "SecondaryAttribute": None}
+    elements.append(
+        {
+            **header,
+            "Element": "BL",
+            "PrimaryAttribute": "Survey Blocks",
+            "TertiaryAttribute": None,
+            "Payload": blocks,
+        }
+    )
+    elements.append(
+        {
+            **header,
+            "Element": "FL",
+            "PrimaryAttribute": "Survey Flow",
+            "TertiaryAttribute": None,
+            "Payload": {
+                "Flow": flow,
+                "FlowID": "FL_1",
+                "Properties": {"Count": len(flow) * (depth + 1)},
+                "Type": "Root",
+            },
+        }
+    )
+    elements.extend(
+        e for e in template["SurveyElements"] if e["Element"] not in MODEL_ELEMENTS
+    )
+    return {"SurveyEntry": template["SurveyEntry"], "SurveyElements": elements}
+
+
+def generate_bytes(questions: int, **options: Any) -> bytes:
+    """Returns a generated QSF document encoded the way Qualtrics exports it"""
+    return encode(generate_survey(questions, **options)).encode("utf-8")
+
+
+def main(questions: int, output: str = "") -> None:
+    """Writes a generated survey to output, stdout by default"""
+    content = generate_bytes(questions)
+    if output:
+        Path(output).write_bytes(content)
+    else:
+        sys.stdout.buffer.write(content)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), *sys.argv[2:3])
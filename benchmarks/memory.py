@@ -0,0 +1,90 @@
+"""
+Survey memory benchmark
+
+Measures memory retained by loaded surveys over the bundled test templates
+with tracemalloc, reported as bytes per question, with and without raw
+element data kept on the parsed objects.
+
+The ``__slots__`` saving is measured on the parsed objects themselves
+(questions, blocks and their elements, flow nodes and the survey entry):
+each object is compared with a stand-in holding the same attributes in a
+per-instance ``__dict__``, as the element classes did before slots. Only
+the objects are counted, their attribute values are shared by both.
+
+Usage: python -m benchmarks.memory
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Any, Dict, Iterator
+
+from benchmarks.templates import read_templates
+from pyqsf import QualtricsSurveyFile
+
+
+class Unslotted:  # pylint: disable=too-few-public-methods
+    """Stand-in keeping attributes in a per-instance __dict__"""
+
+
+def measure(contents, **kwargs):
+    """Returns retained bytes and question count of loading all contents"""
+    gc.collect()
+    tracemalloc.start()
+    surveys = [QualtricsSurveyFile.from_bytes(c, **kwargs) for c in contents]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, sum(len(s.questions) for s in surveys)
+
+
+def iter_objects(qsf: QualtricsSurveyFile) -> Iterator[Any]:
+    """Yields parsed objects of a survey"""
+    yield qsf.entry
+    yield from qsf.questions
+    for block in qsf.blocks:
+        yield block
+        yield from block.elements
+    yield qsf.flow
+    yield from qsf.flow.iter_nodes()
+
+
+def get_slot_values(obj: Any) -> Dict[str, Any]:
+    """Returns attributes of a slotted object by name"""
+    return {
+        name: getattr(obj, name)
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+        if hasattr(obj, name)
+    }
+
+
+def get_object_bytes(obj: Any, slotted: bool) -> int:
+    """Returns size of an object, or of an unslotted stand-in and its dict"""
+    assert not hasattr(obj, "__dict__"), type(obj)
+    if slotted:
+        return sys.getsizeof(obj)
+    stand_in = Unslotted()
+    stand_in.__dict__.update(get_slot_values(obj))
+    return sys.getsizeof(stand_in) + sys.getsizeof(stand_in.__dict__)
+
+
+def main() -> None:
+    """Runs the benchmark and prints bytes per question"""
+    contents = read_templates()
+    options = {"keep_data=True": {}, "keep_data=False": {"keep_data": False}}
+    for label, kwargs in options.items():
+        size, questions = measure(contents, **kwargs)
+        print(f"{label:<16} {size / questions:10.0f} bytes/question")
+
+    surveys = [QualtricsSurveyFile.from_bytes(c) for c in contents]
+    questions = sum(len(s.questions) for s in surveys)
+    objects = [obj for s in surveys for obj in iter_objects(s)]
+    print(f"objects          {len(objects) / questions:10.1f} per question")
+    for label, slotted in (("__dict__", False), ("__slots__", True)):
+        size = sum(get_object_bytes(obj, slotted) for obj in objects)
+        print(f"{label:<16} {size / questions:10.0f} object bytes/question")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Path simulation benchmark
+
+Measures simulated respondents per second of ``PathSimulator`` over the
+bundled test templates. Surveys are loaded and compiled once up front so
+only simulation is timed.
+
+Usage: python -m benchmarks.simulation [respondents]
+"""
+
+import sys
+import timeit
+
+from benchmarks.templates import get_paths
+from pyqsf import QualtricsSurveyFile
+from pyqsf.core.simulation import PathSimulator
+
+
+def main(respondents: int = 100000) -> None:
+    """Runs the benchmark and prints throughput per template"""
+    for path in get_paths():
+        simulator = PathSimulator(QualtricsSurveyFile(str(path)), seed=0)
+
+        def simulate(simulator=simulator):
+            simulator.simulate(respondents)
+
+        seconds = min(timeit.repeat(simulate, number=1, repeat=3))
+        print(f"{path.name:<45} {respondents / seconds:12.0f} respondents/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,154 @@
+"""
+Survey loading benchmark suite
+
+Generates synthetic surveys of growing size with ``generator.py`` and
+measures, per size:
+
+- load: decoding and indexing the file (``lazy=True``)
+- compose: building questions, blocks and pages in flow order
+- peak and retained memory of an eager load, with tracemalloc
+- cost per question of load and compose
+
+Timings are the best of ``--repeat`` runs. Results are saved as JSON
+together with the package version and git commit, pass an earlier result
+file as ``--baseline`` to print relative changes.
+
+Usage: python -m benchmarks.suite [--sizes 10 100 1000 10000] [--repeat 5]
+       [--output results.json] [--baseline previous.json]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.generator import generate_bytes
+
+from pyqsf import QualtricsSurveyFile
+
+SIZES = [10, 100, 1000, 10000]
+METRICS = ("load_seconds", "compose_seconds", "peak_bytes", "retained_bytes")
+
+
+def compose(qsf: QualtricsSurveyFile) -> None:
+    """Builds questions, blocks and pages of a lazily loaded survey"""
+    _ = qsf.questions, qsf.blocks, qsf.pages
+
+
+def best_of(repeat: int, content: bytes) -> Dict[str, float]:
+    """Returns the best load and compose times of repeated runs"""
+    load, build = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        qsf = QualtricsSurveyFile.from_bytes(content, lazy=True)
+        loaded = time.perf_counter()
+        compose(qsf)
+        composed = time.perf_counter()
+        load = min(load, loaded - start)
+        build = min(build, composed - loaded)
+        del qsf
+    return {"load_seconds": load, "compose_seconds": build}
+
+
+def measure_memory(content: bytes) -> Dict[str, int]:
+    """Returns peak and retained bytes of an eager load"""
+    gc.collect()
+    tracemalloc.start()
+    qsf = QualtricsSurveyFile.from_bytes(content)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del qsf
+    return {"peak_bytes": peak, "retained_bytes": retained}
+
+
+def run(size: int, repeat: int) -> Dict[str, Any]:
+    """Returns benchmark results for a generated survey of the given size"""
+    content = generate_bytes(size)
+    result: Dict[str, Any] = {"questions": size, "file_bytes": len(content)}
+    result.update(best_of(repeat, content))
+    result.update(measure_memory(content))
+    seconds = result["load_seconds"] + result["compose_seconds"]
+    result["us_per_question"] = seconds * 1e6 / size
+    return result
+
+
+def get_meta() -> Dict[str, Any]:
+    """Returns package, interpreter and commit the results were taken with"""
+    try:
+        version: Optional[str] = metadata.version("pyqsf")
+    except metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """Prints relative change of every metric against baseline results"""
+    previous = {r["questions"]: r for r in baseline["results"]}
+    print(f"\nchange against {baseline['meta'].get('commit')}:")
+    for result in results:
+        before = previous.get(result["questions"])
+        if before is None:
+            continue
+        changes = " ".join(
+            f"{metric.split('_', maxsplit=1)[0]} {result[metric] / before[metric] - 1:+7.1%}"
+            for metric in METRICS
+            if before.get(metric)
+        )
+        print(f"{result['questions']:>8} {changes}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the suite, prints a table and saves results as JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(
+        f"{'questions':>9} {'load ms':>9} {'compose ms':>10} {'us/q':>7} {'peak MB':>8}"
+    )
+    for size in args.sizes:
+        result = run(size, args.repeat)
+        results.append(result)
+        print(
+            f"{size:>9} {result['load_seconds'] * 1e3:9.2f} "
+            f"{result['compose_seconds'] * 1e3:10.2f} "
+            f"{result['us_per_question']:7.1f} {result['peak_bytes'] / 2**20:8.1f}"
+        )
+
+    report = {"meta": get_meta(), "results": results}
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.baseline:
+        compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,42 @@
+"""
+Bundled test templates shared by the benchmarks
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+TEMPLATES = Path(__file__).parent.parent / "tests" / "templates"
+NAMES = [
+    "brand_perceptions.qsf",
+    "customer_service_contact_center.qsf",
+    "employee_exit_interview.qsf",
+    "needs_based_analytics.qsf",
+    "pricing_study.qsf",
+    "transactional_effort_customer_score.qsf",
+]
+
+
+def get_paths() -> List[Path]:
+    """Returns paths of the bundled templates"""
+    return [TEMPLATES / name for name in NAMES]
+
+
+def read_templates() -> List[bytes]:
+    """Returns raw content of the bundled templates"""
+    return [path.read_bytes() for path in get_paths()]
+
+
+def load_templates() -> List[Dict[str, Any]]:
+    """Returns decoded bundled templates"""
+    return [json.loads(path.read_text(encoding="UTF-8")) for path in get_paths()]
+
+
+def load_elements() -> List[Dict[str, Any]]:
+    """Returns all SQ elements of the bundled templates"""
+    return [
+        element
+        for data in load_templates()
+        for element in data["SurveyElements"]
+        if element["Element"] == "SQ"
+    ]
@@ -0,0 +1,69 @@
+"""
+Validation level benchmark
+
+Measures throughput of each validation level over the bundled test
+templates. Templates are decoded once up front so JSON decoding is excluded.
+
+``extract`` builds only the objects whose fields are checked (survey entry,
+questions, blocks and flow) from the decoded elements, which isolates the
+per-field checks the levels skip. ``load`` runs a full load, where indexing
+and composition dilute the difference.
+
+Usage: python -m benchmarks.validation [repeat]
+"""
+
+import sys
+import timeit
+
+from benchmarks.templates import load_templates
+from pyqsf import QualtricsSurveyFile
+from pyqsf.core.block import Block
+from pyqsf.core.entry import SurveyEntry
+from pyqsf.core.flow import Flow
+from pyqsf.core.question import get_question_class
+from pyqsf.core.validation import ValidationLevel
+
+ELEMENT_CLASSES = {"BL": Block, "FL": Flow}
+
+
+def get_builders(surveys):
+    """Returns (class, data) of every checked object of the surveys"""
+    builders = []
+    for data in surveys:
+        builders.append((SurveyEntry, data["SurveyEntry"]))
+        for element in data["SurveyElements"]:
+            if element["Element"] == "SQ":
+                builders.append((get_question_class(element), element))
+            elif element["Element"] in ELEMENT_CLASSES:
+                builders.append((ELEMENT_CLASSES[element["Element"]], element))
+    return builders
+
+
+def main(repeat: int = 200) -> None:
+    """Runs the benchmark and prints throughput per validation level"""
+    surveys = load_templates()
+    questions = sum(
+        len(QualtricsSurveyFile.from_dict(data).questions) for data in surveys
+    )
+    builders = get_builders(surveys)
+    for level in ValidationLevel:
+
+        def extract(level=level):
+            for cls, data in builders:
+                cls(data, level)
+
+        def load(level=level):
+            for data in surveys:
+                QualtricsSurveyFile.from_dict(data, validation=level)
+
+        for label, run in (("extract", extract), ("load", load)):
+            seconds = min(timeit.repeat(run, number=repeat, repeat=3))
+            print(
+                f"{label:<8} {level.value:<8}"
+                f" {len(surveys) * repeat / seconds:10.0f} surveys/s"
+                f" {questions * repeat / seconds:10.0f} questions/s"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -2,8 +2,11 @@
 PyQSF module exports
 """
 
-from pyqsf.core import QualtricsSurveyFile
+from pyqsf.core import QualtricsSurveyFile, aload_many, load_cached, load_many
 
 __all__ = [
     "QualtricsSurveyFile",
+    "aload_many",
+    "load_cached",
+    "load_many",
 ]
@@ -5,15 +5,49 @@ PyQSF Elements module exports
 from pyqsf.core.qsf import QualtricsSurveyFile
 from pyqsf.core.flow import Flow
 from pyqsf.core.block import Block, BlockEntry, BlockElementType, PageBreak
-from pyqsf.core.question import Question, QuestionFactory
+from pyqsf.core.page import Page
+from pyqsf.core.diagnostics import Diagnostic
+from pyqsf.core.question import (
+    Question,
+    QuestionFactory,
+    QuestionType,
+    register_question_type,
+)
+from pyqsf.core.table import QuestionTable, TableColumn
+from pyqsf.core.responses import ColumnKind, ResponseReader
+from pyqsf.core.logic import DisplayEvaluator, LogicCompiler
+from pyqsf.core.simulation import PathSimulator, SimulationResult
+from pyqsf.core.stats import LoadPhase, LoadStats
+from pyqsf.core.decoder import JSONBackend
+from pyqsf.core.batch import aload_many, load_many
+from pyqsf.core.cache import CacheValidation, load_cached
 
 __all__ = [
     "Block",
     "BlockElementType",
     "BlockEntry",
+    "CacheValidation",
+    "ColumnKind",
+    "Diagnostic",
+    "DisplayEvaluator",
     "Flow",
+    "JSONBackend",
+    "LoadPhase",
+    "LoadStats",
+    "LogicCompiler",
     "Question",
+    "Page",
     "PageBreak",
+    "PathSimulator",
     "QualtricsSurveyFile",
     "QuestionFactory",
+    "QuestionTable",
+    "QuestionType",
+    "ResponseReader",
+    "SimulationResult",
+    "TableColumn",
+    "aload_many",
+    "load_cached",
+    "load_many",
+    "register_question_type",
 ]
@@ -0,0 +1,140 @@
+"""
+PyQSF batch module
+"""
+
+import asyncio
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pyqsf.core.qsf import QualtricsSurveyFile
+
+Result = Tuple[str, Union[QualtricsSurveyFile, Exception]]
+
+
+def load_many(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> Iterator[Result]:
+    """Loads many QSF files on a process pool
+
+    Yields (path, result) pairs where result is the loaded
+    ``QualtricsSurveyFile`` or the exception raised while loading it, so one
+    invalid file does not abort the batch. Paths are sent to workers in
+    chunks of ``chunksize`` to keep IPC overhead low, at most two chunks per
+    worker are in flight and results are released once yielded. Closing the
+    iterator early cancels chunks not started yet. With ``ordered=False``
+    results are yielded as chunks complete. ``workers=1`` loads in the
+    current process. Remaining keyword arguments are passed to
+    ``QualtricsSurveyFile``.
+    """
+
+    chunks = _iter_chunks(paths, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _drain(_load_chunk(chunk, kwargs))
+        return
+
+    limit = 2 * (workers or os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = [
+            executor.submit(_load_chunk, chunk, kwargs)
+            for chunk in islice(chunks, limit)
+        ]
+        while pending:
+            if ordered:
+                done = [pending.pop(0)]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending = [future for future in pending if future not in finished]
+                done = list(finished)
+                del finished
+            for chunk in islice(chunks, len(done)):
+                pending.append(executor.submit(_load_chunk, chunk, kwargs))
+            while done:
+                yield from _drain(done.pop().result())
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+async def aload_many(
+    paths: Iterable[str],
+    concurrency: int = 8,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Result]:
+    """Loads many QSF files without blocking the event loop
+
+    Yields (path, result) pairs as loads complete, with at most
+    ``concurrency`` files being read or parsed at a time and as many
+    results waiting to be consumed. Parsing runs on ``executor``, see
+    ``QualtricsSurveyFile.aload``.
+    """
+
+    names = (str(path) for path in paths)
+    results: "asyncio.Queue[Optional[Result]]" = asyncio.Queue(concurrency)
+
+    async def load(path: str) -> Result:
+        try:
+            qsf = await QualtricsSurveyFile.aload(path, executor=executor, **kwargs)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return path, err
+        return path, qsf
+
+    async def work() -> None:
+        for path in names:
+            await results.put(await load(path))
+        await results.put(None)
+
+    tasks = [asyncio.ensure_future(work()) for _ in range(concurrency)]
+    try:
+        running = len(tasks)
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _iter_chunks(paths: Iterable[str], size: int) -> Iterator[List[str]]:
+    names = (str(path) for path in paths)
+    while True:
+        chunk = list(islice(names, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _drain(results: List[Result]) -> Iterator[Result]:
+    # pops results as they are yielded, so consumed surveys can be freed
+    results.reverse()
+    while results:
+        yield results.pop()
+
+
+def _load_chunk(paths: List[str], kwargs: dict) -> List[Result]:
+    results: List[Result] = []
+    for path in paths:
+        try:
+            results.append((path, QualtricsSurveyFile(path, **kwargs)))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results.append((path, err))
+    return results
@@ -2,11 +2,18 @@
 PyQSF block module
 """
 
-from typing import Dict, Any, List
+from typing import ClassVar, Dict, Any, List, Optional
 from enum import Enum
 
-from pyqsf.core.element import Element
-from pyqsf.exceptions import FieldWrongType, BlockEntryNotFound
+from pyqsf.core.element import Element, ElementField
+from pyqsf.core.schema import compile_schema, extract_fields, inject_fields
+from pyqsf.core.validation import (
+    Reporter,
+    ValidationLevel,
+    get_validation,
+    report_error,
+)
+from pyqsf.exceptions import BlockEntryNotFound, FieldWrongType
 
 
 # fmt: off
@@ -34,68 +41,203 @@ class BlockElementType(Enum):
     PAGE_BREAK = "Page Break"
 
 
+BLOCK_ENTRY_SCHEMA = compile_schema(
+    ("block_elements",  BlockEntryField.BLOCK_ELEMENTS, list),
+    ("description",     BlockEntryField.DESCRIPTION,    str),
+    ("id",              BlockEntryField.ID,             str),
+    ("options",         BlockEntryField.OPTIONS,        dict,   False),
+    ("type",            BlockEntryField.TYPE,           str),
+)
+
+BLOCK_ELEMENT_SCHEMA = compile_schema(
+    ("type",            BlockElementField.TYPE,         str),
+)
+
+BLOCK_QUESTION_SCHEMA = compile_schema(
+    ("question_id",     BlockElementField.QUESTION_ID,  str),
+)
+
+
 # fmt: on
 
 
 class PageBreak:  # pylint: disable=too-few-public-methods
-    """Implements Page Break class"""
+    """Implements Page Break class, all page breaks share one instance"""
+
+    __slots__ = ()
+
+    _instance: ClassVar[Optional["PageBreak"]] = None
+
+    def __new__(cls) -> "PageBreak":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
 
 class BlockElement:  # pylint: disable=too-few-public-methods
     """Implements Block Element"""
 
-    def __init__(self, data: Dict[str, Any]):
-        self.data = data
-        self.type = self._get(BlockElementField.TYPE, str)
-        if self.type == BlockElementType.QUESTION.value:
-            self.question_id = self._get(BlockElementField.QUESTION_ID, str)
+    __slots__ = ("_level", "data", "type", "question_id")
 
-    def _get(self, field: BlockElementField, _type: Any, required=True):
-        value = self.data.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Block Element", field, _type, type(value))
-        return value
+    data: Dict[str, Any]
+    type: str
+    question_id: str
 
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        self._level = get_validation(validation)
+        self.data = data
+        extract_fields(self, "Block Element", data, BLOCK_ELEMENT_SCHEMA, self._level)
+        if self.type == BlockElementType.QUESTION.value:
+            extract_fields(
+                self, "Block Element", data, BLOCK_QUESTION_SCHEMA, self._level
+            )
 
-class BlockEntry:  # pylint: disable=too-few-public-methods
-    """Implements Block Entry"""
-
-    def __init__(self, data: Dict[str, Any]):
-        # fmt: off
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns element data with extracted fields written back"""
+        data = inject_fields(self, self.data, BLOCK_ELEMENT_SCHEMA)
+        if self.type == BlockElementType.QUESTION.value:
+            data = inject_fields(self, data, BLOCK_QUESTION_SCHEMA)
+        return data
+
+    def drop_data(self) -> None:
+        """Releases raw element data once fields are extracted"""
+        self.data = None  # type: ignore[assignment]
+
+
+class BlockEntry:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    """Implements Block Entry
+
+    Without ``report`` an invalid block element raises, with it the error is
+    reported and the element skipped.
+    """
+
+    __slots__ = (
+        "_level",
+        "data",
+        "block_elements",
+        "description",
+        "id",
+        "options",
+        "type",
+        "elements",
+    )
+
+    data: Dict[str, Any]
+    block_elements: List[Dict[str, Any]]
+    description: str
+    id: str
+    options: Dict[str, Any]
+    type: str
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        validation: Optional[ValidationLevel] = None,
+        report: Optional[Reporter] = None,
+    ):
+        self._level = get_validation(validation)
         self.data = data
-        self.block_elements: List[Dict[str, Any]]   = self._get(BlockEntryField.BLOCK_ELEMENTS,   list)
-        self.description: str                       = self._get(BlockEntryField.DESCRIPTION,      str)
-        self.id: str                                = self._get(BlockEntryField.ID,               str)
-        self.options: Dict[str, Any]                = self._get(BlockEntryField.OPTIONS,          dict, required=False)
-        self.type: str                              = self._get(BlockEntryField.TYPE,             str)
-        # fmt: on
-
-        self.elements: List[BlockElement] = [
-            BlockElement(e) for e in self.block_elements
+        extract_fields(self, "Block Entry", data, BLOCK_ENTRY_SCHEMA, self._level)
+        self.elements: List[BlockElement] = []
+        for element in self.block_elements or ():
+            try:
+                if not isinstance(element, dict):
+                    raise FieldWrongType(
+                        "Block Entry",
+                        BlockEntryField.BLOCK_ELEMENTS,
+                        dict,
+                        type(element),
+                    )
+                self.elements.append(BlockElement(element, self._level))
+            except FieldWrongType as err:
+                report_error(report, err, element)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns entry data with extracted fields and ``elements`` written back"""
+        data = inject_fields(self, self.data, BLOCK_ENTRY_SCHEMA)
+        data[BlockEntryField.BLOCK_ELEMENTS.value] = [
+            element.to_dict() for element in self.elements
         ]
+        return data
 
-    def _get(self, field: BlockEntryField, _type: Any, required=True):
-        value = self.data.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Block Entry", field, _type, type(value))
-        return value
+    def drop_data(self) -> None:
+        """Releases raw entry data once fields are extracted"""
+        self.data = None  # type: ignore[assignment]
+        for element in self.elements:
+            element.drop_data()
 
 
 class Block(Element):  # pylint: disable=too-few-public-methods
-    """Implements Block"""
-
-    def __init__(self, data: Dict[str, Any]):
-        super().__init__(data)
-        self.block_elements = self._get_block_elements()
-
-    def get_block_by_id(self, _id: str):
-        """Returns Block IDs"""
+    """Implements Block
+
+    Without ``report`` an invalid block entry or element raises, with it the
+    error is reported and the entry or element skipped.
+    """
+
+    __slots__ = ("block_elements", "_index")
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        validation: Optional[ValidationLevel] = None,
+        report: Optional[Reporter] = None,
+    ):
+        super().__init__(data, validation)
+        self.block_elements = self._get_block_elements(report)
+        self._index: Dict[str, BlockEntry] = {}
         for block in self.block_elements:
-            if block.id == _id:
-                return block
-        raise BlockEntryNotFound(_id)
-
-    def _get_block_elements(self) -> List[BlockEntry]:
+            self._index.setdefault(block.id, block)
+
+    def get_block_by_id(self, _id: str) -> BlockEntry:
+        """Returns Block Entry by ID"""
+        try:
+            return self._index[_id]
+        except KeyError as err:
+            raise BlockEntryNotFound(_id) from err
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns block data with block entries written back
+
+        A payload object keeps its keys while the number of entries is
+        unchanged, otherwise entries are keyed by position.
+        """
+        data = super().to_dict()
+        entries = [block.to_dict() for block in self.block_elements]
+        payload: Any = entries
         if isinstance(self.payload, dict):
-            return [BlockEntry(v) for v in self.payload.values()]
-        return [BlockEntry(e) for e in self.payload]
+            keys: Any = self.payload
+            if len(keys) != len(entries):
+                keys = (str(i) for i in range(1, len(entries) + 1))
+            payload = dict(zip(keys, entries))
+        data[ElementField.PAYLOAD.value] = payload
+        return data
+
+    def drop_data(self) -> None:
+        """Releases raw block data once fields are extracted"""
+        super().drop_data()
+        for block in self.block_elements:
+            block.drop_data()
+
+    def _get_block_elements(self, report: Optional[Reporter]) -> List[BlockEntry]:
+        payload: Any = self.payload
+        if isinstance(payload, dict):
+            payload = payload.values()
+        elif not isinstance(payload, list):
+            error = FieldWrongType(
+                "Block", ElementField.PAYLOAD, (dict, list), type(payload)
+            )
+            report_error(report, error, self.data)
+            return []
+        entries = []
+        for data in payload:
+            try:
+                if not isinstance(data, dict):
+                    raise FieldWrongType(
+                        "Block", ElementField.PAYLOAD, dict, type(data)
+                    )
+                entries.append(BlockEntry(data, self._level, report))
+            except FieldWrongType as err:
+                report_error(report, err, data)
+        return entries
@@ -0,0 +1,101 @@
+"""
+PyQSF cache module
+"""
+
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.exceptions import FileNotFound
+
+CACHE_VERSION = 13
+CACHE_SUFFIX = ".qsfc"
+
+
+class CacheValidation(Enum):
+    """Cache Validation Modes"""
+
+    MTIME = "mtime"
+    HASH = "hash"
+
+
+def load_cached(
+    filepath: str,
+    cache_dir: str,
+    validation: Union[str, CacheValidation] = CacheValidation.MTIME,
+    backend: Optional[str] = None,
+) -> QualtricsSurveyFile:
+    """Loads QSF file through an on-disk cache of the composed survey
+
+    The composed survey is stored pickled in ``cache_dir``, keyed by the
+    absolute file path. The cache entry is reused while the source file
+    keeps its size and mtime (``mtime``) or its content hash (``hash``);
+    a warm load skips JSON decoding and field validation. Surveys that
+    cannot be pickled or written are returned without being cached. Cache
+    files are trusted, only point ``cache_dir`` at a directory you control.
+    """
+
+    path = Path(filepath).absolute()
+    if not path.exists():
+        raise FileNotFound(str(path))
+    validation = CacheValidation(validation)
+    cache_file = Path(cache_dir) / (
+        hashlib.sha1(str(path).encode("UTF-8")).hexdigest() + CACHE_SUFFIX
+    )
+
+    content = path.read_bytes() if validation is CacheValidation.HASH else None
+    key = _get_key(path, content)
+    qsf = _read_cache(cache_file, key)
+    if qsf is None:
+        qsf = QualtricsSurveyFile.from_bytes(
+            content if content is not None else path.read_bytes(), backend=backend
+        )
+        _write_cache(cache_file, key, qsf)
+    return qsf
+
+
+def _get_key(path: Path, content: Optional[bytes]) -> Tuple[Any, ...]:
+    if content is not None:
+        return (CACHE_VERSION, hashlib.blake2b(content).hexdigest())
+    stat = path.stat()
+    return (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+
+
+def _read_cache(
+    cache_file: Path, key: Tuple[Any, ...]
+) -> Optional[QualtricsSurveyFile]:
+    if not cache_file.exists():
+        return None
+    try:
+        with io.BytesIO(cache_file.read_bytes()) as file:
+            if pickle.load(file) != key:
+                return None
+            qsf = pickle.load(file)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+    return qsf if isinstance(qsf, QualtricsSurveyFile) else None
+
+
+def _write_cache(
+    cache_file: Path, key: Tuple[Any, ...], qsf: QualtricsSurveyFile
+) -> None:
+    # best effort: a survey that cannot be pickled or written is not cached
+    temp: Optional[Path] = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as file:
+            temp = Path(file.name)
+            pickle.dump(key, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(qsf, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, cache_file)
+    except Exception:  # pylint: disable=broad-exception-caught
+        if temp is not None:
+            temp.unlink(missing_ok=True)
@@ -0,0 +1,129 @@
+"""
+PyQSF choices module
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+
+class ChoiceTable:
+    """Implements Choice Table, the choices or answers of a question
+
+    Built once from the raw ``Choices`` or ``Answers`` field with its order,
+    recode values and export tags. IDs are kept in display order, choices
+    missing from the order follow in field order. A choice recodes to its
+    ID unless a recode value is set, labels shared by several choices look
+    up the first recode in display order.
+
+    Tables reflect question fields when built, they are not updated when the
+    fields are changed.
+    """
+
+    __slots__ = (
+        "ids",
+        "text_entries",
+        "_labels",
+        "_recodes",
+        "_recode_labels",
+        "_label_recodes",
+        "_export_tags",
+    )
+
+    def __init__(
+        self,
+        choices: Any,
+        order: Any = None,
+        recodes: Any = None,
+        export_tags: Any = None,
+    ) -> None:
+        labels = get_choice_labels(choices)
+        if isinstance(order, list) and order:
+            ordered = [str(c) for c in order]
+            if ordered != list(labels):
+                ids = [c for c in ordered if c in labels] + list(labels)
+                labels = {c: labels[c] for c in dict.fromkeys(ids)}
+        recodes = recodes if isinstance(recodes, dict) else {}
+        export_tags = export_tags if isinstance(export_tags, dict) else {}
+
+        self.ids: Tuple[str, ...] = tuple(labels)
+        self.text_entries = get_text_entries(choices)
+        self._labels = labels
+        self._recodes = {str(c): str(r) for c, r in recodes.items() if c in labels}
+        self._recode_labels = labels
+        if self._recodes:
+            self._recode_labels = {
+                self._recodes.get(c, c): label for c, label in labels.items()
+            }
+        self._label_recodes: Dict[str, str] = {}
+        for recode, label in self._recode_labels.items():
+            self._label_recodes.setdefault(label, recode)
+        self._export_tags = {
+            str(c): tag for c, tag in export_tags.items() if isinstance(tag, str)
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __contains__(self, choice: object) -> bool:
+        return choice in self._labels
+
+    @property
+    def labels(self) -> Mapping[str, str]:
+        """Returns read-only mapping of choice IDs to labels in display order"""
+        return MappingProxyType(self._labels)
+
+    @property
+    def recode_labels(self) -> Mapping[str, str]:
+        """Returns read-only mapping of recode values to labels"""
+        return MappingProxyType(self._recode_labels)
+
+    def get_label(self, choice: str) -> Optional[str]:
+        """Returns label of a choice ID"""
+        return self._labels.get(choice)
+
+    def get_recode(self, choice: str) -> Optional[str]:
+        """Returns recode value of a choice ID"""
+        if choice not in self._labels:
+            return None
+        return self._recodes.get(choice, choice)
+
+    def get_label_by_recode(self, recode: str) -> Optional[str]:
+        """Returns label of a recode value"""
+        return self._recode_labels.get(recode)
+
+    def get_recode_by_label(self, label: str) -> Optional[str]:
+        """Returns recode value of a label"""
+        return self._label_recodes.get(label)
+
+    def get_export_tag(self, choice: str) -> Optional[str]:
+        """Returns data export tag of a choice ID, if set"""
+        return self._export_tags.get(choice)
+
+
+def get_choice_labels(choices: Any) -> Dict[str, str]:
+    """Returns display labels of question choices or answers by ID"""
+    items: Iterable[Tuple[Any, Any]]
+    if isinstance(choices, dict):
+        items = choices.items()
+    elif isinstance(choices, list):
+        items = ((str(i), c) for i, c in enumerate(choices))
+    else:
+        return {}
+    return {
+        str(key): value.get("Display", "") if isinstance(value, dict) else str(value)
+        for key, value in items
+    }
+
+
+def get_text_entries(choices: Any) -> Tuple[str, ...]:
+    """Returns IDs of question choices with a text entry"""
+    if not isinstance(choices, dict):
+        return ()
+    return tuple(
+        str(key)
+        for key, value in choices.items()
+        if isinstance(value, dict) and value.get("TextEntry") in ("true", True)
+    )
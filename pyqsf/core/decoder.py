@@ -0,0 +1,84 @@
+"""
+PyQSF decoder module
+"""
+
+import importlib
+import json
+import os
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+from pyqsf.exceptions import JSONBackendNotFound
+
+BACKEND_ENV_VAR = "PYQSF_JSON_BACKEND"
+UTF8_BOM = b"\xef\xbb\xbf"
+
+Decoder = Tuple[Callable[[Any], Any], Tuple[Type[Exception], ...]]
+
+
+# fmt: off
+class JSONBackend(Enum):
+    """JSON Decoder Backends"""
+
+    AUTO    = "auto"
+    ORJSON  = "orjson"
+    MSGSPEC = "msgspec"
+    UJSON   = "ujson"
+    JSON    = "json"
+
+
+# fmt: on
+AUTO_ORDER = (JSONBackend.ORJSON, JSONBackend.MSGSPEC, JSONBackend.UJSON)
+
+
+def get_decoder(backend: Optional[str] = None) -> Decoder:
+    """Returns (loads, errors) of the requested backend
+
+    Backend is taken from the argument, then from the ``PYQSF_JSON_BACKEND``
+    environment variable, and defaults to ``auto``. Backends that are not
+    installed silently fall back to the standard library ``json``.
+    """
+
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV_VAR, JSONBackend.AUTO.value)
+    return _resolve(backend.lower())
+
+
+def strip_bom(content: Union[str, bytes, bytearray]) -> Union[str, bytes, bytearray]:
+    """Returns JSON text without a leading UTF-8 byte order mark
+
+    Backends disagree on byte order marks, ``orjson`` rejects them while
+    ``json`` accepts them in bytes, so they are removed before decoding.
+    """
+
+    if isinstance(content, str):
+        return content[1:] if content.startswith("\ufeff") else content
+    return content[len(UTF8_BOM) :] if content.startswith(UTF8_BOM) else content
+
+
+@lru_cache(maxsize=None)
+def _resolve(name: str) -> Decoder:
+    try:
+        backend = JSONBackend(name)
+    except ValueError as err:
+        raise JSONBackendNotFound(name) from err
+
+    candidates = AUTO_ORDER if backend is JSONBackend.AUTO else (backend,)
+    for candidate in candidates:
+        if candidate is JSONBackend.JSON:
+            break
+        decoder = _import_decoder(candidate)
+        if decoder is not None:
+            return decoder
+    return json.loads, (ValueError,)
+
+
+def _import_decoder(backend: JSONBackend) -> Optional[Decoder]:
+    try:
+        module = importlib.import_module(backend.value)
+    except ImportError:
+        return None
+    if backend is JSONBackend.MSGSPEC:
+        return module.json.decode, (ValueError, module.DecodeError)
+    return module.loads, (ValueError,)
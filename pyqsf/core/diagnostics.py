@@ -0,0 +1,29 @@
+"""
+PyQSF diagnostics module
+"""
+
+from typing import Any, Dict, Optional
+
+from pyqsf.exceptions.core import PyQSFBaseException
+
+
+class Diagnostic:  # pylint: disable=too-few-public-methods
+    """Implements Diagnostic, an error collected while loading with ``tolerant``
+
+    ``error`` is the exception a strict load would have raised and ``data``
+    the raw data it was raised for, if available.
+    """
+
+    __slots__ = ("error", "data")
+
+    def __init__(
+        self, error: PyQSFBaseException, data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.error = error
+        self.data = data
+
+    def __str__(self) -> str:
+        return str(self.error)
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({type(self.error).__name__}: {self.error})"
@@ -2,10 +2,11 @@
 PyQSF element module
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from enum import Enum
 
-from pyqsf.exceptions import FieldWrongType
+from pyqsf.core.schema import compile_schema, extract_fields, inject_fields
+from pyqsf.core.validation import ValidationLevel, get_validation
 
 
 # fmt: off
@@ -20,23 +21,51 @@ class ElementField(Enum):
     TERTIARY_ATTRIBUTE      = "TertiaryAttribute"
 
 
+ELEMENT_SCHEMA = compile_schema(
+    ("element",                 ElementField.ELEMENT,               str),
+    ("id",                      ElementField.ID,                    str),
+    ("payload",                 ElementField.PAYLOAD,               (dict, list),   False),
+    ("primary_attribute",       ElementField.PRIMARY_ATTRIBUTE,     str),
+    ("secondary_attribute",     ElementField.SECONDARY_ATTRIBUTE,   str,            False),
+    ("tertiary_attribute",      ElementField.TERTIARY_ATTRIBUTE,    str,            False),
+)
+
+
 # fmt: on
-class Element:  # pylint: disable=too-few-public-methods
+class Element:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """Implements Element"""
 
-    def __init__(self, data: Dict[str, Any]):
-        # fmt: off
-        self.data: Dict[str, Any]       = data
-        self.element: str               = self._get_el(ElementField.ELEMENT,                 str)
-        self.id: str                    = self._get_el(ElementField.ID,                      str)
-        self.payload: Dict[str, Any]    = self._get_el(ElementField.PAYLOAD,                 (dict, list),  required=False)
-        self.primary_attribute: str     = self._get_el(ElementField.PRIMARY_ATTRIBUTE,       str)
-        self.secondary_attribute: str   = self._get_el(ElementField.SECONDARY_ATTRIBUTE,     str,           required=False)
-        self.tertiary_attribute: str    = self._get_el(ElementField.TERTIARY_ATTRIBUTE,      str,           required=False)
-        # fmt: on
-
-    def _get_el(self, field: ElementField, _type: Any, required=True):
-        value = self.data.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Element", field, _type, type(value))
-        return value
+    __slots__ = (
+        "_level",
+        "data",
+        "element",
+        "id",
+        "payload",
+        "primary_attribute",
+        "secondary_attribute",
+        "tertiary_attribute",
+    )
+
+    data: Dict[str, Any]
+    element: str
+    id: str
+    payload: Dict[str, Any]
+    primary_attribute: str
+    secondary_attribute: str
+    tertiary_attribute: str
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        self._level = get_validation(validation)
+        self.data = data
+        extract_fields(self, "Element", data, ELEMENT_SCHEMA, self._level)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns element data with extracted fields written back"""
+        return inject_fields(self, self.data, ELEMENT_SCHEMA)
+
+    def drop_data(self) -> None:
+        """Releases raw element data once fields are extracted"""
+        self.data = None  # type: ignore[assignment]
+        self.payload = None  # type: ignore[assignment]
@@ -2,9 +2,11 @@
 PyQSF entry module
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from enum import Enum
 
+from pyqsf.core.schema import compile_schema, extract_fields, inject_fields
+from pyqsf.core.validation import ValidationLevel, get_validation
 from pyqsf.exceptions import FieldWrongType
 
 
@@ -31,34 +33,85 @@ class SurveyEntryField(Enum):
     SURVEY_STATUS               = "SurveyStatus"
 
 
+SURVEY_ENTRY_SCHEMA = compile_schema(
+    ("creator_id",                  SurveyEntryField.CREATOR_ID,                    str),
+    ("deleted",                     SurveyEntryField.DELETED,                       str,    False),
+    ("division_id",                 SurveyEntryField.DIVISION_ID,                   str,    False),
+    ("last_accessed",               SurveyEntryField.LAST_ACCESSED,                 str),
+    ("last_activated",              SurveyEntryField.LAST_ACTIVATED,                str),
+    ("last_modified",               SurveyEntryField.LAST_MODIFIED,                 str),
+    ("survey_active_response_set",  SurveyEntryField.SURVEY_ACTIVE_RESPONSE_SET,    str),
+    ("survey_brand_id",             SurveyEntryField.SURVEY_BRAND_ID,               str),
+    ("survey_creation_date",        SurveyEntryField.SURVEY_CREATION_DATE,          str),
+    ("survey_description",          SurveyEntryField.SURVEY_DESCRIPTION,            str,    False),
+    ("survey_expiration_date",      SurveyEntryField.SURVEY_EXPIRATION_DATE,        str),
+    ("survey_id",                   SurveyEntryField.SURVEY_ID,                     str),
+    ("survey_language",             SurveyEntryField.SURVEY_LANGUAGE,               str),
+    ("survey_name",                 SurveyEntryField.SURVEY_NAME,                   str),
+    ("survey_owner_id",             SurveyEntryField.SURVEY_OWNER_ID,               str),
+    ("survey_start_date",           SurveyEntryField.SURVEY_START_DATE,             str),
+    ("survey_status",               SurveyEntryField.SURVEY_STATUS,                 str),
+)
+
+
 # fmt: on
 class SurveyEntry:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """Implements Survey Entry"""
 
-    def __init__(self, data: Dict[str, Any]):
+    __slots__ = (
+        "_level",
+        "data",
+        "creator_id",
+        "deleted",
+        "division_id",
+        "last_accessed",
+        "last_activated",
+        "last_modified",
+        "survey_active_response_set",
+        "survey_brand_id",
+        "survey_creation_date",
+        "survey_description",
+        "survey_expiration_date",
+        "survey_id",
+        "survey_language",
+        "survey_name",
+        "survey_owner_id",
+        "survey_start_date",
+        "survey_status",
+    )
+
+    data: Dict[str, Any]
+    creator_id: str
+    deleted: str
+    division_id: str
+    last_accessed: str
+    last_activated: str
+    last_modified: str
+    survey_active_response_set: str
+    survey_brand_id: str
+    survey_creation_date: str
+    survey_description: str
+    survey_expiration_date: str
+    survey_id: str
+    survey_language: str
+    survey_name: str
+    survey_owner_id: str
+    survey_start_date: str
+    survey_status: str
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        self._level = get_validation(validation)
         self.data = data
-        # fmt: off
-        self.creator_id: str                    = self._get(SurveyEntryField.CREATOR_ID,                    str)
-        self.deleted: str                       = self._get(SurveyEntryField.DELETED,                       str, required=False)
-        self.division_id: str                   = self._get(SurveyEntryField.DIVISION_ID,                   str, required=False)
-        self.last_accessed: str                 = self._get(SurveyEntryField.LAST_ACCESSED,                 str)
-        self.last_activated: str                = self._get(SurveyEntryField.LAST_ACTIVATED,                str)
-        self.last_modified: str                 = self._get(SurveyEntryField.LAST_MODIFIED,                 str)
-        self.survey_active_response_set: str    = self._get(SurveyEntryField.SURVEY_ACTIVE_RESPONSE_SET,    str)
-        self.survey_brand_id: str               = self._get(SurveyEntryField.SURVEY_BRAND_ID,               str)
-        self.survey_creation_date: str          = self._get(SurveyEntryField.SURVEY_CREATION_DATE,          str)
-        self.survey_description: str            = self._get(SurveyEntryField.SURVEY_DESCRIPTION,            str, required=False)
-        self.survey_expiration_date: str        = self._get(SurveyEntryField.SURVEY_EXPIRATION_DATE,        str)
-        self.survey_id: str                     = self._get(SurveyEntryField.SURVEY_ID,                     str)
-        self.survey_language: str               = self._get(SurveyEntryField.SURVEY_LANGUAGE,               str)
-        self.survey_name: str                   = self._get(SurveyEntryField.SURVEY_NAME,                   str)
-        self.survey_owner_id: str               = self._get(SurveyEntryField.SURVEY_OWNER_ID,               str)
-        self.survey_start_date: str             = self._get(SurveyEntryField.SURVEY_START_DATE,             str)
-        self.survey_status: str                 = self._get(SurveyEntryField.SURVEY_STATUS,                 str)
-        # fmt: on
+        if not isinstance(data, dict):
+            raise FieldWrongType("Survey File", "SurveyEntry", dict, type(data))
+        extract_fields(self, "Survey Entry", data, SURVEY_ENTRY_SCHEMA, self._level)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns entry data with extracted fields written back"""
+        return inject_fields(self, self.data, SURVEY_ENTRY_SCHEMA)
 
-    def _get(self, field: SurveyEntryField, _type: Any, required=True):
-        value = self.data.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Survey Entry", field, _type, type(value))
-        return value
+    def drop_data(self) -> None:
+        """Releases raw entry data once fields are extracted"""
+        self.data = None  # type: ignore[assignment]
@@ -2,11 +2,23 @@
 PyQSF flow module
 """
 
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 from enum import Enum
 
-from pyqsf.core.element import Element
-from pyqsf.exceptions import FlowNotFound, FieldWrongType
+from pyqsf.core.element import Element, ElementField
+from pyqsf.core.schema import (
+    Schema,
+    compile_schema,
+    extract_fields,
+    inject_fields,
+)
+from pyqsf.core.validation import (
+    Reporter,
+    ValidationLevel,
+    get_validation,
+    report_error,
+)
+from pyqsf.exceptions import FieldWrongType, FlowNotFound
 
 
 # fmt: off
@@ -27,53 +39,367 @@ class FlowEntryField(Enum):
     TYPE    = "Type"
 
 
+class FlowNodeField(Enum):
+    """Fields of Flow Node Objects"""
+
+    BRANCH_LOGIC        = "BranchLogic"
+    DESCRIPTION         = "Description"
+    EMBEDDED_DATA       = "EmbeddedData"
+    EVEN_PRESENTATION   = "EvenPresentation"
+    FLOW                = "Flow"
+    FLOW_ID             = "FlowID"
+    OPTIONS             = "Options"
+    SUB_SET             = "SubSet"
+    TYPE                = "Type"
+
+
+class FlowNodeType(Enum):
+    """Flow Node Types"""
+
+    AUTHENTICATOR       = "Authenticator"
+    BLOCK               = "Block"
+    BLOCK_RANDOMIZER    = "BlockRandomizer"
+    BRANCH              = "Branch"
+    EMBEDDED_DATA       = "EmbeddedData"
+    END_SURVEY          = "EndSurvey"
+    GROUP               = "Group"
+    RANDOMIZER          = "Randomizer"
+    STANDARD            = "Standard"
+    WEB_SERVICE         = "WebService"
+
+
+FLOW_SCHEMA = compile_schema(
+    ("flow_id",             FlowField.FLOW_ID,                  str),
+    ("properties",          FlowField.PROPERTIES,               dict),
+    ("type",                FlowField.TYPE,                     str),
+)
+
+FLOW_ENTRIES_SCHEMA = compile_schema(
+    ("flow",                FlowField.FLOW,                     list),
+)
+
+FLOW_NODE_SCHEMA = compile_schema(
+    ("flow_id",             FlowNodeField.FLOW_ID,              str),
+    ("type",                FlowNodeField.TYPE,                 str),
+    ("flow",                FlowNodeField.FLOW,                 list,       False),
+)
+
+FLOW_ENTRY_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("id",                  FlowEntryField.ID,                  str),
+)
+
+BRANCH_NODE_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("branch_logic",        FlowNodeField.BRANCH_LOGIC,         dict,       False),
+)
+
+RANDOMIZER_NODE_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("sub_set",             FlowNodeField.SUB_SET,              (int, str), False),
+    ("even_presentation",   FlowNodeField.EVEN_PRESENTATION,    bool,       False),
+)
+
+GROUP_NODE_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("description",         FlowNodeField.DESCRIPTION,          str,        False),
+)
+
+EMBEDDED_DATA_NODE_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("embedded_data",       FlowNodeField.EMBEDDED_DATA,        list,       False),
+)
+
+END_SURVEY_NODE_SCHEMA = FLOW_NODE_SCHEMA + compile_schema(
+    ("options",             FlowNodeField.OPTIONS,              dict,       False),
+)
+
+
 # fmt: on
-class FlowEntry:  # pylint: disable=too-few-public-methods
-    """Implements Flow Entry"""
+class FlowNode:  # pylint: disable=too-few-public-methods
+    """Implements Flow Node, base of all survey flow elements"""
+
+    __slots__ = ("_level", "data", "flow_id", "type", "flow", "children")
+
+    schema: Schema = FLOW_NODE_SCHEMA
+
+    data: Dict[str, Any]
+    flow_id: str
+    type: str
+    flow: List[Dict[str, Any]]
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        self._level = get_validation(validation)
+        self.data = data
+        extract_fields(self, "Flow Entry", data, self.schema, self._level)
+        self.children: List["FlowNode"] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns node data with extracted fields and ``children`` written back"""
+        data = inject_fields(self, self.data, self.schema)
+        if self.children or isinstance(self.flow, list):
+            data[FlowNodeField.FLOW.value] = [
+                child.to_dict() for child in self.children
+            ]
+        return data
+
+    def drop_data(self) -> None:
+        """Releases raw node data once fields are extracted"""
+        self.data = None  # type: ignore[assignment]
+        self.flow = None  # type: ignore[assignment]
+
+
+class FlowEntry(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements Flow Entry, a reference to a survey block"""
+
+    __slots__ = ("id",)
+
+    schema = FLOW_ENTRY_SCHEMA
+
+    id: str
+
+
+class BranchNode(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements Branch Flow Node"""
+
+    __slots__ = ("branch_logic",)
+
+    schema = BRANCH_NODE_SCHEMA
+
+    branch_logic: Dict[str, Any]
+
+
+class RandomizerNode(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements Randomizer Flow Node"""
+
+    __slots__ = ("sub_set", "even_presentation")
+
+    schema = RANDOMIZER_NODE_SCHEMA
+
+    sub_set: Union[int, str]
+    even_presentation: bool
+
 
-    def __init__(self, data: dict[str, Any]):
-        # fmt: off
-        self.data: Dict[str, Any]   = data
-        self.flow_id: str           = self._get(FlowEntryField.FLOW_ID,    str)
-        self.id: str                = self._get(FlowEntryField.ID,         str)
-        self.type: str              = self._get(FlowEntryField.TYPE,       str)
-        # fmt: on
+class GroupNode(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements Group Flow Node"""
 
-    def _get(self, field: FlowEntryField, _type: Any, required=True):
-        value = self.data.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Flow Entry", field, _type, type(value))
-        return value
+    __slots__ = ("description",)
+
+    schema = GROUP_NODE_SCHEMA
+
+    description: str
+
+
+class EmbeddedDataNode(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements Embedded Data Flow Node"""
+
+    __slots__ = ("embedded_data",)
+
+    schema = EMBEDDED_DATA_NODE_SCHEMA
+
+    embedded_data: List[Dict[str, Any]]
+
+
+class EndSurveyNode(FlowNode):  # pylint: disable=too-few-public-methods
+    """Implements End Survey Flow Node"""
+
+    __slots__ = ("options",)
+
+    schema = END_SURVEY_NODE_SCHEMA
+
+    options: Dict[str, Any]
+
+
+FLOW_NODE_TYPES: Dict[str, Type[FlowNode]] = {
+    FlowNodeType.BLOCK.value: FlowEntry,
+    FlowNodeType.STANDARD.value: FlowEntry,
+    FlowNodeType.BRANCH.value: BranchNode,
+    FlowNodeType.BLOCK_RANDOMIZER.value: RandomizerNode,
+    FlowNodeType.RANDOMIZER.value: RandomizerNode,
+    FlowNodeType.GROUP.value: GroupNode,
+    FlowNodeType.EMBEDDED_DATA.value: EmbeddedDataNode,
+    FlowNodeType.END_SURVEY.value: EndSurveyNode,
+}
+
+FlowPath = Tuple[FlowNode, ...]
+
+
+class _End:  # pylint: disable=too-few-public-methods
+    """Marks the end of flow nodes while parsing"""
+
+
+_END = _End()
 
 
 class Flow(Element):  # pylint: disable=too-few-public-methods
-    """Implements Flow"""
+    """Implements Flow
 
-    def __init__(self, data: Dict[str, Any]):
-        super().__init__(data)
-        # fmt: off
-        self.flow_id: str               = self._get_att(FlowField.FLOW_ID,      str)
-        self.properties: dict           = self._get_att(FlowField.PROPERTIES,   dict)
-        self.type: str                  = self._get_att(FlowField.TYPE,         str)
-        # fmt: on
-        self._entries: List[FlowEntry] = self._parse_flow_entries()
+    Nested flow nodes are parsed into a tree of ``FlowNode`` objects. Block
+    references are indexed with the path of nodes leading to them. Change
+    the tree with ``insert_node``, ``move_node`` and ``remove_node`` so the
+    index and ``version`` are updated.
+
+    Without ``report`` an invalid flow or flow node raises, with it the error
+    is reported and the node skipped together with its nested nodes.
+    """
+
+    __slots__ = (
+        "flow_id",
+        "properties",
+        "type",
+        "flow",
+        "version",
+        "_block_ids",
+        "_paths",
+        "_entries",
+    )
+
+    flow_id: str
+    properties: dict
+    type: str
+    flow: List[Dict[str, Any]]
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        validation: Optional[ValidationLevel] = None,
+        report: Optional[Reporter] = None,
+    ):
+        super().__init__(data, validation)
+        if not isinstance(self.payload, dict):
+            raise FieldWrongType("Flow", ElementField.PAYLOAD, dict, type(self.payload))
+        extract_fields(self, "Flow", self.payload, FLOW_SCHEMA, self._level)
+        self.version = 0
+        self._block_ids: List[str] = []
+        self._paths: Dict[str, List[FlowPath]] = {}
+        self._entries: List[FlowNode] = self._parse_flow_entries(report)
+        self._index()
 
     def get_block_ids(self) -> List[str]:
-        """Returns Block IDs"""
-        return [x.id for x in self._entries]
+        """Returns Block IDs in flow order"""
+        return list(self._block_ids)
+
+    def get_nodes(self) -> Tuple[FlowNode, ...]:
+        """Returns top level flow nodes, nested nodes are their ``children``"""
+        return tuple(self._entries)
+
+    def get_paths(self, block_id: str) -> Tuple[FlowPath, ...]:
+        """Returns paths of flow nodes leading to each occurrence of a block"""
+        return tuple(self._paths.get(block_id, ()))
+
+    def get_branches(self, block_id: str) -> Tuple[BranchNode, ...]:
+        """Returns Branch nodes a block is nested in"""
+        branches: Dict[int, BranchNode] = {}
+        for path in self._paths.get(block_id, ()):
+            for node in path:
+                if isinstance(node, BranchNode):
+                    branches.setdefault(id(node), node)
+        return tuple(branches.values())
+
+    def insert_node(
+        self, index: int, node: FlowNode, parent: Optional[FlowNode] = None
+    ) -> None:
+        """Inserts a flow node at index of top level nodes or of parent children"""
+        nodes = self._entries if parent is None else parent.children
+        nodes.insert(index, node)
+        self._index()
+
+    def move_node(
+        self, node: FlowNode, index: int, parent: Optional[FlowNode] = None
+    ) -> None:
+        """Moves a flow node to index of top level nodes or of parent children"""
+        self._find_nodes(node).remove(node)
+        self.insert_node(index, node, parent)
 
-    def _parse_flow_entries(self) -> List[FlowEntry]:
-        flow = self._get_att(FlowField.FLOW, list)
-        if not isinstance(flow, list) or len(flow) == 0:
-            raise FlowNotFound()
+    def remove_node(self, node: FlowNode) -> None:
+        """Removes a flow node and its children from the flow"""
+        self._find_nodes(node).remove(node)
+        self._index()
 
-        entries = []
-        for entry in flow:
-            entries.append(FlowEntry(entry))
+    def iter_nodes(self) -> Iterator[FlowNode]:
+        """Yields all flow nodes in flow order, depth first"""
+        stack = list(reversed(self._entries))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def iter_blocks(self) -> Iterator[FlowEntry]:
+        """Yields block references in flow order"""
+        for node in self.iter_nodes():
+            if isinstance(node, FlowEntry):
+                yield node
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns flow data with extracted fields and flow nodes written back"""
+        data = super().to_dict()
+        payload = inject_fields(self, self.payload, FLOW_SCHEMA)
+        payload[FlowField.FLOW.value] = [node.to_dict() for node in self._entries]
+        data[ElementField.PAYLOAD.value] = payload
+        return data
+
+    def drop_data(self) -> None:
+        """Releases raw flow data once fields are extracted"""
+        super().drop_data()
+        self.flow = None  # type: ignore[assignment]
+        for node in self.iter_nodes():
+            node.drop_data()
+
+    def _parse_flow_entries(self, report: Optional[Reporter]) -> List[FlowNode]:
+        try:
+            extract_fields(self, "Flow", self.payload, FLOW_ENTRIES_SCHEMA, self._level)
+            if not isinstance(self.flow, list) or len(self.flow) == 0:
+                raise FlowNotFound()
+        except (FieldWrongType, FlowNotFound) as err:
+            report_error(report, err, self.data)
+            self.flow = []
+            return []
+
+        entries: List[FlowNode] = []
+        stack = [(iter(self.flow), entries)]
+        while stack:
+            raw_nodes, nodes = stack[-1]
+            data = next(raw_nodes, _END)
+            if isinstance(data, _End):
+                stack.pop()
+                continue
+            try:
+                if not isinstance(data, dict):
+                    raise FieldWrongType("Flow", FlowField.FLOW, dict, type(data))
+                node = get_flow_node_class(data)(data, self._level)
+            except FieldWrongType as err:
+                report_error(report, err, data)
+                continue
+            nodes.append(node)
+            if isinstance(node.flow, list):
+                stack.append((iter(node.flow), node.children))
         return entries
 
-    def _get_att(self, field: FlowField, _type: Any, required=True):
-        value = self.payload.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Flow", field, _type, type(value))
-        return value
+    def _index(self) -> None:
+        self.version += 1
+        self._block_ids = []
+        self._paths = {}
+        stack: List[Tuple[Iterator[FlowNode], FlowPath]] = [(iter(self._entries), ())]
+        while stack:
+            nodes, path = stack[-1]
+            node = next(nodes, None)
+            if node is None:
+                stack.pop()
+                continue
+            if isinstance(node, FlowEntry):
+                self._block_ids.append(node.id)
+                self._paths.setdefault(node.id, []).append(path)
+            if node.children:
+                stack.append((iter(node.children), path + (node,)))
+
+    def _find_nodes(self, node: FlowNode) -> List[FlowNode]:
+        for nodes in (self._entries, *(n.children for n in self.iter_nodes())):
+            if any(child is node for child in nodes):
+                return nodes
+        raise ValueError(f"Flow node `{node.flow_id}` not in flow.")
+
+
+def get_flow_node_class(data: Dict[str, Any]) -> Type[FlowNode]:
+    """Returns Flow Node class for node data, base FlowNode if type is unknown"""
+
+    _type = data.get(FlowNodeField.TYPE.value)
+    if not isinstance(_type, str):
+        return FlowNode
+    return FLOW_NODE_TYPES.get(_type, FlowNode)
@@ -0,0 +1,521 @@
+"""
+PyQSF logic module
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, cast
+
+from pyqsf.core.flow import (
+    BranchNode,
+    EndSurveyNode,
+    FlowEntry,
+    FlowNode,
+    RandomizerNode,
+)
+from pyqsf.core.diagnostics import Diagnostic
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.question import MatrixQuestion, MCQuestion, Question
+from pyqsf.core.responses import ColumnKind, ResponseColumn, ResponseReader
+from pyqsf.core.validation import Reporter, report_error
+from pyqsf.exceptions import LogicNotValid
+from pyqsf.exceptions.core import PyQSFBaseException
+
+Chunk = Dict[str, List[Any]]
+Predicate = Callable[[Chunk], List[bool]]
+ShownHook = Callable[[str, List[bool]], None]
+ColumnKey = Tuple[str, ColumnKind, Optional[str], Optional[str]]
+CompiledQuestion = Tuple[
+    str, Optional[Predicate], List[Tuple[Predicate, Optional[str]]]
+]
+Instruction = Tuple["FlowInstruction", Any]
+
+
+# fmt: off
+class FlowInstruction(Enum):
+    """Instructions of compiled survey flows"""
+
+    BLOCK           = "block"
+    BRANCH          = "branch"
+    CHILD           = "child"
+    END_SURVEY      = "end_survey"
+    POP             = "pop"
+    POP_RANDOMIZER  = "pop_randomizer"
+    RANDOMIZE       = "randomize"
+
+
+class LogicField(Enum):
+    """Fields of Logic Expressions"""
+
+    CONJUNCTION     = "Conjuction"
+    LEFT_OPERAND    = "LeftOperand"
+    LOGIC_TYPE      = "LogicType"
+    OPERATOR        = "Operator"
+    RIGHT_OPERAND   = "RightOperand"
+    TYPE            = "Type"
+
+
+class LogicType(Enum):
+    """Logic Expression Types"""
+
+    EMBEDDED_FIELD  = "EmbeddedField"
+    QUESTION        = "Question"
+
+
+class LogicOperator(Enum):
+    """Logic Expression Operators"""
+
+    CONTAINS                = "Contains"
+    DOES_NOT_CONTAIN        = "DoesNotContain"
+    EMPTY                   = "Empty"
+    EQUAL_TO                = "EqualTo"
+    GREATER_THAN            = "GreaterThan"
+    GREATER_THAN_OR_EQUAL   = "GreaterThanOrEqual"
+    LESS_THAN               = "LessThan"
+    LESS_THAN_OR_EQUAL      = "LessThanOrEqual"
+    NOT_EMPTY               = "NotEmpty"
+    NOT_EQUAL_TO            = "NotEqualTo"
+    NOT_SELECTED            = "NotSelected"
+    SELECTED                = "Selected"
+
+
+class SkipLogicField(Enum):
+    """Fields of Skip Logic Conditions"""
+
+    CHOICE_LOCATOR      = "ChoiceLocator"
+    CONDITION           = "Condition"
+    RIGHT_OPERAND       = "RightOperand"
+    SKIP_TO_DESTINATION = "SkipToDestination"
+
+
+class SkipDestination(Enum):
+    """Skip Logic Destinations, other destinations are Question IDs"""
+
+    END_OF_BLOCK    = "ENDOFBLOCK"
+    END_OF_SURVEY   = "ENDOFSURVEY"
+
+
+# fmt: on
+LOCATOR_PREFIX = "q://"
+SELECTABLE_CHOICE = "SelectableChoice"
+SELECTABLE_ANSWER = "SelectableAnswer"
+ENTRY_VALUES = frozenset(("ChoiceTextEntryValue", "ChoiceNumericEntryValue"))
+
+
+class LogicCompiler:
+    """Implements compiler of Qualtrics logic trees
+
+    ``DisplayLogic``, ``BranchLogic`` and skip logic conditions are compiled
+    once into predicates over chunks of decoded response columns, as yielded
+    by ``ResponseReader.read``. A predicate returns one boolean per row.
+    Expression groups follow boolean precedence, ``And`` binds tighter than
+    ``Or``. Locators and operators that cannot be evaluated from a response
+    export raise ``LogicNotValid`` at compile time. Names of the columns
+    and embedded fields compiled predicates read are collected in ``names``.
+    """
+
+    def __init__(self, reader: ResponseReader) -> None:
+        self.names: Set[str] = set()
+        self._columns: Dict[ColumnKey, ResponseColumn] = {}
+        for column in reader.columns.values():
+            if column.question is not None:
+                key = (
+                    column.question.question_id,
+                    column.kind,
+                    column.choice,
+                    column.answer,
+                )
+                self._columns.setdefault(key, column)
+
+    def compile(self, logic: Dict[str, Any]) -> Predicate:
+        """Returns predicate of a logic tree"""
+        if not isinstance(logic, dict):
+            raise LogicNotValid("Expected logic object.")
+        keys = sorted((k for k in logic if k.isdigit()), key=int)
+        if not keys:
+            if logic.get(LogicField.TYPE.value) == "Expression":
+                return self._compile_expression(logic)
+            raise LogicNotValid("No expressions.")
+
+        terms: List[List[Predicate]] = [[]]
+        for position, key in enumerate(keys):
+            child = logic[key]
+            if position and child.get(LogicField.CONJUNCTION.value) == "Or":
+                terms.append([])
+            terms[-1].append(self.compile(child))
+        return _any([_all(term) for term in terms])
+
+    def compile_skip(self, condition: Dict[str, Any]) -> Predicate:
+        """Returns predicate of a skip logic condition"""
+        return self._compile_expression(
+            {
+                LogicField.LOGIC_TYPE.value: LogicType.QUESTION.value,
+                LogicField.LEFT_OPERAND.value: condition.get(
+                    SkipLogicField.CHOICE_LOCATOR.value
+                ),
+                LogicField.OPERATOR.value: condition.get(
+                    SkipLogicField.CONDITION.value
+                ),
+                LogicField.RIGHT_OPERAND.value: condition.get(
+                    SkipLogicField.RIGHT_OPERAND.value
+                ),
+            }
+        )
+
+    def _compile_expression(self, expression: Dict[str, Any]) -> Predicate:
+        try:
+            _operator = LogicOperator(expression.get(LogicField.OPERATOR.value))
+        except ValueError as err:
+            raise LogicNotValid(
+                f"Operator `{expression.get(LogicField.OPERATOR.value)}` not supported."
+            ) from err
+        left = expression.get(LogicField.LEFT_OPERAND.value)
+        right = expression.get(LogicField.RIGHT_OPERAND.value)
+        logic_type = expression.get(LogicField.LOGIC_TYPE.value)
+
+        if logic_type == LogicType.EMBEDDED_FIELD.value and isinstance(left, str):
+            self.names.add(left)
+            return _compare(left, _operator, right)
+        if logic_type != LogicType.QUESTION.value or not isinstance(left, str):
+            raise LogicNotValid(f"Logic type `{logic_type}` not supported.")
+        if not left.startswith(LOCATOR_PREFIX):
+            raise LogicNotValid(f"Locator `{left}` not valid.")
+        question_id, kind, *ids = left[len(LOCATOR_PREFIX) :].split("/")
+
+        if kind in ENTRY_VALUES:
+            column = self._get_column(left, question_id, ColumnKind.TEXT, *ids[:1])
+            self.names.add(column.name)
+            return _compare(column.name, _operator, right)
+        if _operator not in (LogicOperator.SELECTED, LogicOperator.NOT_SELECTED):
+            raise LogicNotValid(f"Operator `{_operator.value}` not supported.")
+        if kind == SELECTABLE_CHOICE and len(ids) == 1:
+            predicate = self._compile_choice(left, question_id, ids[0])
+        elif kind == SELECTABLE_ANSWER and len(ids) == 2:
+            predicate = self._compile_answer(left, question_id, ids[0], ids[1])
+        else:
+            raise LogicNotValid(f"Locator `{left}` not supported.")
+        if _operator is LogicOperator.NOT_SELECTED:
+            return _not(predicate)
+        return predicate
+
+    def _compile_choice(self, locator: str, question_id: str, choice: str) -> Predicate:
+        column = self._columns.get((question_id, ColumnKind.SELECTED, choice, None))
+        if column is not None:
+            self.names.add(column.name)
+            return _selected(column.name)
+        column = self._get_column(locator, question_id, ColumnKind.CHOICE)
+        self.names.add(column.name)
+        table = cast(MCQuestion, column.question).choice_table
+        return _equal(column.name, table.get_label(choice))
+
+    def _compile_answer(
+        self, locator: str, question_id: str, choice: str, answer: str
+    ) -> Predicate:
+        column = self._columns.get((question_id, ColumnKind.SELECTED, choice, answer))
+        if column is not None:
+            self.names.add(column.name)
+            return _selected(column.name)
+        column = self._get_column(locator, question_id, ColumnKind.ANSWER, choice)
+        self.names.add(column.name)
+        table = cast(MatrixQuestion, column.question).answer_table
+        return _equal(column.name, table.get_label(answer))
+
+    def _get_column(
+        self,
+        locator: str,
+        question_id: str,
+        kind: ColumnKind,
+        choice: Optional[str] = None,
+    ) -> ResponseColumn:
+        column = self._columns.get((question_id, kind, choice, None))
+        if column is None:
+            raise LogicNotValid(f"Locator `{locator}` not found in response columns.")
+        return column
+
+
+class DisplayEvaluator:
+    """Implements evaluator of which questions respondents were shown
+
+    The survey flow is compiled once into ``program`` and walked in order. A
+    question is shown if its block is reached through the branches leading
+    to it, its display logic holds and no earlier skip logic jumped over it.
+    End of survey elements and skip logic to ``ENDOFSURVEY`` hide every later
+    block from respondents reaching them. Shown questions without an answer
+    were skipped by the respondent. Randomizers are not evaluated, blocks
+    under them count as reached.
+
+    Logic that cannot be compiled is collected in ``diagnostics`` and left
+    out: such questions are always shown, such branches are taken by every
+    respondent and such skip logic never jumps.
+    """
+
+    def __init__(self, qsf: QualtricsSurveyFile, reader: ResponseReader) -> None:
+        self.compiler = LogicCompiler(reader)
+        self.diagnostics: List[Diagnostic] = []
+        self._questions: Dict[str, List[CompiledQuestion]] = {}
+        for block in qsf.blocks:
+            self._questions[block.id] = [
+                _compile_question(self.compiler, question, self._report)
+                for question in qsf.get_block_questions(block.id)
+            ]
+        self.program = compile_flow(self.compiler, qsf.flow.get_nodes(), self._report)
+
+    def evaluate(self, chunk: Chunk) -> Dict[str, List[bool]]:
+        """Returns per Question ID whether each respondent of a chunk saw it"""
+        alive = [True] * _size(chunk)
+        masks = [alive]
+        shown: Dict[str, List[bool]] = {}
+        for instruction, argument in self.program:
+            if instruction is FlowInstruction.BLOCK:
+                reached = _and(masks[-1], alive)
+                alive = self.evaluate_block(argument, chunk, reached, alive, shown)
+            elif instruction is FlowInstruction.BRANCH:
+                masks.append(
+                    masks[-1] if argument is None else _and(masks[-1], argument(chunk))
+                )
+            elif instruction is FlowInstruction.CHILD:
+                masks.append(masks[-1])
+            elif instruction is FlowInstruction.POP:
+                masks.pop()
+            elif instruction is FlowInstruction.END_SURVEY:
+                alive = _and_not(alive, masks[-1])
+        return shown
+
+    def evaluate_block(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        block_id: str,
+        chunk: Chunk,
+        reached: List[bool],
+        alive: List[bool],
+        shown: Dict[str, List[bool]],
+        hook: Optional[ShownHook] = None,
+    ) -> List[bool]:
+        """Walks questions of a reached block into ``shown``
+
+        ``hook`` is called with each Question ID and its shown mask before
+        later questions are evaluated. Returns which respondents are still in
+        the survey after the block, skip logic to ``ENDOFSURVEY`` ends it early.
+        Blocks shown more than once in the flow merge their masks. Blocks
+        missing from the survey, skipped with ``tolerant``, show nothing.
+        """
+        return _walk_block(
+            chunk, self._questions.get(block_id, []), reached, alive, shown, hook
+        )
+
+    def _report(
+        self, error: PyQSFBaseException, data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.diagnostics.append(Diagnostic(error, data))
+
+
+def compile_flow(
+    compiler: LogicCompiler,
+    nodes: Sequence[FlowNode],
+    report: Optional[Reporter] = None,
+) -> List[Instruction]:
+    """Returns survey flow nodes compiled into a flat list of instructions
+
+    Branches and randomizer children push a respondent mask that ``POP``
+    removes, ``RANDOMIZE`` carries the child count and the number of
+    children each respondent is shown. Without ``report`` branch logic that
+    cannot be compiled raises, with it the error is reported and the branch
+    taken by every respondent.
+    """
+    program: List[Instruction] = []
+    _compile_nodes(compiler, nodes, program, report)
+    return program
+
+
+def _compile_nodes(
+    compiler: LogicCompiler,
+    nodes: Sequence[FlowNode],
+    program: List[Instruction],
+    report: Optional[Reporter],
+) -> None:
+    for node in nodes:
+        if isinstance(node, FlowEntry):
+            program.append((FlowInstruction.BLOCK, node.id))
+        elif isinstance(node, BranchNode):
+            predicate = None
+            if node.branch_logic:
+                try:
+                    predicate = compiler.compile(node.branch_logic)
+                except LogicNotValid as err:
+                    report_error(report, err, node.data)
+            program.append((FlowInstruction.BRANCH, predicate))
+            _compile_nodes(compiler, node.children, program, report)
+            program.append((FlowInstruction.POP, None))
+        elif isinstance(node, RandomizerNode):
+            count = len(node.children)
+            program.append((FlowInstruction.RANDOMIZE, (count, _get_subset(node))))
+            for index, child in enumerate(node.children):
+                program.append((FlowInstruction.CHILD, index))
+                _compile_nodes(compiler, (child,), program, report)
+                program.append((FlowInstruction.POP, None))
+            program.append((FlowInstruction.POP_RANDOMIZER, None))
+        elif isinstance(node, EndSurveyNode):
+            program.append((FlowInstruction.END_SURVEY, None))
+        else:
+            _compile_nodes(compiler, node.children, program, report)
+
+
+def _get_subset(node: RandomizerNode) -> int:
+    count = len(node.children)
+    try:
+        subset = int(node.sub_set)
+    except (TypeError, ValueError):
+        return count
+    return subset if subset > 0 else count
+
+
+def _walk_block(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    chunk: Chunk,
+    questions: List[CompiledQuestion],
+    reached: List[bool],
+    alive: List[bool],
+    shown: Dict[str, List[bool]],
+    hook: Optional[ShownHook] = None,
+) -> List[bool]:
+    jumps: Dict[str, List[bool]] = {}
+    for question_id, display, skips in questions:
+        if question_id in jumps:
+            reached = _or(reached, jumps.pop(question_id))
+        seen = reached if display is None else _and(reached, display(chunk))
+        if question_id in shown:
+            seen = _or(shown[question_id], seen)
+        shown[question_id] = seen
+        if hook is not None:
+            hook(question_id, seen)
+        for predicate, destination in skips:
+            skip = _and(seen, predicate(chunk))
+            reached = _and_not(reached, skip)
+            if destination == SkipDestination.END_OF_SURVEY.value:
+                alive = _and_not(alive, skip)
+            elif destination in jumps:
+                jumps[destination] = _or(jumps[destination], skip)
+            elif destination not in (None, SkipDestination.END_OF_BLOCK.value):
+                jumps[str(destination)] = skip
+    return alive
+
+
+def _compile_question(
+    compiler: LogicCompiler, question: Question, report: Optional[Reporter] = None
+) -> CompiledQuestion:
+    skips = []
+    for skip in question.skip_logic or ():
+        try:
+            predicate = compiler.compile_skip(skip)
+        except LogicNotValid as err:
+            report_error(report, err, question.data)
+            continue
+        skips.append((predicate, skip.get(SkipLogicField.SKIP_TO_DESTINATION.value)))
+    display = None
+    if question.display_logic:
+        try:
+            display = compiler.compile(question.display_logic)
+        except LogicNotValid as err:
+            report_error(report, err, question.data)
+    return question.question_id, display, skips
+
+
+def _size(chunk: Chunk) -> int:
+    for values in chunk.values():
+        return len(values)
+    return 0
+
+
+def _values(chunk: Chunk, name: str) -> List[Any]:
+    values = chunk.get(name)
+    if values is None:
+        return [None] * _size(chunk)
+    return values
+
+
+def _selected(name: str) -> Predicate:
+    return lambda chunk: list(map(bool, _values(chunk, name)))
+
+
+def _equal(name: str, label: Optional[str]) -> Predicate:
+    return lambda chunk: [v is not None and v == label for v in _values(chunk, name)]
+
+
+def _compare(name: str, _operator: LogicOperator, right: Any) -> Predicate:
+    test = _get_test(_operator, right)
+    return lambda chunk: list(map(test, _values(chunk, name)))
+
+
+def _get_test(  # pylint: disable=too-many-return-statements
+    _operator: LogicOperator, right: Any
+) -> Callable[[Any], bool]:
+    text = "" if right is None else str(right)
+    number = _to_float(right)
+    if _operator is LogicOperator.EMPTY:
+        return lambda v: not v
+    if _operator is LogicOperator.NOT_EMPTY:
+        return bool
+    if _operator is LogicOperator.EQUAL_TO:
+        return lambda v: v is not None and _equals(v, text, number)
+    if _operator is LogicOperator.NOT_EQUAL_TO:
+        return lambda v: v is None or not _equals(v, text, number)
+    if _operator is LogicOperator.CONTAINS:
+        return lambda v: v is not None and text in str(v)
+    if _operator is LogicOperator.DOES_NOT_CONTAIN:
+        return lambda v: v is None or text not in str(v)
+    if number is None:
+        raise LogicNotValid(f"Operand `{right}` is not a number.")
+    compare = {
+        LogicOperator.GREATER_THAN: float.__gt__,
+        LogicOperator.GREATER_THAN_OR_EQUAL: float.__ge__,
+        LogicOperator.LESS_THAN: float.__lt__,
+        LogicOperator.LESS_THAN_OR_EQUAL: float.__le__,
+    }.get(_operator)
+    if compare is None:
+        raise LogicNotValid(f"Operator `{_operator.value}` not supported.")
+    return lambda v: _compare_number(v, number, compare)
+
+
+def _equals(value: Any, text: str, number: Optional[float]) -> bool:
+    if str(value) == text:
+        return True
+    return number is not None and _to_float(value) == number
+
+
+def _compare_number(
+    value: Any, number: float, compare: Callable[[float, float], bool]
+) -> bool:
+    value = _to_float(value)
+    return value is not None and compare(value, number)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _not(predicate: Predicate) -> Predicate:
+    return lambda chunk: [not v for v in predicate(chunk)]
+
+
+def _all(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda chunk: list(map(all, zip(*(p(chunk) for p in predicates))))
+
+
+def _any(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda chunk: list(map(any, zip(*(p(chunk) for p in predicates))))
+
+
+def _and(left: List[bool], right: List[bool]) -> List[bool]:
+    return [a and b for a, b in zip(left, right)]
+
+
+def _or(left: List[bool], right: List[bool]) -> List[bool]:
+    return [a or b for a, b in zip(left, right)]
+
+
+def _and_not(left: List[bool], right: List[bool]) -> List[bool]:
+    return [a and not b for a, b in zip(left, right)]
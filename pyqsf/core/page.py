@@ -0,0 +1,31 @@
+"""
+PyQSF page module
+"""
+
+from typing import Iterator, Tuple
+
+from pyqsf.core.block import BlockEntry
+from pyqsf.core.question import Question
+
+
+class Page:  # pylint: disable=too-few-public-methods
+    """Implements Page, questions of a block shown together between page breaks
+
+    Every block starts a new page. ``index`` is the position of the page in
+    survey flow order, pages without questions are left out.
+    """
+
+    __slots__ = ("index", "block", "questions")
+
+    def __init__(
+        self, index: int, block: BlockEntry, questions: Tuple[Question, ...]
+    ) -> None:
+        self.index = index
+        self.block = block
+        self.questions = questions
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.questions)
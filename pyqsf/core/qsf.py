@@ -2,22 +2,62 @@
 PyQSF qsf module
 """
 
-import json
+import asyncio
+import codecs
+import io
+import mmap
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, cast
+from typing import (
+    IO,
+    Dict,
+    Any,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from enum import Enum
 
 from pyqsf.core.entry import SurveyEntry
 from pyqsf.core.flow import Flow
 from pyqsf.core.block import Block, BlockElementType, BlockEntry, PageBreak
-from pyqsf.core.question import Question, QuestionFactory
+from pyqsf.core.decoder import get_decoder, strip_bom
+from pyqsf.core.diagnostics import Diagnostic
+from pyqsf.core.element import Element, ElementField
+from pyqsf.core.page import Page
+from pyqsf.core.reader import iter_qsf
+from pyqsf.core.stats import LoadPhase, LoadStats, measure
+from pyqsf.core.validation import ValidationLevel, get_validation, ignore_error
+from pyqsf.core.question import Question, get_question_class, get_question_id
+from pyqsf.exceptions.core import PyQSFBaseException
+from pyqsf.core.table import QuestionTable
+from pyqsf.core.writer import write_document
 from pyqsf.exceptions import (
+    BlockEntryNotFound,
+    FieldNotValid,
+    FieldWrongType,
     FileNotFound,
+    QSFNotSerializable,
     QSFNotValid,
     ElementTypeNotFound,
     QuestionNotFound,
+    QuestionTypeNotFound,
 )
 
+ElementT = TypeVar("ElementT", Block, Flow)
+
+
+def _read_file(filepath: Path) -> bytes:
+    if not filepath.exists():
+        raise FileNotFound(str(filepath))
+    return filepath.read_bytes()
+
 
 # fmt: off
 class SurveyFileFields(Enum):
@@ -44,101 +84,602 @@ class SurveyElementType(Enum):
 
 
 # fmt: on
-class QualtricsSurveyFile:  # pylint: disable=too-many-instance-attributes
-    """Implements Qualtrics Survey File"""
+class QualtricsSurveyFile:  # pylint: disable=too-many-instance-attributes, too-many-public-methods
+    """Implements Qualtrics Survey File
 
-    def __init__(self, filepath: str) -> None:
-        self._json = self._load_file(Path(filepath))
-        self._validate_qsf()
-        self._blocks = cast(Block, None)
-        self._ct = None
-        self._flow = cast(Flow, None)
-        self._options = None
-        self._preview_link = None
-        self._project = None
-        self._question_count = None
-        self._response_set = None
-        self._scoring = None
-        self._statistics = None
-        self._questions: List[Question] = []
-        self._parse_elements()
-        self._structure = self._compose()
-
-        self.entry = SurveyEntry(self._json[SurveyFileFields.SURVEY_ENTRY.value])
+    With ``lazy=True`` only the JSON is loaded on construction. Survey
+    elements stay raw until first access and are memoised once built.
+
+    With ``stream=True`` the file is decoded incrementally and survey
+    elements are dispatched one at a time, so the file text is never held
+    in memory as a whole.
+
+    ``backend`` selects the JSON decoder used for non-streamed loads, see
+    ``pyqsf.core.decoder.get_decoder``.
+
+    ``validation`` sets the validation level of parsed elements, see
+    ``pyqsf.core.validation.ValidationLevel``. Defaults to the global level.
+
+    With ``keep_data=False`` raw element data is released from parsed
+    objects once their fields are extracted, fields that are not extracted
+    are not available afterwards.
+
+    With ``keep_source=True`` the JSON text of each survey element is kept
+    as read, so ``dumps`` copies elements that were not parsed into objects
+    instead of encoding them again. Files are then decoded incrementally, as
+    with ``stream=True``.
+
+    With ``stats=True`` (or a ``LoadStats`` instance, to set a hook or
+    aggregate many loads) wall time per load phase and element and question
+    counts are recorded in ``stats``.
+
+    With ``tolerant=True`` unknown survey elements and question types,
+    questions with invalid fields and references to missing blocks or
+    questions do not abort the load. Unknown elements are kept as generic
+    ``Element`` objects in ``unknown_elements``, questions fall back to a
+    generic, unvalidated ``Question`` and broken references are skipped.
+    Each error is collected in ``diagnostics``.
+
+    Alternative constructors accept the same keyword options.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        filepath: str,
+        lazy: bool = False,
+        stream: bool = False,
+        backend: Optional[str] = None,
+        keep_data: bool = True,
+        validation: Optional[Union[str, ValidationLevel]] = None,
+        keep_source: bool = False,
+        stats: Union[bool, LoadStats] = False,
+        tolerant: bool = False,
+    ) -> None:
+        self._setup(
+            lazy=lazy,
+            backend=backend,
+            keep_data=keep_data,
+            validation=validation,
+            keep_source=keep_source,
+            stats=stats,
+            tolerant=tolerant,
+        )
+        path = Path(filepath)
+        if stream:
+            if not path.exists():
+                raise FileNotFound(str(path))
+            with path.open(encoding="utf-8-sig") as file:
+                self._parse_stream(file)
+        else:
+            with measure(self._stats, LoadPhase.READ):
+                content = _read_file(path)
+            self._load(content)
+        self._complete()
+
+    @classmethod
+    def from_bytes(
+        cls, data: Union[bytes, bytearray], **options: Any
+    ) -> "QualtricsSurveyFile":
+        """Returns Qualtrics Survey File decoded from bytes"""
+        qsf = cls.__new__(cls)
+        qsf._setup(**options)
+        qsf._load(data)
+        qsf._complete()
+        return qsf
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **options: Any) -> "QualtricsSurveyFile":
+        """Returns Qualtrics Survey File from already decoded QSF data"""
+        qsf = cls.__new__(cls)
+        qsf._setup(**options)
+        qsf._json = data
+        qsf._validate_qsf()
+        qsf._complete()
+        return qsf
+
+    @classmethod
+    def from_fileobj(
+        cls, file: IO, stream: bool = False, **options: Any
+    ) -> "QualtricsSurveyFile":
+        """Returns Qualtrics Survey File read from a text or binary file object"""
+        qsf = cls.__new__(cls)
+        qsf._setup(**options)
+        if stream:
+            qsf._parse_stream(file)
+        else:
+            with measure(qsf._stats, LoadPhase.READ):
+                content = file.read()
+            qsf._load(content)
+        qsf._complete()
+        return qsf
+
+    @classmethod
+    def from_mmap(cls, filepath: str, **options: Any) -> "QualtricsSurveyFile":
+        """Returns Qualtrics Survey File streamed from a memory-mapped file"""
+        path = Path(filepath)
+        if not path.exists():
+            raise FileNotFound(str(path))
+        qsf = cls.__new__(cls)
+        qsf._setup(**options)
+        with path.open("rb") as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as err:
+                raise QSFNotValid("Cannot load JSON.") from err
+            with buffer:
+                qsf._parse_stream(buffer)
+        qsf._complete()
+        return qsf
+
+    @classmethod
+    async def aload(
+        cls, filepath: str, executor: Optional[Executor] = None, **options: Any
+    ) -> "QualtricsSurveyFile":
+        """Returns Qualtrics Survey File loaded without blocking the event loop
+
+        The file is read on the loop's default executor and parsed on
+        ``executor`` (the default executor if not given).
+        """
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(None, _read_file, Path(filepath))
+        return await loop.run_in_executor(
+            executor, partial(cls.from_bytes, content, **options)
+        )
+
+    def _setup(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        lazy: bool = False,
+        backend: Optional[str] = None,
+        keep_data: bool = True,
+        validation: Optional[Union[str, ValidationLevel]] = None,
+        keep_source: bool = False,
+        stats: Union[bool, LoadStats] = False,
+        tolerant: bool = False,
+    ) -> None:
+        self._json: Dict[str, Any] = {}
+        self._backend = backend
+        self._keep_data = keep_data
+        self._validation = get_validation(validation)
+        self._keep_source = keep_source
+        self._sources: Dict[int, str] = {}
+        self._stats: Optional[LoadStats] = (
+            stats if isinstance(stats, LoadStats) else LoadStats() if stats else None
+        )
+        self._tolerant = tolerant
+        self._diagnostics: List[Diagnostic] = []
+        self._unknown_elements: List[Element] = []
+        self._lazy = lazy
+        self._parsed = False
+        self._blocks_element: Optional[Dict[str, Any]] = None
+        self._blocks: Optional[Block] = None
+        self._ct: Optional[Dict[str, Any]] = None
+        self._flow_element: Optional[Dict[str, Any]] = None
+        self._flow: Optional[Flow] = None
+        self._options: Optional[Dict[str, Any]] = None
+        self._preview_link: Optional[Dict[str, Any]] = None
+        self._project: Optional[Dict[str, Any]] = None
+        self._question_count: Optional[Dict[str, Any]] = None
+        self._response_set: Optional[Dict[str, Any]] = None
+        self._scoring: Optional[Dict[str, Any]] = None
+        self._statistics: Optional[Dict[str, Any]] = None
+        self._question_elements: Dict[str, Dict[str, Any]] = {}
+        self._questions: Dict[str, Question] = {}
+        self._structure: Optional[Dict[BlockEntry, List[Any]]] = None
+        self._structure_version = 0
+        self._questions_cache: Optional[Tuple[Question, ...]] = None
+        self._blocks_cache: Optional[Tuple[BlockEntry, ...]] = None
+        self._table_cache: Optional[QuestionTable] = None
+        self._pages: Tuple[Page, ...] = ()
+        self._page_index: Dict[str, Page] = {}
+        self._entry: Optional[SurveyEntry] = None
+
+    def _complete(self) -> None:
+        if not self._lazy:
+            self._parse_elements()
+            for _id in list(self._question_elements):
+                self._build_question(_id)
+            self._get_structure()
+            self._get_entry()
+
+    @property
+    def entry(self) -> SurveyEntry:
+        """Returns Survey Entry"""
+        return self._get_entry()
 
     @property
-    def questions(self) -> List[Question]:
+    def questions(self) -> Tuple[Question, ...]:
         """Returns Survey Questions"""
-        result = []
-        for elements in self._structure.values():
-            for element in elements:
-                if isinstance(element, Question):
-                    result.append(element)
-        return result
+        self._get_structure()
+        if self._questions_cache is None:
+            self._questions_cache = tuple(self.iter_questions())
+        return self._questions_cache
 
     @property
-    def blocks(self) -> List[BlockEntry]:
+    def blocks(self) -> Tuple[BlockEntry, ...]:
         """Returns Survey Blocks"""
-        return list(self._structure)
+        structure = self._get_structure()
+        if self._blocks_cache is None:
+            self._blocks_cache = tuple(structure)
+        return self._blocks_cache
+
+    @property
+    def stats(self) -> Optional[LoadStats]:
+        """Returns Load Stats, None unless loaded with ``stats``"""
+        return self._stats
+
+    @property
+    def diagnostics(self) -> Tuple[Diagnostic, ...]:
+        """Returns errors collected while loading with ``tolerant``"""
+        return tuple(self._diagnostics)
+
+    @property
+    def unknown_elements(self) -> Tuple[Element, ...]:
+        """Returns survey elements of unknown type kept with ``tolerant``"""
+        return tuple(self._unknown_elements)
+
+    @property
+    def flow(self) -> Flow:
+        """Returns Survey Flow"""
+        return self._get_flow()
+
+    @property
+    def pages(self) -> Tuple[Page, ...]:
+        """Returns Survey Pages in flow order"""
+        self._get_structure()
+        return self._pages
 
-    def _load_file(self, filepath: Path) -> Dict[str, Any]:
-        if not filepath.exists():
-            raise FileNotFound(str(filepath))
+    def iter_questions(self) -> Iterator[Question]:
+        """Yields Survey Questions in flow order"""
+        for elements in self._get_structure().values():
+            for element in elements:
+                if isinstance(element, Question):
+                    yield element
+
+    def question_table(self) -> QuestionTable:
+        """Returns columnar view of Survey Questions, see ``QuestionTable``"""
+        structure = self._get_structure()
+        if self._table_cache is None:
+            questions = []
+            block_codes = []
+            for code, elements in enumerate(structure.values()):
+                for element in elements:
+                    if isinstance(element, Question):
+                        questions.append(element)
+                        block_codes.append(code)
+            self._table_cache = QuestionTable(
+                questions, block_codes, [block.id for block in structure]
+            )
+        return self._table_cache
+
+    def get_question(self, _id: str) -> Question:
+        """Returns Question by ID"""
+        return self._get_question_by_id(_id)
+
+    def page_of(self, question_id: str) -> Page:
+        """Returns Page a question is shown on"""
+        self._get_structure()
+        page = self._page_index.get(question_id)
+        if page is None:
+            raise QuestionNotFound(question_id)
+        return page
+
+    def get_block(self, _id: str) -> BlockEntry:
+        """Returns Block Entry by ID"""
+        return self._get_blocks().get_block_by_id(_id)
+
+    def get_block_questions(self, _id: str) -> Tuple[Question, ...]:
+        """Returns Questions of a Block Entry in block order"""
+        elements = self._get_structure().get(self.get_block(_id), ())
+        return tuple(e for e in elements if isinstance(e, Question))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns QSF data with changes to parsed objects written back
+
+        Survey entry, questions, blocks and flow are written from their
+        objects, other survey elements are returned as loaded. Requires
+        ``keep_data=True``.
+        """
+        document = self._get_document()
+        document[SurveyFileFields.SURVEY_ELEMENTS.value] = [
+            data for data, _ in self._iter_elements()
+        ]
+        return document
+
+    def dumps(self) -> str:
+        """Returns QSF JSON text, see ``to_dict``
+
+        Text is encoded the way Qualtrics exports it, unchanged elements keep
+        their original text.
+        """
+        file = io.StringIO()
+        self._write(file)
+        return file.getvalue()
+
+    def write(self, filepath: str) -> None:
+        """Writes QSF JSON text to a file, see ``dumps``"""
+        with Path(filepath).open("w", encoding="utf-8") as file:
+            self._write(file)
+
+    def _write(self, file: TextIO) -> None:
+        write_document(
+            file,
+            self._get_document(),
+            SurveyFileFields.SURVEY_ELEMENTS.value,
+            self._iter_elements(),
+        )
+
+    def _get_document(self) -> Dict[str, Any]:
+        if not self._keep_data:
+            raise QSFNotSerializable("Raw data released, load with keep_data=True.")
+        if SurveyFileFields.SURVEY_ELEMENTS.value not in self._json:
+            raise QSFNotSerializable(
+                "Survey elements not kept, load with keep_source=True to stream."
+            )
+        document = dict(self._json)
+        if self._entry is not None:
+            document[SurveyFileFields.SURVEY_ENTRY.value] = self._entry.to_dict()
+        return document
+
+    def _iter_elements(self) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
+        owners: Dict[int, Any] = {id(q.data): q for q in self._questions.values()}
+        for element in (self._blocks, self._flow):
+            if element is not None:
+                owners[id(element.data)] = element
+        for data in self._json.get(SurveyFileFields.SURVEY_ELEMENTS.value, ()):
+            owner = owners.get(id(data))
+            if owner is None:
+                yield data, self._sources.get(id(data))
+            else:
+                yield owner.to_dict(), None
+
+    def _load(self, content: Union[str, bytes, bytearray]) -> None:
+        content = strip_bom(content)
+        if self._keep_source:
+            if isinstance(content, str):
+                self._parse_stream(io.StringIO(content))
+            else:
+                self._parse_stream(io.BytesIO(content))
+            return
+        loads, errors = get_decoder(self._backend)
+        with measure(self._stats, LoadPhase.DECODE):
+            try:
+                self._json = loads(content)
+            except errors as err:
+                raise QSFNotValid("Cannot load JSON.") from err
+        if not isinstance(self._json, dict):
+            raise QSFNotValid("Cannot load JSON.")
+        self._validate_qsf()
+
+    def _parse_stream(self, file: Any) -> None:
+        if not isinstance(file, io.TextIOBase):
+            file = codecs.getreader("utf-8-sig")(file)
+        count = 0
+        elements_key = SurveyFileFields.SURVEY_ELEMENTS.value
+        elements: List[Dict[str, Any]] = []
         try:
-            return json.loads(filepath.read_text(encoding="UTF-8"))
-        except json.JSONDecodeError as err:
+            with measure(self._stats, LoadPhase.DECODE):
+                for key, value in iter_qsf(file, elements_key, text=self._keep_source):
+                    text = None
+                    if isinstance(value, tuple):
+                        value, text = value
+                    if key == elements_key and isinstance(value, dict):
+                        with measure(self._stats, LoadPhase.PARSE):
+                            self._parse_element(value)
+                        if text is not None and self._keep_data:
+                            self._json.setdefault(key, elements)
+                            elements.append(value)
+                            self._sources[id(value)] = text
+                        count += 1
+                    elif text is None:
+                        self._json[key] = value
+        except UnicodeDecodeError as err:
             raise QSFNotValid("Cannot load JSON.") from err
+        self._parsed = True
+        self._validate_entry()
+        if not count:
+            raise QSFNotValid("SurveyElements not present.")
 
     def _validate_qsf(self) -> None:
-        if not self._json.get(SurveyFileFields.SURVEY_ENTRY.value, False):
-            raise QSFNotValid("SurveyEntry not present.")
+        self._validate_entry()
         if not self._json.get(SurveyFileFields.SURVEY_ELEMENTS.value, False):
             raise QSFNotValid("SurveyElements not present.")
 
-    def _parse_elements(self) -> None:  # pylint: disable=too-many-branches
-        for element in self._json[SurveyFileFields.SURVEY_ELEMENTS.value]:
-            _type = element.get("Element")
-            if _type == SurveyElementType.QUESTION.value:
-                self._questions.append(Question(element))
-            elif _type == SurveyElementType.BLOCKS.value:
-                self._blocks = Block(element)
-            elif _type == SurveyElementType.FLOW.value:
-                self._flow = Flow(element)
-            elif _type == SurveyElementType.OPTIONS.value:
-                self._options = element
-            elif _type == SurveyElementType.PREVIEW_LINK.value:
-                self._preview_link = element
-            elif _type == SurveyElementType.PROJECT.value:
-                self._project = element
-            elif _type == SurveyElementType.QUESTION_COUNT.value:
-                self._question_count = element
-            elif _type == SurveyElementType.RESPONSE_SET.value:
-                self._response_set = element
-            elif _type == SurveyElementType.SCORING.value:
-                self._scoring = element
-            elif _type == SurveyElementType.STATISTICS.value:
-                self._statistics = element
-            elif _type == SurveyElementType.CT.value:
-                self._ct = element
-            else:
-                raise ElementTypeNotFound(_type)
+    def _validate_entry(self) -> None:
+        if not self._json.get(SurveyFileFields.SURVEY_ENTRY.value, False):
+            raise QSFNotValid("SurveyEntry not present.")
+
+    def _parse_elements(self) -> None:
+        if self._parsed:
+            return
+        self._parsed = True
+        with measure(self._stats, LoadPhase.PARSE):
+            for element in self._json[SurveyFileFields.SURVEY_ELEMENTS.value]:
+                self._parse_element(element)
+        if not self._keep_data:
+            del self._json[SurveyFileFields.SURVEY_ELEMENTS.value]
+
+    def _parse_element(  # pylint: disable=too-many-branches
+        self, element: Dict[str, Any]
+    ) -> None:
+        if not isinstance(element, dict):
+            field = SurveyFileFields.SURVEY_ELEMENTS
+            self._report(FieldWrongType("Survey File", field, dict, type(element)))
+            return
+        _type = element.get("Element")
+        if self._stats is not None:
+            self._stats.count_element(str(_type))
+        if _type == SurveyElementType.QUESTION.value:
+            _id = get_question_id(element)
+            if _id is None:
+                try:
+                    question = get_question_class(element)(element, self._validation)
+                except (FieldWrongType, FieldNotValid) as err:
+                    self._report(err, element)
+                    return
+                _id = question.question_id
+            self._question_elements.setdefault(_id, element)
+        elif _type == SurveyElementType.BLOCKS.value:
+            self._blocks_element = element
+        elif _type == SurveyElementType.FLOW.value:
+            self._flow_element = element
+        elif _type == SurveyElementType.OPTIONS.value:
+            self._options = element
+        elif _type == SurveyElementType.PREVIEW_LINK.value:
+            self._preview_link = element
+        elif _type == SurveyElementType.PROJECT.value:
+            self._project = element
+        elif _type == SurveyElementType.QUESTION_COUNT.value:
+            self._question_count = element
+        elif _type == SurveyElementType.RESPONSE_SET.value:
+            self._response_set = element
+        elif _type == SurveyElementType.SCORING.value:
+            self._scoring = element
+        elif _type == SurveyElementType.STATISTICS.value:
+            self._statistics = element
+        elif _type == SurveyElementType.CT.value:
+            self._ct = element
+        else:
+            self._report(ElementTypeNotFound(str(_type)), element)
+            self._unknown_elements.append(Element(element, ValidationLevel.OFF))
 
-    def _compose(self) -> Dict[BlockEntry, Any]:
-        result = {}
-        for block_id in self._flow.get_block_ids():
-            block = self._blocks.get_block_by_id(block_id)
-            elements = []
+    def _report(
+        self, error: PyQSFBaseException, data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if not self._tolerant:
+            raise error
+        self._diagnostics.append(Diagnostic(error, data))
+
+    def _get_entry(self) -> SurveyEntry:
+        if self._entry is None:
+            data = self._json[SurveyFileFields.SURVEY_ENTRY.value]
+            with measure(self._stats, LoadPhase.ENTRY):
+                try:
+                    self._entry = SurveyEntry(data, self._validation)
+                except (FieldWrongType, FieldNotValid) as err:
+                    data = data if isinstance(data, dict) else {}
+                    self._report(err, data)
+                    self._entry = SurveyEntry(data, ValidationLevel.OFF)
+            if not self._keep_data:
+                self._entry.drop_data()
+                del self._json[SurveyFileFields.SURVEY_ENTRY.value]
+        return self._entry
+
+    def _get_blocks(self) -> Block:
+        if self._blocks is None:
+            self._parse_elements()
+            with measure(self._stats, LoadPhase.BLOCKS):
+                self._blocks = self._build_element(
+                    Block, self._blocks_element, "Blocks"
+                )
+            if not self._keep_data:
+                self._blocks.drop_data()
+                self._blocks_element = None
+        return self._blocks
+
+    def _get_flow(self) -> Flow:
+        if self._flow is None:
+            self._parse_elements()
+            with measure(self._stats, LoadPhase.FLOW):
+                self._flow = self._build_element(Flow, self._flow_element, "Flow")
+            if not self._keep_data:
+                self._flow.drop_data()
+                self._flow_element = None
+        return self._flow
+
+    def _build_element(
+        self, cls: Type[ElementT], data: Optional[Dict[str, Any]], name: str
+    ) -> ElementT:
+        if data is None:
+            self._report(QSFNotValid(f"{name} not present."))
+        else:
+            try:
+                return cls(data, self._validation, self._report)
+            except (FieldWrongType, FieldNotValid) as err:
+                self._report(err, data)
+        # empty stand-in, the reason was reported above
+        return cls({ElementField.PAYLOAD.value: {}}, ValidationLevel.OFF, ignore_error)
+
+    def _get_structure(self) -> Dict[BlockEntry, List[Any]]:
+        if self._flow is not None and self._flow.version != self._structure_version:
+            self._structure = None
+        if self._structure is None:
+            with measure(self._stats, LoadPhase.COMPOSE):
+                self._structure = self._compose()
+            self._structure_version = self._get_flow().version
+            self._questions_cache = None
+            self._blocks_cache = None
+            self._table_cache = None
+        return self._structure
+
+    def _compose(self) -> Dict[BlockEntry, List[Any]]:
+        blocks = self._get_blocks()
+        result: Dict[BlockEntry, List[Any]] = {}
+        pages: List[Page] = []
+        for block_id in self._get_flow().get_block_ids():
+            try:
+                block = blocks.get_block_by_id(block_id)
+            except BlockEntryNotFound as err:
+                self._report(err)
+                continue
+            elements: List[Any] = []
+            questions: List[Question] = []
             for element in block.elements:
                 if element.type == BlockElementType.QUESTION.value:
-                    element = self._get_question_by_id(element.question_id)
+                    try:
+                        question = self._get_question_by_id(element.question_id)
+                    except QuestionNotFound as err:
+                        self._report(err, element.data)
+                        continue
+                    questions.append(question)
+                    elements.append(question)
                 elif element.type == BlockElementType.PAGE_BREAK.value:
-                    element = PageBreak()
-                elements.append(element)
+                    _add_page(pages, block, questions)
+                    questions = []
+                    elements.append(PageBreak())
+                else:
+                    elements.append(element)
+            _add_page(pages, block, questions)
             result[block] = elements
+        self._pages = tuple(pages)
+        self._page_index = {q.question_id: page for page in pages for q in page}
         return result
 
+    def _build_question(self, _id: str) -> Optional[Question]:
+        element = self._question_elements.get(_id)
+        if element is None:
+            return None
+        question_class = get_question_class(element)
+        with measure(self._stats, LoadPhase.QUESTIONS):
+            try:
+                question = question_class(element, self._validation)
+            except (FieldWrongType, FieldNotValid) as err:
+                self._report(err, element)
+                question = Question(element, ValidationLevel.OFF)
+        if question_class is Question and self._tolerant:
+            self._report(QuestionTypeNotFound(question.question_type), element)
+        if self._stats is not None:
+            self._stats.count_question(question.question_type)
+        if not self._keep_data:
+            question.drop_data()
+        self._questions[_id] = question
+        del self._question_elements[_id]
+        return question
+
     def _get_question_by_id(self, _id: str) -> Question:
-        for question in self._questions:
-            if question.question_id == _id:
-                return QuestionFactory(question.question_type, question.data)
-        raise QuestionNotFound(_id)
+        question = self._questions.get(_id)
+        if question is None:
+            self._parse_elements()
+            question = self._build_question(_id)
+        if question is None:
+            raise QuestionNotFound(_id)
+        if (
+            type(question) is Question  # pylint: disable=unidiomatic-typecheck
+            and not self._tolerant
+        ):
+            raise QuestionTypeNotFound(question.question_type)
+        return question
+
+
+def _add_page(pages: List[Page], block: BlockEntry, questions: List[Question]) -> None:
+    if questions:
+        pages.append(Page(len(pages), block, tuple(questions)))
@@ -2,21 +2,32 @@
 PyQSF question module
 """
 
-from typing import Dict, Any, Tuple
+from typing import ClassVar, Dict, Any, List, Optional, Type, Union
 from enum import Enum
 
-from pyqsf.core.element import Element
-from pyqsf.exceptions import FieldWrongType, QuestionTypeNotFound
+from pyqsf.core.choices import ChoiceTable
+from pyqsf.core.element import Element, ElementField
+from pyqsf.core.schema import Schema, compile_schema, extract_fields, inject_fields
+from pyqsf.core.validation import ValidationLevel
+from pyqsf.exceptions import FieldNotValid, FieldWrongType, QuestionTypeNotFound
 
 
 # fmt: off
 class QuestionType(Enum):
     """Question Types"""
 
-    MC = "MC"
-    DB = "DB"
-    TE = "TE"
-    MATRIX = "Matrix"
+    MC              = "MC"
+    DB              = "DB"
+    TE              = "TE"
+    MATRIX          = "Matrix"
+    SLIDER          = "Slider"
+    RANK_ORDER      = "RO"
+    SIDE_BY_SIDE    = "SBS"
+    CONSTANT_SUM    = "CS"
+    HEAT_MAP        = "HeatMap"
+    TIMING          = "Timing"
+    META            = "Meta"
+    FILE_UPLOAD     = "FileUpload"
 
 
 class QuestionField(Enum):
@@ -24,6 +35,7 @@ class QuestionField(Enum):
 
     CONFIGURATION           = "Configuration"
     DATA_EXPORT_TAG         = "DataExportTag"
+    DISPLAY_LOGIC           = "DisplayLogic"
     LANGUAGE                = "Language"
     NEXT_ANSWER_ID          = "NextAnswerId"
     NEXT_CHOICE_ID          = "NextChoiceId"
@@ -32,98 +44,585 @@ class QuestionField(Enum):
     QUESTION_TEXT           = "QuestionText"
     QUESTION_TYPE           = "QuestionType"
     SELECTOR                = "Selector"
+    SKIP_LOGIC              = "SkipLogic"
     VALIDATION              = "Validation"
 
 
+QUESTION_SCHEMA = compile_schema(
+    ("configuration",           QuestionField.CONFIGURATION,        dict),
+    ("data_export_tag",         QuestionField.DATA_EXPORT_TAG,      str),
+    ("display_logic",           QuestionField.DISPLAY_LOGIC,        dict,   False),
+    ("language",                QuestionField.LANGUAGE,             dict),
+    ("next_answer_id",          QuestionField.NEXT_ANSWER_ID,       int),
+    ("next_choice_id",          QuestionField.NEXT_CHOICE_ID,       int),
+    ("description",             QuestionField.QUESTION_DESCRIPTION, str),
+    ("question_id",             QuestionField.QUESTION_ID,          str),
+    ("question_description",    QuestionField.QUESTION_DESCRIPTION, str),
+    ("question_text",           QuestionField.QUESTION_TEXT,        str),
+    ("question_type",           QuestionField.QUESTION_TYPE,        str),
+    ("selector",                QuestionField.SELECTOR,             str),
+    ("skip_logic",              QuestionField.SKIP_LOGIC,           list,   False),
+    ("validation",              QuestionField.VALIDATION,           dict,   False),
+)
+
+
 # fmt: on
 class Question(
     Element
 ):  # pylint: disable=too-few-public-methods, too-many-instance-attributes
-    """Implements Base Question class"""
-
-    def __init__(self, data: Dict[str, Any]):
-        super().__init__(data)
-        # fmt: off
-        self.configuration: Dict[str, Any]  = self._get(QuestionField.CONFIGURATION,        dict)
-        self.data_export_tag: str           = self._get(QuestionField.DATA_EXPORT_TAG,      str)
-        self.language: Dict[str, Any]       = self._get(QuestionField.LANGUAGE,             dict)
-        self.next_answer_id: int            = self._get(QuestionField.NEXT_ANSWER_ID,       int)
-        self.next_choice_id: int            = self._get(QuestionField.NEXT_CHOICE_ID,       int)
-        self.description: str               = self._get(QuestionField.QUESTION_DESCRIPTION, str)
-        self.question_id: str               = self._get(QuestionField.QUESTION_ID,          str)
-        self.question_description: str      = self._get(QuestionField.QUESTION_DESCRIPTION, str)
-        self.question_text: str             = self._get(QuestionField.QUESTION_TEXT,        str)
-        self.question_type: str             = self._get(QuestionField.QUESTION_TYPE,        str)
-        self.selector: str                  = self._get(QuestionField.SELECTOR,             str)
-        self.validation: Dict[str, Any]     = self._get(QuestionField.VALIDATION,           dict,   required=False)
-        # fmt: on
-
-    def _get(self, field: QuestionField, _type: Any, required=True) -> Any:
-
-        value = self.payload.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("Question", field, _type, type(value))
-        return value
+    """Implements Base Question class
+
+    Subclasses set ``schema`` to the fields specific to their question type,
+    which are extracted once at load and written back by ``to_dict``, and
+    ``kind`` to the name used in their errors.
+    """
+
+    __slots__ = (
+        "configuration",
+        "data_export_tag",
+        "display_logic",
+        "language",
+        "next_answer_id",
+        "next_choice_id",
+        "description",
+        "question_id",
+        "question_description",
+        "question_text",
+        "question_type",
+        "selector",
+        "skip_logic",
+        "validation",
+    )
+
+    kind: ClassVar[str] = "Question"
+    schema: ClassVar[Schema] = ()
+
+    configuration: Dict[str, Any]
+    data_export_tag: str
+    display_logic: Dict[str, Any]
+    language: Dict[str, Any]
+    next_answer_id: int
+    next_choice_id: int
+    description: str
+    question_id: str
+    question_description: str
+    question_text: str
+    question_type: str
+    selector: str
+    skip_logic: List[Dict[str, Any]]
+    validation: Dict[str, Any]
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        super().__init__(data, validation)
+        if not isinstance(self.payload, dict):
+            raise FieldWrongType(
+                "Question", ElementField.PAYLOAD, dict, type(self.payload)
+            )
+        extract_fields(self, "Question", self.payload, QUESTION_SCHEMA, self._level)
+        if (
+            self._level is ValidationLevel.STRICT
+            and self.question_id != self.primary_attribute
+        ):
+            raise FieldNotValid(
+                "Question",
+                QuestionField.QUESTION_ID,
+                f"Expected to match PrimaryAttribute `{self.primary_attribute}`.",
+            )
+        if self.schema:
+            extract_fields(self, self.kind, self.payload, self.schema, self._level)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns question data with extracted fields written back"""
+        data = super().to_dict()
+        data[ElementField.PAYLOAD.value] = inject_fields(
+            self, self.payload, QUESTION_SCHEMA + self.schema
+        )
+        return data
 
 
 class MCQuestionField(Enum):
     """Fields of MC Question"""
 
     # fmt: off
-    CHOICES         = "Choices"
-    CHOICE_ORDER    = "ChoiceOrder"
-    DATA_VISIBILITY = "DataVisibility"
-    DEFAULT_CHOICES = "DefaultChoices"
-    GRADING_DATA    = "GradingData"
+    CHOICES                 = "Choices"
+    CHOICE_DATA_EXPORT_TAGS = "ChoiceDataExportTags"
+    CHOICE_ORDER            = "ChoiceOrder"
+    DATA_VISIBILITY         = "DataVisibility"
+    DEFAULT_CHOICES         = "DefaultChoices"
+    GRADING_DATA            = "GradingData"
+    RECODE_VALUES           = "RecodeValues"
     # fmt: on
 
 
-class MCQuestion(Question):  # pylint: disable=too-few-public-methods
-    """MC Question class"""
+# fmt: off
+MC_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 MCQuestionField.CHOICES,                    (dict, list)),
+    ("choice_data_export_tags", MCQuestionField.CHOICE_DATA_EXPORT_TAGS,    (dict, bool),   False),
+    ("choice_order",            MCQuestionField.CHOICE_ORDER,               list),
+    ("data_visibility",         MCQuestionField.DATA_VISIBILITY,            dict,           False),
+    ("default_choices",         MCQuestionField.DEFAULT_CHOICES,            bool,           False),
+    ("grading_data",            MCQuestionField.GRADING_DATA,               list,           False),
+    ("recode_values",           MCQuestionField.RECODE_VALUES,              dict,           False),
+)
+
 
-    def __init__(self, data):
-        super().__init__(data)
-        # fmt: off
-        self.choices: Tuple[dict, list] = self._get_mc(MCQuestionField.CHOICES,            (dict, list))
-        self.choice_order: list         = self._get_mc(MCQuestionField.CHOICE_ORDER,       list)
-        self.data_visibility: dict      = self._get_mc(MCQuestionField.DATA_VISIBILITY,    dict, required=False)
-        self.default_choices: bool      = self._get_mc(MCQuestionField.DEFAULT_CHOICES,    bool, required=False)
-        self.grading_data: list         = self._get_mc(MCQuestionField.GRADING_DATA,       list, required=False)
-        # fmt: on
+# fmt: on
+class MCQuestion(Question):  # pylint: disable=too-few-public-methods
+    """MC Question class
+
+    ``choice_table`` looks up choices in display order, it is built once on
+    first access.
+    """
+
+    __slots__ = (
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "data_visibility",
+        "default_choices",
+        "grading_data",
+        "recode_values",
+        "_choice_table",
+    )
+
+    kind = "MC Question"
+    schema = MC_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    data_visibility: dict
+    default_choices: bool
+    grading_data: list
+    recode_values: Dict[str, str]
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        super().__init__(data, validation)
+        self._choice_table: Optional[ChoiceTable] = None
+        if self._level is ValidationLevel.STRICT and isinstance(self.choices, dict):
+            missing = [c for c in self.choice_order if str(c) not in self.choices]
+            if missing:
+                raise FieldNotValid(
+                    "MC Question",
+                    MCQuestionField.CHOICE_ORDER,
+                    f"Choices `{missing}` not found.",
+                )
+
+    @property
+    def choice_table(self) -> ChoiceTable:
+        """Returns Choice Table of choices"""
+        if self._choice_table is None:
+            self._choice_table = ChoiceTable(
+                self.choices,
+                self.choice_order,
+                self.recode_values,
+                self.choice_data_export_tags,
+            )
+        return self._choice_table
 
-    def _get_mc(self, field: MCQuestionField, _type: Any, required=True) -> Any:
 
-        value = self.payload.get(field.value)
-        if required and not isinstance(value, _type):
-            raise FieldWrongType("MC Question", field, _type, type(value))
-        return value
+# fmt: off
+class QuestionTypeField(Enum):
+    """Type specific fields of Questions"""
+
+    ADDITIONAL_QUESTIONS    = "AdditionalQuestions"
+    CHOICES                 = "Choices"
+    CHOICE_DATA_EXPORT_TAGS = "ChoiceDataExportTags"
+    CHOICE_ORDER            = "ChoiceOrder"
+    DATA_VISIBILITY         = "DataVisibility"
+    DEFAULT_CHOICES         = "DefaultChoices"
+    GRAPHICS                = "Graphics"
+    GRAPHICS_DESCRIPTION    = "GraphicsDescription"
+    LABELS                  = "Labels"
+    NUMBER_OF_QUESTIONS     = "NumberOfQuestions"
+    RECODE_VALUES           = "RecodeValues"
+    SEARCH_SOURCE           = "SearchSource"
+    SUB_SELECTOR            = "SubSelector"
+
+
+TE_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+    ("default_choices",         QuestionTypeField.DEFAULT_CHOICES,          (dict, bool),   False),
+    ("search_source",           QuestionTypeField.SEARCH_SOURCE,            dict,           False),
+)
+
+DB_QUESTION_SCHEMA = compile_schema(
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+    ("graphics",                QuestionTypeField.GRAPHICS,                 str,            False),
+    ("graphics_description",    QuestionTypeField.GRAPHICS_DESCRIPTION,     str,            False),
+)
+
+SLIDER_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list)),
+    ("choice_data_export_tags", QuestionTypeField.CHOICE_DATA_EXPORT_TAGS,  (dict, bool),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("default_choices",         QuestionTypeField.DEFAULT_CHOICES,          (dict, bool),   False),
+    ("labels",                  QuestionTypeField.LABELS,                   (dict, list),   False),
+)
+
+RANK_ORDER_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list)),
+    ("choice_data_export_tags", QuestionTypeField.CHOICE_DATA_EXPORT_TAGS,  (dict, bool),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("recode_values",           QuestionTypeField.RECODE_VALUES,            dict,           False),
+)
+
+SIDE_BY_SIDE_QUESTION_SCHEMA = compile_schema(
+    ("additional_questions",    QuestionTypeField.ADDITIONAL_QUESTIONS,     dict,           False),
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list)),
+    ("choice_data_export_tags", QuestionTypeField.CHOICE_DATA_EXPORT_TAGS,  (dict, bool),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("number_of_questions",     QuestionTypeField.NUMBER_OF_QUESTIONS,      int,            False),
+)
+
+CONSTANT_SUM_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list)),
+    ("choice_data_export_tags", QuestionTypeField.CHOICE_DATA_EXPORT_TAGS,  (dict, bool),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("sub_selector",            QuestionTypeField.SUB_SELECTOR,             str,            False),
+)
+
+HEAT_MAP_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+)
+
+TIMING_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list),   False),
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+    ("default_choices",         QuestionTypeField.DEFAULT_CHOICES,          (dict, bool),   False),
+)
+
+META_QUESTION_SCHEMA = compile_schema(
+    ("choices",                 QuestionTypeField.CHOICES,                  (dict, list),   False),
+    ("choice_order",            QuestionTypeField.CHOICE_ORDER,             list,           False),
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+)
+
+FILE_UPLOAD_QUESTION_SCHEMA = compile_schema(
+    ("data_visibility",         QuestionTypeField.DATA_VISIBILITY,          dict,           False),
+    ("default_choices",         QuestionTypeField.DEFAULT_CHOICES,          (dict, bool),   False),
+)
 
 
+# fmt: on
 class TEQuestion(Question):  # pylint: disable=too-few-public-methods
     """TE Question class"""
 
+    __slots__ = (
+        "choices",
+        "choice_order",
+        "data_visibility",
+        "default_choices",
+        "search_source",
+    )
+
+    kind = "TE Question"
+    schema = TE_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_order: list
+    data_visibility: dict
+    default_choices: Union[dict, bool]
+    search_source: Dict[str, Any]
+
 
 class DBQuestion(Question):  # pylint: disable=too-few-public-methods
     """DB Question class"""
 
+    __slots__ = (
+        "choice_order",
+        "data_visibility",
+        "graphics",
+        "graphics_description",
+    )
+
+    kind = "DB Question"
+    schema = DB_QUESTION_SCHEMA
+
+    choice_order: list
+    data_visibility: dict
+    graphics: str
+    graphics_description: str
+
+
+# fmt: off
+class MatrixQuestionField(Enum):
+    """Fields of Matrix Question"""
+
+    ANSWERS                 = "Answers"
+    ANSWER_ORDER            = "AnswerOrder"
+    CHOICES                 = "Choices"
+    CHOICE_DATA_EXPORT_TAGS = "ChoiceDataExportTags"
+    CHOICE_ORDER            = "ChoiceOrder"
+    SUB_SELECTOR            = "SubSelector"
+
 
+MATRIX_QUESTION_SCHEMA = compile_schema(
+    ("answers",                 MatrixQuestionField.ANSWERS,                    (dict, list)),
+    ("answer_order",            MatrixQuestionField.ANSWER_ORDER,               list,           False),
+    ("choices",                 MatrixQuestionField.CHOICES,                    (dict, list)),
+    ("choice_data_export_tags", MatrixQuestionField.CHOICE_DATA_EXPORT_TAGS,    (dict, bool),   False),
+    ("choice_order",            MatrixQuestionField.CHOICE_ORDER,               list,           False),
+    ("sub_selector",            MatrixQuestionField.SUB_SELECTOR,               str,            False),
+)
+
+
+# fmt: on
 class MatrixQuestion(Question):  # pylint: disable=too-few-public-methods
-    """Matrix Question class"""
+    """Matrix Question class
+
+    ``choice_table`` looks up statements and ``answer_table`` scale points in
+    display order, they are built once on first access.
+    """
+
+    __slots__ = (
+        "answers",
+        "answer_order",
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "sub_selector",
+        "_choice_table",
+        "_answer_table",
+    )
+
+    kind = "Matrix Question"
+    schema = MATRIX_QUESTION_SCHEMA
+
+    answers: Union[dict, list]
+    answer_order: list
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    sub_selector: str
+
+    def __init__(
+        self, data: Dict[str, Any], validation: Optional[ValidationLevel] = None
+    ):
+        super().__init__(data, validation)
+        self._choice_table: Optional[ChoiceTable] = None
+        self._answer_table: Optional[ChoiceTable] = None
+
+    @property
+    def choice_table(self) -> ChoiceTable:
+        """Returns Choice Table of statements"""
+        if self._choice_table is None:
+            self._choice_table = ChoiceTable(
+                self.choices,
+                self.choice_order,
+                export_tags=self.choice_data_export_tags,
+            )
+        return self._choice_table
+
+    @property
+    def answer_table(self) -> ChoiceTable:
+        """Returns Choice Table of answers"""
+        if self._answer_table is None:
+            self._answer_table = ChoiceTable(self.answers, self.answer_order)
+        return self._answer_table
+
+
+class SliderQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Slider Question class"""
+
+    __slots__ = (
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "default_choices",
+        "labels",
+    )
+
+    kind = "Slider Question"
+    schema = SLIDER_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    default_choices: Union[dict, bool]
+    labels: Union[dict, list]
+
+
+class RankOrderQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Rank Order Question class"""
+
+    __slots__ = (
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "recode_values",
+    )
+
+    kind = "Rank Order Question"
+    schema = RANK_ORDER_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    recode_values: Dict[str, str]
+
+
+class SideBySideQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Side by Side Question class"""
+
+    __slots__ = (
+        "additional_questions",
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "number_of_questions",
+    )
+
+    kind = "Side by Side Question"
+    schema = SIDE_BY_SIDE_QUESTION_SCHEMA
+
+    additional_questions: Dict[str, Any]
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    number_of_questions: int
+
+
+class ConstantSumQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Constant Sum Question class"""
+
+    __slots__ = (
+        "choices",
+        "choice_data_export_tags",
+        "choice_order",
+        "sub_selector",
+    )
+
+    kind = "Constant Sum Question"
+    schema = CONSTANT_SUM_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_data_export_tags: Union[Dict[str, str], bool]
+    choice_order: list
+    sub_selector: str
+
+
+class HeatMapQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Heat Map Question class"""
+
+    __slots__ = ("choices", "choice_order", "data_visibility")
+
+    kind = "Heat Map Question"
+    schema = HEAT_MAP_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_order: list
+    data_visibility: dict
+
+
+class TimingQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Timing Question class"""
+
+    __slots__ = ("choices", "data_visibility", "default_choices")
+
+    kind = "Timing Question"
+    schema = TIMING_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    data_visibility: dict
+    default_choices: Union[dict, bool]
+
+
+class MetaQuestion(Question):  # pylint: disable=too-few-public-methods
+    """Meta Info Question class"""
+
+    __slots__ = ("choices", "choice_order", "data_visibility")
+
+    kind = "Meta Info Question"
+    schema = META_QUESTION_SCHEMA
+
+    choices: Union[dict, list]
+    choice_order: list
+    data_visibility: dict
+
+
+class FileUploadQuestion(Question):  # pylint: disable=too-few-public-methods
+    """File Upload Question class"""
+
+    __slots__ = ("data_visibility", "default_choices")
+
+    kind = "File Upload Question"
+    schema = FILE_UPLOAD_QUESTION_SCHEMA
+
+    data_visibility: dict
+    default_choices: Union[dict, bool]
+
+
+QUESTION_TYPES: Dict[str, Type[Question]] = {
+    QuestionType.MC.value: MCQuestion,
+    QuestionType.TE.value: TEQuestion,
+    QuestionType.DB.value: DBQuestion,
+    QuestionType.MATRIX.value: MatrixQuestion,
+    QuestionType.SLIDER.value: SliderQuestion,
+    QuestionType.RANK_ORDER.value: RankOrderQuestion,
+    QuestionType.SIDE_BY_SIDE.value: SideBySideQuestion,
+    QuestionType.CONSTANT_SUM.value: ConstantSumQuestion,
+    QuestionType.HEAT_MAP.value: HeatMapQuestion,
+    QuestionType.TIMING.value: TimingQuestion,
+    QuestionType.META.value: MetaQuestion,
+    QuestionType.FILE_UPLOAD.value: FileUploadQuestion,
+}
+
+
+def register_question_type(question_type: str, question_class: Type[Question]) -> None:
+    """Registers Question class built for a question type, replacing any other
+
+    Registrations are process wide, ``load_many`` workers only see them when
+    made at import time of a module the workers import too.
+    """
+
+    if not (isinstance(question_class, type) and issubclass(question_class, Question)):
+        raise TypeError(f"Expected Question subclass, got `{question_class!r}`.")
+    QUESTION_TYPES[question_type] = question_class
 
 
 def QuestionFactory(  # pylint: disable=invalid-name
-    question_type: str, data: Dict[str, Any]
+    question_type: str,
+    data: Dict[str, Any],
+    validation: Optional[ValidationLevel] = None,
 ) -> Question:
     """Question Factory Function"""
 
-    types = {
-        QuestionType.MC.value: MCQuestion,
-        QuestionType.TE.value: TEQuestion,
-        QuestionType.DB.value: DBQuestion,
-        QuestionType.MATRIX.value: MatrixQuestion,
-    }
-
-    if question_type not in types:
+    if question_type not in QUESTION_TYPES:
         raise QuestionTypeNotFound(question_type)
 
-    return types[question_type](data)
+    return QUESTION_TYPES[question_type](data, validation)
+
+
+def _get_payload_str(data: Dict[str, Any], field: QuestionField) -> Optional[str]:
+    payload = data.get(ElementField.PAYLOAD.value)
+    if not isinstance(payload, dict):
+        return None
+    value = payload.get(field.value)
+    if not isinstance(value, str):
+        return None
+    return value
+
+
+def get_question_class(data: Dict[str, Any]) -> Type[Question]:
+    """Returns Question class for element data, base Question if type is unknown"""
+
+    question_type = _get_payload_str(data, QuestionField.QUESTION_TYPE)
+    if question_type is None:
+        return Question
+    return QUESTION_TYPES.get(question_type, Question)
+
+
+def get_question_id(data: Dict[str, Any]) -> Optional[str]:
+    """Returns Question ID from element data without building the question"""
+
+    return _get_payload_str(data, QuestionField.QUESTION_ID)
@@ -0,0 +1,123 @@
+"""
+PyQSF reader module
+"""
+
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+from pyqsf.exceptions import QSFNotValid
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """Implements a growing read buffer over a text stream"""
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Returns next non-whitespace character, empty string at the end"""
+        while True:
+            while self._pos < len(self._text) and self._text[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consumes expected character"""
+        if self.peek() != char:
+            raise QSFNotValid("Cannot load JSON.")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """Decodes next JSON value, reading more text until it is complete"""
+        return self._decode()[0]
+
+    def decode_text(self) -> Tuple[Any, str]:
+        """Decodes next JSON value, also returning its JSON text as read"""
+        value, start = self._decode()
+        return value, self._text[start : self._pos]
+
+    def _decode(self) -> Tuple[Any, int]:
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError as err:
+                if not self._fill(size):
+                    raise QSFNotValid("Cannot load JSON.") from err
+                size *= 2
+                continue
+            # A number ending the buffer may continue in the next chunk
+            if end == len(self._text) and self._fill(size):
+                continue
+            start, self._pos = self._pos, end
+            return value, start
+
+    def _fill(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._text = self._text[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+
+def iter_qsf(
+    file: TextIO,
+    expand: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    text: bool = False,
+) -> Iterator[Tuple[str, Any]]:
+    """Yields top level (key, value) pairs of a QSF document
+
+    Items of the ``expand`` array are decoded and yielded one at a time as
+    (expand, item), so the whole document text is never held in memory.
+    With ``text=True`` items are yielded as (expand, (item, item_text)),
+    ``item_text`` being the JSON text the item was decoded from.
+    """
+
+    buffer = _Buffer(file, chunk_size)
+    buffer.expect("{")
+    if buffer.peek() != "}":
+        while True:
+            key = buffer.decode()
+            if not isinstance(key, str):
+                raise QSFNotValid("Cannot load JSON.")
+            buffer.expect(":")
+            if key == expand and buffer.peek() == "[":
+                yield from _iter_array(buffer, key, text)
+            else:
+                yield key, buffer.decode()
+            if buffer.peek() != ",":
+                break
+            buffer.expect(",")
+    buffer.expect("}")
+    if buffer.peek():
+        raise QSFNotValid("Cannot load JSON.")
+
+
+def _iter_array(buffer: _Buffer, key: str, text: bool) -> Iterator[Tuple[str, Any]]:
+    decode = buffer.decode_text if text else buffer.decode
+    buffer.expect("[")
+    if buffer.peek() != "]":
+        while True:
+            yield key, decode()
+            if buffer.peek() != ",":
+                break
+            buffer.expect(",")
+    buffer.expect("]")
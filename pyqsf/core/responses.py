@@ -0,0 +1,195 @@
+"""
+PyQSF responses module
+"""
+
+import csv
+from enum import Enum
+from itertools import chain, islice, repeat, zip_longest
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.question import MatrixQuestion, MCQuestion, Question, TEQuestion
+from pyqsf.exceptions import FileNotFound
+
+MULTIPLE_ANSWER_SELECTORS = frozenset(("MAVR", "MAHR", "MACOL", "MSB"))
+MULTIPLE_ANSWER_SUB_SELECTORS = frozenset(("MultipleAnswer",))
+
+
+# fmt: off
+class ColumnKind(Enum):
+    """Kinds of Response Columns"""
+
+    CHOICE      = "choice"
+    SELECTED    = "selected"
+    ANSWER      = "answer"
+    TEXT        = "text"
+    METADATA    = "metadata"
+
+
+# fmt: on
+class ResponseColumn:  # pylint: disable=too-few-public-methods
+    """Implements Response Column, a response export column mapped to a question"""
+
+    __slots__ = ("name", "kind", "question", "choice", "answer", "labels")
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        name: str,
+        kind: ColumnKind,
+        question: Optional[Question] = None,
+        choice: Optional[str] = None,
+        answer: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.question = question
+        self.choice = choice
+        self.answer = answer
+        self.labels = labels
+
+
+class ResponseReader:
+    """Implements reader of Qualtrics CSV/TSV response exports
+
+    Export columns are indexed once against the survey questions by data
+    export tag, e.g. ``Q5`` (single choice), ``Q3_2`` (multiple answer choice
+    or Matrix statement), ``Q3_2_1`` (Matrix multiple answer), ``Q5_4_TEXT``
+    (choice text entry). Columns that do not belong to a question are kept
+    as ``metadata``.
+
+    Exports are read in chunks of rows, each yielded as a dict of decoded
+    columns. Choice and answer codes are mapped to labels with one lookup
+    table per column, cells already holding labels are kept and unknown codes
+    decode to None. Codes win over labels that look like codes, e.g. on 0-10
+    scales with choice IDs 1-11. Multiple answer cells are decoded to booleans, empty text
+    cells to None.
+    """
+
+    def __init__(self, qsf: QualtricsSurveyFile) -> None:
+        self.columns: Dict[str, ResponseColumn] = {}
+        for question in qsf.questions:
+            self._index_question(question)
+
+    def get_column(self, name: str) -> ResponseColumn:
+        """Returns Response Column by export column name"""
+        column = self.columns.get(name)
+        if column is None:
+            return ResponseColumn(name, ColumnKind.METADATA)
+        return column
+
+    def read(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        source: Union[str, IO[str]],
+        chunk_size: int = 10000,
+        delimiter: Optional[str] = None,
+        skip_rows: int = 2,
+        encoding: str = "utf-8-sig",
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """Yields chunks of decoded response columns
+
+        ``source`` is a path or a text file object. ``delimiter`` defaults to
+        tab for ``.tsv`` paths and comma otherwise. ``skip_rows`` header rows
+        following column names are skipped, Qualtrics exports carry question
+        text and import ID rows.
+        """
+
+        if isinstance(source, str):
+            path = Path(source)
+            if not path.exists():
+                raise FileNotFound(str(path))
+            if delimiter is None:
+                delimiter = "\t" if path.suffix.lower() == ".tsv" else ","
+            with path.open(encoding=encoding, newline="") as file:
+                yield from self._read_rows(file, chunk_size, delimiter, skip_rows)
+        else:
+            yield from self._read_rows(source, chunk_size, delimiter or ",", skip_rows)
+
+    def _read_rows(
+        self, file: IO[str], chunk_size: int, delimiter: str, skip_rows: int
+    ) -> Iterator[Dict[str, List[Any]]]:
+        rows = csv.reader(file, delimiter=delimiter)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [self.get_column(name) for name in header]
+        for _ in islice(rows, skip_rows):
+            pass
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            values = chain(
+                zip_longest(*chunk, fillvalue=""), repeat(("",) * len(chunk))
+            )
+            yield {
+                column.name: _decode(column, cells)
+                for column, cells in zip(columns, values)
+            }
+
+    def _index_question(self, question: Question) -> None:
+        tag = question.data_export_tag
+        if not isinstance(tag, str):
+            return
+        if isinstance(question, MCQuestion):
+            self._index_mc(tag, question)
+        elif isinstance(question, MatrixQuestion):
+            self._index_matrix(tag, question)
+        elif isinstance(question, TEQuestion):
+            self._add(tag, ColumnKind.TEXT, question)
+
+    def _index_mc(self, tag: str, question: MCQuestion) -> None:
+        table = question.choice_table
+        if question.selector in MULTIPLE_ANSWER_SELECTORS:
+            for choice in table:
+                name = table.get_export_tag(choice) or f"{tag}_{choice}"
+                self._add(name, ColumnKind.SELECTED, question, choice=choice)
+        else:
+            self._add(tag, ColumnKind.CHOICE, question, labels=table.recode_labels)
+        for choice in table.text_entries:
+            self._add(f"{tag}_{choice}_TEXT", ColumnKind.TEXT, question, choice=choice)
+
+    def _index_matrix(self, tag: str, question: MatrixQuestion) -> None:
+        answers = question.answer_table.labels
+        table = question.choice_table
+        for choice in table:
+            name = table.get_export_tag(choice) or f"{tag}_{choice}"
+            if question.sub_selector in MULTIPLE_ANSWER_SUB_SELECTORS:
+                for answer in answers:
+                    self._add(
+                        f"{name}_{answer}",
+                        ColumnKind.SELECTED,
+                        question,
+                        choice=choice,
+                        answer=answer,
+                    )
+            else:
+                self._add(
+                    name, ColumnKind.ANSWER, question, choice=choice, labels=answers
+                )
+        for choice in table.text_entries:
+            self._add(f"{tag}_{choice}_TEXT", ColumnKind.TEXT, question, choice=choice)
+
+    def _add(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        name: str,
+        kind: ColumnKind,
+        question: Question,
+        choice: Optional[str] = None,
+        answer: Optional[str] = None,
+        labels: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        if labels is not None:
+            labels = {**{label: label for label in labels.values()}, **labels}
+        self.columns.setdefault(
+            name, ResponseColumn(name, kind, question, choice, answer, labels)
+        )
+
+
+def _decode(column: ResponseColumn, cells: Tuple[str, ...]) -> List[Any]:
+    if column.kind is ColumnKind.SELECTED:
+        return list(map(bool, cells))
+    if column.labels is not None:
+        return list(map(column.labels.get, cells))
+    return [cell or None for cell in cells]
@@ -0,0 +1,72 @@
+"""
+PyQSF schema module
+"""
+
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pyqsf.core.validation import ValidationLevel, accepts_bool
+from pyqsf.exceptions import FieldWrongType
+
+Schema = Tuple[Tuple[str, str, Any, bool], ...]
+
+
+def compile_schema(
+    *fields: Union[Tuple[str, Enum, Any], Tuple[str, Enum, Any, bool]]
+) -> Schema:
+    """Compiles (attr_name, field, types[, required]) entries into a schema
+
+    Field Enums are resolved to their JSON keys once, so extraction does not
+    touch the Enums per object. Fields are required unless stated otherwise.
+    """
+
+    return tuple(
+        (attr, field.value, _type, bool(required[0]) if required else True)
+        for attr, field, _type, *required in fields
+    )
+
+
+def extract_fields(
+    obj: Any,
+    name: str,
+    source: Dict[str, Any],
+    schema: Schema,
+    level: Optional[ValidationLevel],
+) -> None:
+    """Sets schema fields of source on obj, checked at the validation level"""
+
+    get = source.get
+    if level is ValidationLevel.OFF:
+        for attr, key, _, _ in schema:
+            setattr(obj, attr, get(key))
+        return
+
+    strict = level is ValidationLevel.STRICT
+    for attr, key, _type, required in schema:
+        value = get(key)
+        if required or (strict and value is not None):
+            if not isinstance(value, _type) or (
+                strict and value.__class__ is bool and not accepts_bool(_type)
+            ):
+                raise FieldWrongType(name, key, _type, type(value))
+        setattr(obj, attr, value)
+
+
+def inject_fields(
+    obj: Any, source: Optional[Dict[str, Any]], schema: Schema
+) -> Dict[str, Any]:
+    """Returns a copy of source with schema fields of obj written back
+
+    Inverse of ``extract_fields``. Only values that are no longer the objects
+    extracted from source are written, so untouched fields keep their keys
+    and order, and missing optional fields stay missing.
+    """
+
+    source = source if source is not None else {}
+    target = dict(source)
+    get = source.get
+    for attr, key, _, _ in schema:
+        value = getattr(obj, attr)
+        if value is not get(key):
+            target[key] = value
+    return target
@@ -0,0 +1,257 @@
+"""
+PyQSF simulation module
+"""
+
+import random
+from functools import partial
+import re
+from array import array
+from statistics import fmean
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pyqsf.core.logic import (
+    Chunk,
+    DisplayEvaluator,
+    FlowInstruction,
+    Instruction,
+)
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.question import MatrixQuestion, Question, QuestionType
+from pyqsf.core.responses import ColumnKind, ResponseColumn, ResponseReader
+
+Selection = Optional[List[List[bool]]]
+
+
+# fmt: off
+ANSWER_SECONDS: Dict[str, float] = {
+    QuestionType.DB.value:              0.0,
+    QuestionType.MC.value:              3.0,
+    QuestionType.MATRIX.value:          3.0,
+    QuestionType.TE.value:              20.0,
+    QuestionType.SLIDER.value:          5.0,
+    QuestionType.RANK_ORDER.value:      10.0,
+    QuestionType.SIDE_BY_SIDE.value:    10.0,
+    QuestionType.CONSTANT_SUM.value:    10.0,
+    QuestionType.HEAT_MAP.value:        5.0,
+    QuestionType.TIMING.value:          0.0,
+    QuestionType.META.value:            0.0,
+    QuestionType.FILE_UPLOAD.value:     20.0,
+}
+
+UNANSWERED_TYPES = frozenset(
+    (QuestionType.DB.value, QuestionType.TIMING.value, QuestionType.META.value)
+)
+
+
+# fmt: on
+DEFAULT_ANSWER_SECONDS = 5.0
+SECONDS_PER_WORD = 0.25
+SECONDS_PER_PAGE = 2.0
+RESPONSE_ID = "ResponseId"
+HTML_TAG = re.compile(r"<[^>]*>")
+
+
+class SimulationResult:
+    """Implements Simulation Result, one value per simulated respondent"""
+
+    __slots__ = ("pages", "questions", "seconds")
+
+    def __init__(self) -> None:
+        self.pages = array("i")
+        self.questions = array("i")
+        self.seconds = array("d")
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Returns mean, minimum, maximum and percentiles of each distribution"""
+        return {
+            name: _summarize(getattr(self, name))
+            for name in ("pages", "questions", "seconds")
+        }
+
+
+class PathSimulator:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    """Implements Monte Carlo simulator of respondent paths through a survey
+
+    The flow is compiled once into a flat program of ``FlowInstruction``
+    steps, branch, display and skip logic into predicates. Respondents are
+    simulated in batches, each step updates one mask over the batch instead
+    of walking flow objects per respondent.
+
+    Answers are sampled uniformly from choice and answer labels, only for the
+    columns compiled logic reads, and cleared for respondents who were not
+    shown the question. Multiple answer choices are selected with even odds,
+    text entries and embedded fields stay empty. ``values`` maps column or
+    embedded field names to values to sample from instead. Randomizers show
+    ``SubSet`` of their children picked uniformly, which approximates even
+    presentation. Children are presented in flow order.
+    """
+
+    def __init__(
+        self,
+        qsf: QualtricsSurveyFile,
+        seed: Optional[int] = None,
+        values: Optional[Mapping[str, Sequence[Any]]] = None,
+        timer: Optional[Callable[[Question], float]] = None,
+    ) -> None:
+        reader = ResponseReader(qsf)
+        self._random = random.Random(seed)
+        self._evaluator = DisplayEvaluator(qsf, reader)
+        self._program: List[Instruction] = self._evaluator.program
+
+        timer = timer or estimate_seconds
+        self._seconds = {q.question_id: timer(q) for q in qsf.questions}
+        self._answerable = {
+            q.question_id: int(q.question_type not in UNANSWERED_TYPES)
+            for q in qsf.questions
+        }
+        self._pages = [[q.question_id for q in page] for page in qsf.pages]
+
+        values = values or {}
+        self._samplers: Dict[str, Tuple[Any, ...]] = {}
+        self._blanks: Dict[str, List[Tuple[str, Any]]] = {}
+        for name in sorted(self._evaluator.compiler.names | set(values)):
+            column = reader.columns.get(name)
+            population = values.get(name)
+            if population is None and column is not None:
+                population = _get_population(column)
+            if not population:
+                continue
+            self._samplers[name] = tuple(population)
+            if column is not None and column.question is not None:
+                question_id = column.question.question_id
+                empty = False if column.kind is ColumnKind.SELECTED else None
+                self._blanks.setdefault(question_id, []).append((name, empty))
+
+    def simulate(self, respondents: int, batch_size: int = 10000) -> SimulationResult:
+        """Returns distributions of simulated respondent paths"""
+        result = SimulationResult()
+        for start in range(0, respondents, batch_size):
+            self._run(start, min(batch_size, respondents - start), result)
+        return result
+
+    def _run(self, start: int, size: int, result: SimulationResult) -> None:
+        chunk: Chunk = {RESPONSE_ID: list(range(start, start + size))}
+        for name, population in self._samplers.items():
+            chunk[name] = self._random.choices(population, k=size)
+        alive = [True] * size
+        masks = [alive]
+        selections: List[Selection] = []
+        shown: Dict[str, List[bool]] = {}
+        blank = partial(self._blank, chunk)
+        for instruction, argument in self._program:
+            if instruction is FlowInstruction.BLOCK:
+                alive = self._evaluator.evaluate_block(
+                    argument, chunk, _and(masks[-1], alive), alive, shown, blank
+                )
+            elif instruction is FlowInstruction.BRANCH:
+                masks.append(
+                    masks[-1] if argument is None else _and(masks[-1], argument(chunk))
+                )
+            elif instruction is FlowInstruction.RANDOMIZE:
+                selections.append(self._select(size, *argument))
+            elif instruction is FlowInstruction.CHILD:
+                selection = selections[-1]
+                masks.append(
+                    masks[-1]
+                    if selection is None
+                    else _and(masks[-1], selection[argument])
+                )
+            elif instruction is FlowInstruction.POP:
+                masks.pop()
+            elif instruction is FlowInstruction.POP_RANDOMIZER:
+                selections.pop()
+            else:
+                alive = [a and not m for a, m in zip(alive, masks[-1])]
+        self._measure(shown, size, result)
+
+    def _blank(self, chunk: Chunk, question_id: str, seen: List[bool]) -> None:
+        for name, empty in self._blanks.get(question_id, ()):
+            chunk[name] = [v if s else empty for v, s in zip(chunk[name], seen)]
+
+    def _select(self, size: int, count: int, subset: int) -> Selection:
+        if subset >= count:
+            return None
+        if subset == 1:
+            picks = self._random.choices(range(count), k=size)
+            return [[pick == index for pick in picks] for index in range(count)]
+        rows = [set(self._random.sample(range(count), subset)) for _ in range(size)]
+        return [[index in row for row in rows] for index in range(count)]
+
+    def _measure(
+        self, shown: Dict[str, List[bool]], size: int, result: SimulationResult
+    ) -> None:
+        # Questions without logic share one mask, totals are added per mask.
+        groups: Dict[int, List[Any]] = {}
+        for question_id, seen in shown.items():
+            group = groups.setdefault(id(seen), [seen, 0, 0, 0.0])
+            group[2] += self._answerable[question_id]
+            group[3] += self._seconds[question_id]
+        for page in self._pages:
+            seen = _get_page_mask(shown, page)
+            group = groups.setdefault(id(seen), [seen, 0, 0, 0.0])
+            group[1] += 1
+            group[3] += SECONDS_PER_PAGE
+
+        pages = [0] * size
+        questions = [0] * size
+        seconds = [0.0] * size
+        for seen, page_count, question_count, time in groups.values():
+            if page_count:
+                pages = [p + page_count * s for p, s in zip(pages, seen)]
+            if question_count:
+                questions = [q + question_count * s for q, s in zip(questions, seen)]
+            seconds = [t + time * s for t, s in zip(seconds, seen)]
+        result.pages.extend(pages)
+        result.questions.extend(questions)
+        result.seconds.extend(seconds)
+
+
+def estimate_seconds(question: Question) -> float:
+    """Returns estimated seconds to read and answer a question
+
+    Reading time is counted per word of question text, answer time per
+    question type, per statement for Matrix questions.
+    """
+    text = question.question_text
+    words = len(HTML_TAG.sub(" ", text).split()) if isinstance(text, str) else 0
+    seconds = ANSWER_SECONDS.get(question.question_type, DEFAULT_ANSWER_SECONDS)
+    if isinstance(question, MatrixQuestion):
+        seconds *= max(len(question.choice_table), 1)
+    return words * SECONDS_PER_WORD + seconds
+
+
+def _get_page_mask(shown: Dict[str, List[bool]], page: List[str]) -> List[bool]:
+    masks = {id(shown[q]): shown[q] for q in page}
+    if len(masks) == 1:
+        return next(iter(masks.values()))
+    return list(map(any, zip(*masks.values())))
+
+
+def _get_population(column: ResponseColumn) -> Tuple[Any, ...]:
+    if column.kind is ColumnKind.SELECTED:
+        return (True, False)
+    if column.labels is not None:
+        return tuple(dict.fromkeys(column.labels.values()))
+    return ()
+
+
+def _summarize(values: Sequence[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": fmean(ordered),
+        "min": ordered[0],
+        "p50": ordered[round(last * 0.5)],
+        "p90": ordered[round(last * 0.9)],
+        "p99": ordered[round(last * 0.99)],
+        "max": ordered[last],
+    }
+
+
+def _and(left: List[bool], right: List[bool]) -> List[bool]:
+    return [a and b for a, b in zip(left, right)]
@@ -0,0 +1,142 @@
+"""
+PyQSF stats module
+"""
+
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from enum import Enum
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+
+# fmt: off
+class LoadPhase(Enum):
+    """Load Phases
+
+    ``read`` reads the file, ``decode`` decodes JSON (and dispatches survey
+    elements with ``stream=True``), ``parse`` sorts survey elements by type,
+    ``entry``, ``blocks``, ``flow`` and ``questions`` build the objects and
+    ``compose`` arranges them in flow order.
+    """
+
+    READ        = "read"
+    DECODE      = "decode"
+    PARSE       = "parse"
+    ENTRY       = "entry"
+    BLOCKS      = "blocks"
+    FLOW        = "flow"
+    QUESTIONS   = "questions"
+    COMPOSE     = "compose"
+
+
+# fmt: on
+PhaseHook = Callable[[str, float], None]
+
+_NO_TIMER = nullcontext()
+
+# open spans of the running thread or task as [stats, phase, seconds, start]
+_SPANS: ContextVar[Tuple[List[Any], ...]] = ContextVar("pyqsf_spans", default=())
+
+
+class LoadStats:
+    """Implements Load Stats, wall time and counts recorded while loading
+
+    Phase times are exclusive: time spent in a nested phase, such as
+    questions built while composing, is only counted for the nested phase,
+    so phase times add up to the total. ``calls`` counts timed spans per
+    phase, ``elements`` survey elements by type and ``questions`` built
+    questions by type.
+
+    ``hook`` is called as ``hook(phase, seconds)`` whenever a span ends, to
+    forward timings to a metrics client. One instance can be shared by many
+    loads to aggregate them, also loads running concurrently in threads or
+    tasks: open spans are kept per thread and task, not per instance.
+    """
+
+    __slots__ = ("seconds", "calls", "elements", "questions", "hook")
+
+    def __init__(self, hook: Optional[PhaseHook] = None) -> None:
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.elements: Dict[str, int] = {}
+        self.questions: Dict[str, int] = {}
+        self.hook = hook
+
+    @property
+    def total(self) -> float:
+        """Returns wall time of all phases in seconds"""
+        return sum(self.seconds.values())
+
+    def phase(self, phase: LoadPhase) -> ContextManager[Any]:
+        """Returns context manager timing a span of a phase"""
+        return _PhaseTimer(self, phase.value)
+
+    def count_element(self, element_type: str) -> None:
+        """Counts a survey element of a type"""
+        self.elements[element_type] = self.elements.get(element_type, 0) + 1
+
+    def count_question(self, question_type: str) -> None:
+        """Counts a built question of a type"""
+        self.questions[question_type] = self.questions.get(question_type, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns stats as plain data for export"""
+        return {
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "elements": dict(self.elements),
+            "questions": dict(self.questions),
+        }
+
+    def _start(self, phase: str) -> Token:
+        now = perf_counter()
+        spans = _SPANS.get()
+        if spans and spans[-1][0] is self:
+            spans[-1][2] += now - spans[-1][3]
+        return _SPANS.set(spans + ([self, phase, 0.0, now],))
+
+    def _stop(self, token: Token) -> None:
+        now = perf_counter()
+        _, phase, seconds, start = _SPANS.get()[-1]
+        seconds += now - start
+        _SPANS.reset(token)
+        spans = _SPANS.get()
+        if spans and spans[-1][0] is self:
+            spans[-1][3] = now
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        if self.hook is not None:
+            self.hook(phase, seconds)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # hooks usually wrap metrics clients that cannot be pickled
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.hook = None
+        for key, value in state.items():
+            setattr(self, key, value)
+
+
+class _PhaseTimer:
+    __slots__ = ("_stats", "_phase", "_token")
+
+    _token: Token
+
+    def __init__(self, stats: LoadStats, phase: str) -> None:
+        self._stats = stats
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        # pylint: disable-next=protected-access
+        self._token = self._stats._start(self._phase)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stats._stop(self._token)  # pylint: disable=protected-access
+
+
+def measure(stats: Optional[LoadStats], phase: LoadPhase) -> ContextManager[Any]:
+    """Returns context manager timing a phase, a no-op without stats"""
+    if stats is None:
+        return _NO_TIMER
+    return stats.phase(phase)
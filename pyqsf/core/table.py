@@ -0,0 +1,141 @@
+"""
+PyQSF table module
+"""
+
+import sys
+from array import array
+from collections import Counter
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pyqsf.core.question import Question
+
+
+# fmt: off
+class TableColumn(Enum):
+    """Coded Columns of Question Table"""
+
+    QUESTION_TYPE   = "question_type"
+    SELECTOR        = "selector"
+    BLOCK           = "block"
+
+
+# fmt: on
+class QuestionTable:
+    """Implements columnar view of survey questions
+
+    Rows follow flow order. Question IDs and data export tags are kept as
+    interned strings. Question type, selector and block are kept as integer
+    codes in ``array("i")`` columns that index into their categories, so
+    filters and group-bys compare integers only. Code columns support the
+    buffer protocol, ``numpy.frombuffer(codes, dtype="i")`` wraps them
+    without copying.
+    """
+
+    __slots__ = (
+        "question_ids",
+        "data_export_tags",
+        "_categories",
+        "_codes",
+        "_questions",
+    )
+
+    def __init__(
+        self,
+        questions: Sequence[Question],
+        block_codes: Iterable[int],
+        blocks: Sequence[str],
+    ) -> None:
+        self._questions: Tuple[Question, ...] = tuple(questions)
+        self.question_ids: Tuple[str, ...] = tuple(
+            _intern(q.question_id) for q in self._questions
+        )
+        self.data_export_tags: Tuple[str, ...] = tuple(
+            _intern(q.data_export_tag) for q in self._questions
+        )
+        types, type_codes = _encode(q.question_type for q in self._questions)
+        selectors, selector_codes = _encode(q.selector for q in self._questions)
+        self._categories: Dict[TableColumn, Tuple[Any, ...]] = {
+            TableColumn.QUESTION_TYPE: types,
+            TableColumn.SELECTOR: selectors,
+            TableColumn.BLOCK: tuple(_intern(b) for b in blocks),
+        }
+        self._codes: Dict[TableColumn, array] = {
+            TableColumn.QUESTION_TYPE: type_codes,
+            TableColumn.SELECTOR: selector_codes,
+            TableColumn.BLOCK: array("i", block_codes),
+        }
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def categories(self, column: Union[str, TableColumn]) -> Tuple[Any, ...]:
+        """Returns distinct values of a coded column, indexed by code"""
+        return self._categories[TableColumn(column)]
+
+    def codes(self, column: Union[str, TableColumn]) -> array:
+        """Returns integer codes of a coded column, one per row"""
+        return self._codes[TableColumn(column)]
+
+    def where(
+        self,
+        question_type: Optional[str] = None,
+        selector: Optional[str] = None,
+        block: Optional[str] = None,
+    ) -> array:
+        """Returns rows matching all given column values"""
+        rows: Iterable[int] = range(len(self))
+        filters = {
+            TableColumn.QUESTION_TYPE: question_type,
+            TableColumn.SELECTOR: selector,
+            TableColumn.BLOCK: block,
+        }
+        for column, value in filters.items():
+            if value is None:
+                continue
+            categories = self._categories[column]
+            if value not in categories:
+                return array("i")
+            code = categories.index(value)
+            codes = self._codes[column]
+            rows = [row for row in rows if codes[row] == code]
+        return array("i", rows)
+
+    def group_by(self, column: Union[str, TableColumn]) -> Dict[Any, array]:
+        """Returns rows of each value of a coded column"""
+        _column = TableColumn(column)
+        groups = [array("i") for _ in self._categories[_column]]
+        for row, code in enumerate(self._codes[_column]):
+            groups[code].append(row)
+        return dict(zip(self._categories[_column], groups))
+
+    def count_by(self, column: Union[str, TableColumn]) -> Dict[Any, int]:
+        """Returns row count of each value of a coded column"""
+        _column = TableColumn(column)
+        counts = Counter(self._codes[_column])
+        return {
+            value: counts[code] for code, value in enumerate(self._categories[_column])
+        }
+
+    def question_at(self, row: int) -> Question:
+        """Returns Question of a row"""
+        return self._questions[row]
+
+    def questions_at(self, rows: Iterable[int]) -> List[Question]:
+        """Returns Questions of rows"""
+        return [self._questions[row] for row in rows]
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _encode(values: Iterable[Any]) -> Tuple[Tuple[Any, ...], array]:
+    index: Dict[Any, int] = {}
+    codes = array("i")
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(index)
+        codes.append(code)
+    return tuple(_intern(v) for v in index), codes
@@ -0,0 +1,65 @@
+"""
+PyQSF validation module
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
+
+from pyqsf.exceptions.core import PyQSFBaseException
+
+
+# fmt: off
+class ValidationLevel(Enum):
+    """Validation Levels
+
+    ``strict`` checks required field types, types of optional fields that
+    are present, rejects booleans in numeric fields and runs semantic checks
+    such as question IDs and choice orders. ``fast`` checks required field
+    types only. ``off`` extracts fields without any checks and is meant for
+    trusted, already validated files.
+    """
+
+    STRICT  = "strict"
+    FAST    = "fast"
+    OFF     = "off"
+
+
+# fmt: on
+Reporter = Callable[[PyQSFBaseException, Optional[Dict[str, Any]]], None]
+
+_DEFAULT = {"level": ValidationLevel.FAST}
+
+
+def set_validation(level: Union[str, ValidationLevel]) -> None:
+    """Sets global default validation level"""
+    _DEFAULT["level"] = ValidationLevel(level)
+
+
+def get_validation(
+    level: Union[str, ValidationLevel, None] = None,
+) -> ValidationLevel:
+    """Returns validation level, global default if not given"""
+    if level is None:
+        return _DEFAULT["level"]
+    return ValidationLevel(level)
+
+
+def accepts_bool(_type: Any) -> bool:
+    """Returns True if type or tuple of types admits booleans"""
+    types = _type if isinstance(_type, tuple) else (_type,)
+    return bool in types or object in types
+
+
+def report_error(
+    report: Optional[Reporter], error: PyQSFBaseException, data: Any = None
+) -> None:
+    """Passes an error and the data it was raised for to report, raises it without"""
+    if report is None:
+        raise error
+    report(error, data if isinstance(data, dict) else None)
+
+
+def ignore_error(  # pylint: disable=unused-argument
+    error: PyQSFBaseException, data: Optional[Dict[str, Any]] = None
+) -> None:
+    """Drops an error, reporter of placeholders standing in for missing data"""
@@ -0,0 +1,46 @@
+"""
+PyQSF writer module
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional, TextIO, Tuple
+
+
+def encode(value: Any) -> str:
+    """Returns JSON text of a value encoded the way Qualtrics exports it
+
+    Qualtrics writes compact JSON with non-ASCII characters and forward
+    slashes escaped, so values that were not changed encode to their
+    original text.
+    """
+
+    return json.dumps(value, separators=(",", ":")).replace("/", "\\/")
+
+
+def write_document(
+    file: TextIO,
+    document: Dict[str, Any],
+    expand: str,
+    items: Iterable[Tuple[Any, Optional[str]]],
+) -> None:
+    """Writes a QSF document with the ``expand`` array taken from items
+
+    Items are (value, text) pairs, text is written as is when given and the
+    value is encoded otherwise. Items are written one at a time.
+    """
+
+    file.write("{")
+    for index, (key, value) in enumerate(document.items()):
+        if index:
+            file.write(",")
+        file.write(encode(key) + ":")
+        if key != expand:
+            file.write(encode(value))
+            continue
+        file.write("[")
+        for position, (item, text) in enumerate(items):
+            if position:
+                file.write(",")
+            file.write(encode(item) if text is None else text)
+        file.write("]")
+    file.write("}")
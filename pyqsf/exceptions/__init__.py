@@ -6,8 +6,12 @@ from pyqsf.exceptions.core import (
     BlockEntryNotFound,
     ElementTypeNotFound,
     FileNotFound,
+    FieldNotValid,
     FieldWrongType,
     FlowNotFound,
+    JSONBackendNotFound,
+    LogicNotValid,
+    QSFNotSerializable,
     QSFNotValid,
     QuestionNotFound,
     QuestionTypeNotFound,
@@ -17,8 +21,12 @@ __all__ = [
     "BlockEntryNotFound",
     "ElementTypeNotFound",
     "FileNotFound",
+    "FieldNotValid",
     "FieldWrongType",
     "FlowNotFound",
+    "JSONBackendNotFound",
+    "LogicNotValid",
+    "QSFNotSerializable",
     "QSFNotValid",
     "QuestionNotFound",
     "QuestionTypeNotFound",
@@ -6,6 +6,15 @@ PyQSF core exceptions module
 class PyQSFBaseException(Exception):
     """Implements PyQSF Base Exception"""
 
+    def __reduce__(self):
+        return (_restore, (type(self), str(self)))
+
+
+def _restore(cls, message: str) -> PyQSFBaseException:
+    exception = cls.__new__(cls)
+    Exception.__init__(exception, message)
+    return exception
+
 
 class FileNotFound(PyQSFBaseException):
     """Implements File Not Found Exception"""
@@ -63,6 +72,36 @@ class FieldWrongType(PyQSFBaseException):
     """Implements Field Wrong Type"""
 
     def __init__(self, name, field, expected, got) -> None:
+        field = getattr(field, "value", field)
         super().__init__(
-            f"{name} field `{field.value}` wrong type. Expected `{expected}`, got `{got}`."
+            f"{name} field `{field}` wrong type. Expected `{expected}`, got `{got}`."
         )
+
+
+class FieldNotValid(PyQSFBaseException):
+    """Implements Field Not Valid"""
+
+    def __init__(self, name, field, reason) -> None:
+        field = getattr(field, "value", field)
+        super().__init__(f"{name} field `{field}` not valid. {reason}")
+
+
+class JSONBackendNotFound(PyQSFBaseException):
+    """Implements JSON Backend Not Found"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"JSON backend `{name}` not recognized.")
+
+
+class QSFNotSerializable(PyQSFBaseException):
+    """Implements QSF Not Serializable"""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"QSF cannot be serialized. Reason: {reason}")
+
+
+class LogicNotValid(PyQSFBaseException):
+    """Implements Logic Not Valid"""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Logic not valid. Reason: {reason}")
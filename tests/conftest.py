@@ -1,7 +1,9 @@
+import json
 import os
 from pathlib import Path
 from distutils import dir_util
 import pytest
+from pyqsf.core.qsf import QualtricsSurveyFile
 
 
 @pytest.fixture
@@ -13,3 +15,25 @@ def datadir(tmpdir, request):
         dir_util.copy_tree(test_dir, str(tmpdir))
 
     return tmpdir
+
+
+@pytest.fixture
+def load_survey():
+    """Returns loader of a template with question payloads and flow changed
+
+    ``changes`` update question payloads by question ID, ``flow`` maps the
+    top-level flow nodes and ``blocks`` the blocks payload to new ones.
+    """
+
+    def load(template, flow=None, validation=None, blocks=None, **changes):
+        data = json.loads(Path(template).read_text(encoding="utf-8-sig"))
+        for element in data["SurveyElements"]:
+            if element["Element"] == "SQ":
+                element["Payload"].update(changes.get(element["PrimaryAttribute"], {}))
+            if element["Element"] == "FL" and flow is not None:
+                element["Payload"]["Flow"] = flow(element["Payload"]["Flow"])
+            if element["Element"] == "BL" and blocks is not None:
+                element["Payload"] = blocks(element["Payload"])
+        return QualtricsSurveyFile.from_dict(data, validation=validation)
+
+    return load
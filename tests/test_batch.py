@@ -0,0 +1,105 @@
+import asyncio
+import gc
+import weakref
+import pytest
+from pyqsf import QualtricsSurveyFile, aload_many, load_many
+from pyqsf.exceptions import FileNotFound, QSFNotValid, QuestionNotFound
+
+TEMPLATES = [
+    "brand_perceptions.qsf",
+    "corrupted.qsf",
+    "employee_exit_interview.qsf",
+    "question_not_found.qsf",
+    "test.qsf",
+]
+
+
+@pytest.fixture
+def paths(datadir):
+    return [str(datadir.join(name)) for name in TEMPLATES]
+
+
+def check_results(paths, results):
+    results = dict(results)
+    assert sorted(results) == sorted(paths)
+    assert isinstance(results[paths[0]], QualtricsSurveyFile)
+    assert isinstance(results[paths[1]], QSFNotValid)
+    assert isinstance(results[paths[2]], QualtricsSurveyFile)
+    assert isinstance(results[paths[3]], QuestionNotFound)
+    assert isinstance(results[paths[4]], FileNotFound)
+    assert str(results[paths[1]]) == (
+        "Provided QSF file is not valid. Reason: Cannot load JSON."
+    )
+
+
+def test_load_many_in_process(paths):
+    results = list(load_many(paths, workers=1, chunksize=2))
+    assert [path for path, _ in results] == paths
+    check_results(paths, results)
+
+
+def test_load_many_ordered(paths):
+    results = list(load_many(paths, workers=2, chunksize=2))
+    assert [path for path, _ in results] == paths
+    check_results(paths, results)
+    qsf = dict(results)[paths[2]]
+    assert qsf.get_question("QID2").question_id == "QID2"
+
+
+def test_load_many_as_completed(paths):
+    results = list(
+        load_many(paths, workers=2, chunksize=1, ordered=False, backend="json")
+    )
+    check_results(paths, results)
+
+
+def test_aload_many(paths):
+    async def collect():
+        return [result async for result in aload_many(paths, concurrency=2)]
+
+    results = asyncio.run(collect())
+    check_results(paths, results)
+
+
+def test_aload_many_closed(paths):
+    async def first():
+        iterator = aload_many(paths, concurrency=1)
+        result = await iterator.__anext__()
+        await iterator.aclose()
+        return result
+
+    path, _ = asyncio.run(first())
+    assert path in paths
+
+
+def count_alive(refs, qsf):
+    # surveys yielded before qsf still alive, the caller dropped them
+    refs.append(weakref.ref(qsf))
+    gc.collect()
+    return sum(ref() is not None for ref in refs[:-1])
+
+
+@pytest.mark.parametrize("workers, ordered", [(1, True), (2, True), (2, False)])
+def test_load_many_releases_results(datadir, workers, ordered):
+    paths = [str(datadir.join("employee_exit_interview.qsf"))] * 10
+    refs = []
+    results = load_many(paths, workers=workers, chunksize=3, ordered=ordered)
+    assert [count_alive(refs, qsf) for _, qsf in results] == [0] * 10
+
+
+def test_aload_many_releases_results(datadir):
+    paths = [str(datadir.join("employee_exit_interview.qsf"))] * 10
+    refs = []
+
+    async def collect():
+        return [
+            count_alive(refs, qsf) async for _, qsf in aload_many(paths, concurrency=2)
+        ]
+
+    assert asyncio.run(collect()) == [0] * 10
+
+
+def test_load_many_closed(paths):
+    results = load_many(paths * 20, workers=2, chunksize=1)
+    assert next(results)[0] == paths[0]
+    results.close()
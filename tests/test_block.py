@@ -4,9 +4,8 @@ from pyqsf.core.block import (
     BlockElement,
     BlockEntry,
     BlockEntryField,
-    BlockEntryNotFound,
-    FieldWrongType,
 )
+from pyqsf.exceptions import BlockEntryNotFound, FieldWrongType
 
 BLOCK = {
     "SurveyID": "SV_87VGOSKOVpHuohE",
@@ -115,3 +114,28 @@ def test_block_element_field_wrong_type():
         str(exc.value)
         == "Block Element field `Type` wrong type. Expected `<class 'str'>`, got `<class 'int'>`."
     )
+
+
+def test_block_report():
+    entry = {
+        **BLOCK["Payload"]["2"],
+        "BlockElements": [{"QuestionID": "QID21", "Type": 1}, "TEST", {"Type": "X"}],
+    }
+    data = {**BLOCK, "Payload": {**BLOCK["Payload"], "2": entry, "3": None}}
+    errors = []
+    block = Block(data, report=lambda error, data: errors.append((error, data)))
+    assert [e.id for e in block.block_elements] == ["BL_123abctest1231", entry["ID"]]
+    assert [e.type for e in block.block_elements[1].elements] == ["X"]
+    assert [str(error) for error, _ in errors] == [
+        "Block Element field `Type` wrong type. Expected `<class 'str'>`, got `<class 'int'>`.",
+        "Block Entry field `BlockElements` wrong type. Expected `<class 'dict'>`, got `<class 'str'>`.",
+        "Block field `Payload` wrong type. Expected `<class 'dict'>`, got `<class 'NoneType'>`.",
+    ]
+    assert [data for _, data in errors] == [entry["BlockElements"][0], None, None]
+
+    errors.clear()
+    block = Block({**BLOCK, "Payload": None}, report=lambda *args: errors.append(args))
+    assert block.block_elements == []
+    assert len(errors) == 1
+    with pytest.raises(FieldWrongType):
+        BlockEntry({**entry, "BlockElements": ["TEST"]})
@@ -0,0 +1,103 @@
+import os
+import pickle
+from pathlib import Path
+import pytest
+from pyqsf import QualtricsSurveyFile, load_cached
+from pyqsf.core.block import PageBreak
+from pyqsf.core.cache import CacheValidation
+from pyqsf.core.question import QUESTION_TYPES, MCQuestion, register_question_type
+from pyqsf.exceptions import FileNotFound, QSFNotValid
+
+
+@pytest.fixture
+def template(datadir):
+    return Path(datadir.join("employee_exit_interview.qsf"))
+
+
+@pytest.fixture
+def cache_dir(tmpdir):
+    return Path(tmpdir.join("cache"))
+
+
+def no_load(*args, **kwargs):
+    raise AssertionError("QSF decoded instead of read from cache")
+
+
+@pytest.mark.parametrize("validation", ["mtime", CacheValidation.HASH])
+def test_load_cached(template, cache_dir, validation, monkeypatch):
+    eager = QualtricsSurveyFile(template)
+    cold = load_cached(template, cache_dir, validation)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with monkeypatch.context() as patch:
+        patch.setattr(QualtricsSurveyFile, "from_bytes", no_load)
+        warm = load_cached(template, cache_dir, validation)
+    for qsf in (cold, warm):
+        assert qsf.entry.data == eager.entry.data
+        assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+        assert [type(q) for q in qsf.questions] == [type(q) for q in eager.questions]
+        assert [len(p) for p in qsf.pages] == [len(p) for p in eager.pages]
+        assert qsf.page_of("QID2").questions[0] is qsf.get_question("QID2")
+    assert PageBreak() in warm._get_structure()[warm.blocks[0]]
+
+
+def test_load_cached_mtime_changed(template, cache_dir, monkeypatch):
+    load_cached(template, cache_dir)
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    calls = []
+    from_bytes = QualtricsSurveyFile.from_bytes
+    monkeypatch.setattr(
+        QualtricsSurveyFile,
+        "from_bytes",
+        lambda *args, **kwargs: calls.append(1) or from_bytes(*args, **kwargs),
+    )
+    load_cached(template, cache_dir)
+    assert calls == [1]
+    assert load_cached(template, cache_dir, "hash") is not None
+    assert calls == [1, 1]
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    load_cached(template, cache_dir, "hash")
+    assert calls == [1, 1]
+
+
+def test_load_cached_content_changed(template, cache_dir):
+    load_cached(template, cache_dir, "hash")
+    template.write_bytes(b"{")
+    with pytest.raises(QSFNotValid):
+        load_cached(template, cache_dir, "hash")
+
+
+@pytest.mark.parametrize("content", [b"", b"corrupted", None])
+def test_load_cached_corrupted_cache(template, cache_dir, content):
+    load_cached(template, cache_dir)
+    cache_file = next(cache_dir.iterdir())
+    if content is None:
+        with cache_file.open("rb") as file:
+            header = pickle.load(file)
+        cache_file.write_bytes(pickle.dumps(header) + pickle.dumps("TEST"))
+    else:
+        cache_file.write_bytes(content)
+    qsf = load_cached(template, cache_dir)
+    assert isinstance(qsf, QualtricsSurveyFile)
+
+
+def test_load_cached_not_written(template, cache_dir, monkeypatch):
+    monkeypatch.setattr("pyqsf.core.question.QUESTION_TYPES", dict(QUESTION_TYPES))
+
+    class LocalQuestion(MCQuestion):
+        __slots__ = ()
+
+    register_question_type("MC", LocalQuestion)
+    qsf = load_cached(template, cache_dir)
+    assert isinstance(qsf.get_question("QID2"), LocalQuestion)
+    assert list(cache_dir.iterdir()) == []
+
+    cache_dir.rmdir()
+    cache_dir.write_bytes(b"")
+    assert len(load_cached(template, cache_dir).questions) == 13
+
+
+def test_load_cached_file_not_found(template, cache_dir):
+    with pytest.raises(FileNotFound):
+        load_cached(template.parent / "test.qsf", cache_dir)
@@ -0,0 +1,83 @@
+import json
+import pickle
+from pathlib import Path
+import pytest
+from pyqsf.core.choices import ChoiceTable, get_choice_labels, get_text_entries
+from pyqsf.core.question import MatrixQuestion, MCQuestion
+
+
+@pytest.fixture
+def question_example(datadir, request):
+    question = datadir.join(request.param)
+    return json.loads(Path(question).read_text())
+
+
+def test_choice_table():
+    choices = {
+        "1": {"Display": "Red"},
+        "2": {"Display": "Blue", "TextEntry": "true"},
+        "3": {"Display": "Red"},
+        "4": {"Display": "Green"},
+    }
+    table = ChoiceTable(choices, [3, "2", 1, 9], {"1": 5, "3": "7"}, {"2": "Q1_b"})
+    assert table.ids == ("3", "2", "1", "4")
+    assert list(table) == list(table.labels) == ["3", "2", "1", "4"]
+    assert len(table) == 4
+    assert "2" in table and "9" not in table
+    assert table.text_entries == ("2",)
+    assert table.get_label("2") == "Blue"
+    assert table.get_recode("1") == "5"
+    assert table.get_recode("2") == "2"
+    assert table.get_label_by_recode("7") == "Red"
+    assert table.get_recode_by_label("Red") == "7"
+    assert dict(table.recode_labels) == {
+        "7": "Red",
+        "2": "Blue",
+        "5": "Red",
+        "4": "Green",
+    }
+    assert table.get_export_tag("2") == "Q1_b"
+    assert table.get_export_tag("1") is None
+    assert table.get_label("9") is None
+    assert table.get_recode("9") is None
+    with pytest.raises(TypeError):
+        table.labels["1"] = "Yellow"
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored.ids == table.ids
+    assert dict(restored.recode_labels) == dict(table.recode_labels)
+
+
+def test_choice_table_raw_fields():
+    table = ChoiceTable(["Yes", {"Display": "No"}], None, True, False)
+    assert dict(table.labels) == {"0": "Yes", "1": "No"}
+    assert table.get_recode_by_label("No") == "1"
+    assert table.text_entries == ()
+    assert len(ChoiceTable(None, 1)) == 0
+    assert get_choice_labels(1) == {}
+    assert get_text_entries([{"TextEntry": True}]) == ()
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_mc_question_choice_table(question_example):
+    question = MCQuestion(question_example)
+    assert question.choice_table is question.choice_table
+    assert question.choice_table.ids == ("1", "2", "3")
+    assert question.choice_table.get_label_by_recode("2") == "product feature 2"
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["matrix_question.json"]),
+    indirect=True,
+)
+def test_matrix_question_choice_tables(question_example):
+    question = MatrixQuestion(question_example)
+    assert question.choice_table.get_label("3") == "product feature 3"
+    assert question.answer_table.ids == ("1", "2", "3", "4", "5")
+    assert question.answer_table.get_recode_by_label("Very important") == "2"
+    assert question.choice_table.get_export_tag("1") is None
@@ -0,0 +1,97 @@
+import json
+import sys
+import types
+from pathlib import Path
+import pytest
+from pyqsf.core.decoder import (
+    BACKEND_ENV_VAR,
+    UTF8_BOM,
+    JSONBackend,
+    get_decoder,
+    strip_bom,
+    _resolve,
+)
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.exceptions import JSONBackendNotFound
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _resolve.cache_clear()
+    yield
+    _resolve.cache_clear()
+
+
+def fake_module(monkeypatch, name, **attributes):
+    module = types.ModuleType(name)
+    for key, value in attributes.items():
+        setattr(module, key, value)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+def test_get_decoder_json():
+    loads, errors = get_decoder("json")
+    assert loads is json.loads
+    assert errors == (ValueError,)
+
+
+def test_get_decoder_env(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV_VAR, "JSON")
+    assert get_decoder()[0] is json.loads
+
+
+def test_get_decoder_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "ujson", None)
+    assert get_decoder(JSONBackend.UJSON.value)[0] is json.loads
+
+
+def test_get_decoder_auto(monkeypatch):
+    for backend in ("orjson", "msgspec", "ujson"):
+        monkeypatch.setitem(sys.modules, backend, None)
+    assert get_decoder("auto")[0] is json.loads
+    _resolve.cache_clear()
+
+    ujson = fake_module(monkeypatch, "ujson", loads=lambda content: {})
+    assert get_decoder("auto") == (ujson.loads, (ValueError,))
+
+
+def test_get_decoder_msgspec(monkeypatch):
+    class DecodeError(Exception):
+        pass
+
+    def decode(content):
+        return {}
+
+    fake_module(
+        monkeypatch,
+        "msgspec",
+        json=types.SimpleNamespace(decode=decode),
+        DecodeError=DecodeError,
+    )
+    assert get_decoder("msgspec") == (decode, (ValueError, DecodeError))
+
+
+def test_get_decoder_not_found():
+    with pytest.raises(JSONBackendNotFound) as exc:
+        get_decoder("TEST")
+    assert str(exc.value) == "JSON backend `test` not recognized."
+
+
+def test_strip_bom():
+    assert strip_bom(UTF8_BOM + b"{}") == b"{}"
+    assert strip_bom(bytearray(UTF8_BOM + b"{}")) == bytearray(b"{}")
+    assert strip_bom("\ufeff{}") == "{}"
+    assert strip_bom(b"{}") == b"{}"
+    assert strip_bom("{}") == "{}"
+
+
+@pytest.mark.parametrize("backend", [backend.value for backend in JSONBackend])
+def test_bom_input(datadir, backend):
+    content = Path(datadir.join("employee_exit_interview.qsf")).read_bytes()
+    content = content.removeprefix(UTF8_BOM)
+    for source in (UTF8_BOM + content, "\ufeff" + content.decode()):
+        qsf = QualtricsSurveyFile.from_bytes(source, backend=backend)
+        assert len(qsf.questions) == 13
+    qsf = QualtricsSurveyFile.from_bytes(UTF8_BOM + content, keep_source=True)
+    assert len(qsf.questions) == 13
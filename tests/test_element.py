@@ -27,3 +27,11 @@ def test_element_field_wrong_type():
         str(exc.value)
         == "Element field `Element` wrong type. Expected `<class 'str'>`, got `<class 'int'>`."
     )
+
+
+def test_element_slots():
+    element = Element(ELEMENT)
+    assert not hasattr(element, "__dict__")
+    element.drop_data()
+    assert element.data is None
+    assert element.payload is None
@@ -0,0 +1,13 @@
+import pickle
+from pyqsf.core.question import QuestionField
+from pyqsf.exceptions import FieldWrongType, QSFNotValid
+
+
+def test_exception_pickle():
+    for exception in (
+        QSFNotValid("Cannot load JSON."),
+        FieldWrongType("Question", QuestionField.QUESTION_ID, str, int),
+    ):
+        restored = pickle.loads(pickle.dumps(exception))
+        assert type(restored) is type(exception)
+        assert str(restored) == str(exception)
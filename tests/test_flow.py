@@ -1,8 +1,19 @@
 import pytest
-from pyqsf.core.flow import Flow, FlowEntry, FlowField, FlowEntryField
+from pyqsf.core.flow import (
+    BranchNode,
+    EmbeddedDataNode,
+    EndSurveyNode,
+    Flow,
+    FlowEntry,
+    FlowEntryField,
+    FlowField,
+    FlowNode,
+    GroupNode,
+    RandomizerNode,
+    get_flow_node_class,
+)
 from pyqsf.exceptions import FlowNotFound, FieldWrongType
 
-
 FLOW = {
     "SurveyID": "SV_abc123testefg",
     "Element": "FL",
@@ -46,6 +57,17 @@ def test_flow_not_found():
         Flow(data)
 
 
+@pytest.mark.parametrize(
+    "level, error",
+    [("strict", FieldWrongType), ("fast", FieldWrongType), ("off", FlowNotFound)],
+)
+def test_flow_list_wrong_type(level, error):
+    payload = {**FLOW["Payload"], "Flow": {}}
+    data = {**FLOW, "Payload": payload}
+    with pytest.raises(error):
+        Flow(data, level)
+
+
 def test_flow_field_wrong_type():
     payload = {**FLOW["Payload"], "Type": 1}
     data = {**FLOW, "Payload": payload}
@@ -57,6 +79,24 @@ def test_flow_field_wrong_type():
     )
 
 
+@pytest.mark.parametrize(
+    "nodes, got",
+    [
+        (["FL_3"], str),
+        ([{"Type": "Group", "FlowID": "FL_2", "Flow": [None]}], type(None)),
+    ],
+)
+@pytest.mark.parametrize("level", ["strict", "fast", "off"])
+def test_flow_node_wrong_type(nodes, got, level):
+    payload = {**FLOW["Payload"], "Flow": nodes}
+    data = {**FLOW, "Payload": payload}
+    with pytest.raises(FieldWrongType) as exc:
+        Flow(data, level)
+    assert str(exc.value) == (
+        f"Flow field `Flow` wrong type. Expected `<class 'dict'>`, got `{got}`."
+    )
+
+
 def test_flow_entry_field_wrong_type():
     payload = {
         **FLOW["Payload"],
@@ -75,3 +115,126 @@ def test_flow_entry_field_wrong_type():
         str(exc.value)
         == "Flow Entry field `FlowID` wrong type. Expected `<class 'str'>`, got `<class 'int'>`."
     )
+
+
+NESTED_FLOW = {
+    **FLOW,
+    "Payload": {
+        **FLOW["Payload"],
+        "Flow": [
+            {
+                "FlowID": "FL_2",
+                "Type": "EmbeddedData",
+                "EmbeddedData": [{"Field": "source", "Type": "Recipient"}],
+            },
+            {"FlowID": "FL_3", "ID": "BL_1", "Type": "Standard"},
+            {
+                "FlowID": "FL_4",
+                "Type": "Branch",
+                "BranchLogic": {"0": {"Type": "If"}, "Type": "BooleanExpression"},
+                "Flow": [
+                    {
+                        "FlowID": "FL_5",
+                        "Type": "BlockRandomizer",
+                        "SubSet": 1,
+                        "EvenPresentation": True,
+                        "Flow": [
+                            {"FlowID": "FL_6", "ID": "BL_2", "Type": "Block"},
+                            {"FlowID": "FL_7", "ID": "BL_3", "Type": "Block"},
+                        ],
+                    },
+                    {"FlowID": "FL_8", "Type": "EndSurvey"},
+                ],
+            },
+            {
+                "FlowID": "FL_9",
+                "Type": "Group",
+                "Description": "Group",
+                "Flow": [
+                    {"FlowID": "FL_10", "ID": "BL_2", "Type": "Block"},
+                    {"FlowID": "FL_11", "Type": "WebService"},
+                ],
+            },
+        ],
+    },
+}
+
+
+def test_flow_nested():
+    flow = Flow(NESTED_FLOW)
+    assert flow.get_block_ids() == ["BL_1", "BL_2", "BL_3", "BL_2"]
+    assert [n.flow_id for n in flow.iter_nodes()] == [f"FL_{i}" for i in range(2, 12)]
+    assert [n.flow_id for n in flow.iter_blocks()] == ["FL_3", "FL_6", "FL_7", "FL_10"]
+
+    embedded, block, branch, group = flow._entries
+    assert isinstance(embedded, EmbeddedDataNode)
+    assert embedded.embedded_data == [{"Field": "source", "Type": "Recipient"}]
+    assert isinstance(block, FlowEntry)
+    assert isinstance(branch, BranchNode)
+    assert branch.branch_logic["Type"] == "BooleanExpression"
+    assert isinstance(group, GroupNode)
+    assert group.description == "Group"
+
+    randomizer, end = branch.children
+    assert isinstance(randomizer, RandomizerNode)
+    assert (randomizer.sub_set, randomizer.even_presentation) == (1, True)
+    assert isinstance(end, EndSurveyNode)
+    assert end.options is None
+    assert type(group.children[1]) is FlowNode
+
+    assert flow.get_paths("BL_1") == ((),)
+    assert flow.get_paths("BL_2") == ((branch, randomizer), (group,))
+    assert flow.get_paths("TEST") == ()
+    assert flow.get_branches("BL_2") == (branch,)
+    assert flow.get_branches("BL_1") == ()
+
+
+def test_flow_edit():
+    flow = Flow(NESTED_FLOW)
+    embedded, block, branch, group = flow.get_nodes()
+    version = flow.version
+    flow.move_node(block, 0, group)
+    assert flow.get_nodes() == (embedded, branch, group)
+    assert flow.get_block_ids() == ["BL_2", "BL_3", "BL_1", "BL_2"]
+    assert flow.get_paths("BL_1") == ((group,),)
+
+    flow.remove_node(branch)
+    assert flow.get_block_ids() == ["BL_1", "BL_2"]
+    assert flow.get_branches("BL_2") == ()
+
+    entry = FlowEntry({"FlowID": "FL_12", "ID": "BL_3", "Type": "Block"})
+    flow.insert_node(1, entry)
+    assert flow.get_nodes() == (embedded, entry, group)
+    assert flow.get_paths("BL_3") == ((),)
+    assert flow.version == version + 3
+    assert flow.to_dict()["Payload"]["Flow"][1] == entry.data
+
+    with pytest.raises(ValueError) as exc:
+        flow.remove_node(branch)
+    assert str(exc.value) == "Flow node `FL_4` not in flow."
+
+
+def test_flow_report():
+    nodes = [
+        {"ID": "BL_1", "Type": "Block"},
+        {"FlowID": "FL_4", "Type": "Group", "Flow": ["TEST"]},
+        {"FlowID": "FL_5", "ID": "BL_2", "Type": "Block"},
+    ]
+    data = {**FLOW, "Payload": {**FLOW["Payload"], "Flow": nodes}}
+    errors = []
+    flow = Flow(data, report=lambda error, data: errors.append((error, data)))
+    assert [n.flow_id for n in flow.iter_nodes()] == ["FL_4", "FL_5"]
+    assert flow.get_block_ids() == ["BL_2"]
+    assert [type(e) for e, _ in errors] == [FieldWrongType, FieldWrongType]
+    assert [d for _, d in errors] == [nodes[0], None]
+
+    errors.clear()
+    data = {**FLOW, "Payload": {**FLOW["Payload"], "Flow": []}}
+    assert Flow(data, report=lambda *args: errors.append(args)).get_nodes() == ()
+    assert [type(e) for e, _ in errors] == [FlowNotFound]
+
+
+def test_get_flow_node_class():
+    assert get_flow_node_class({"Type": 1}) is FlowNode
+    assert get_flow_node_class({"Type": "TEST"}) is FlowNode
+    assert get_flow_node_class({"Type": "Branch"}) is BranchNode
@@ -0,0 +1,329 @@
+import pytest
+from pyqsf.core.logic import DisplayEvaluator, LogicCompiler
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.responses import ResponseReader
+from pyqsf.core.simulation import PathSimulator
+from pyqsf.exceptions import LogicNotValid
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+def expression(left, operator, right=None, logic_type="Question", conjunction=None):
+    result = {
+        "LogicType": logic_type,
+        "LeftOperand": left,
+        "Operator": operator,
+        "Type": "Expression",
+    }
+    if right is not None:
+        result["RightOperand"] = right
+    if conjunction is not None:
+        result["Conjuction"] = conjunction
+    return result
+
+
+def logic(*groups):
+    result = {"Type": "BooleanExpression", "inPage": False}
+    for i, group in enumerate(groups):
+        result[str(i)] = {str(j): e for j, e in enumerate(group)}
+        result[str(i)]["Type"] = "If"
+    return result
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_logic_compiler_operators(template):
+    compiler = LogicCompiler(ResponseReader(QualtricsSurveyFile(template)))
+    label = QualtricsSurveyFile(template).get_question("QID2").choices["1"]["Display"]
+    chunk = {
+        "Q2": [label, None, "other", label],
+        "Q12": ["10", "abc", None, "5.0"],
+        "Segment": ["A", "B", None, "A"],
+    }
+
+    def run(*args, **kwargs):
+        return compiler.compile(expression(*args, **kwargs))(chunk)
+
+    assert run("q://QID2/SelectableChoice/1", "Selected") == [True, False, False, True]
+    assert run("q://QID2/SelectableChoice/1", "NotSelected") == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    entry = "q://QID12/ChoiceTextEntryValue"
+    assert run(entry, "EqualTo", "5") == [False, False, False, True]
+    assert run(entry, "NotEqualTo", "abc") == [True, False, True, True]
+    assert run(entry, "GreaterThan", "5") == [True, False, False, False]
+    assert run(entry, "GreaterThanOrEqual", "5") == [True, False, False, True]
+    assert run(entry, "LessThan", "10") == [False, False, False, True]
+    assert run(entry, "LessThanOrEqual", "10") == [True, False, False, True]
+    assert run(entry, "Contains", "b") == [False, True, False, False]
+    assert run(entry, "DoesNotContain", "b") == [True, False, True, True]
+    assert run(entry, "Empty") == [False, False, True, False]
+    assert run(entry, "NotEmpty") == [True, True, False, True]
+    assert run("Segment", "EqualTo", "A", logic_type="EmbeddedField") == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert run("Missing", "NotEmpty", logic_type="EmbeddedField") == [False] * 4
+
+    tree = logic(
+        [
+            expression("Segment", "EqualTo", "B", logic_type="EmbeddedField"),
+            expression(entry, "Empty", conjunction="Or"),
+            expression("q://QID2/SelectableChoice/1", "Selected", conjunction="And"),
+        ],
+        [expression(entry, "EqualTo", "5.0")],
+    )
+    assert compiler.compile(tree)(chunk) == [False, False, False, False]
+    tree["1"]["Conjuction"] = "Or"
+    assert compiler.compile(tree)(chunk) == [False, True, False, True]
+    assert compiler.compile(expression(entry, "Empty"))({}) == []
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        ("test", "Expected logic object."),
+        ({"Type": "BooleanExpression"}, "No expressions."),
+        (expression("q://QID2/SelectableChoice/1", "Displayed"), "Operator"),
+        (expression("q://QID2/SelectableChoice/1", "Selected", logic_type="X"), "X"),
+        (expression("QID2/SelectableChoice/1", "Selected"), "not valid"),
+        (expression("q://QID99/SelectableChoice/1", "Selected"), "not found"),
+        (expression("q://QID2/SelectableChoice/1", "EqualTo"), "EqualTo"),
+        (expression("q://QID2/Test/1", "Selected"), "not supported"),
+        (expression("q://QID12/ChoiceTextEntryValue", "LessThan", "a"), "number"),
+        (expression("q://QID12/ChoiceTextEntryValue", "Selected", "1"), "Selected"),
+    ],
+)
+def test_logic_compiler_not_valid(template, value, message):
+    compiler = LogicCompiler(ResponseReader(QualtricsSurveyFile(template)))
+    with pytest.raises(LogicNotValid) as exc:
+        compiler.compile(value)
+    assert message in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["needs_based_analytics.qsf"]),
+    indirect=True,
+)
+def test_logic_compiler_matrix(template, load_survey):
+    qsf = load_survey(template, QID2={"SubSelector": "MultipleAnswer"})
+    compiler = LogicCompiler(ResponseReader(qsf))
+    chunk = {"Q2_1": ["Extremely important", "Very important"], "Q3_1_2": [True, False]}
+    assert compiler.compile(expression("q://QID1/SelectableAnswer/1/1", "Selected"))(
+        chunk
+    ) == [True, False]
+    assert compiler.compile(expression("q://QID2/SelectableAnswer/1/2", "NotSelected"))(
+        chunk
+    ) == [False, True]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["brand_perceptions.qsf"]),
+    indirect=True,
+)
+def test_logic_compiler_multiple_answer(template):
+    compiler = LogicCompiler(ResponseReader(QualtricsSurveyFile(template)))
+    predicate = compiler.compile_skip(
+        {"ChoiceLocator": "q://QID1/SelectableChoice/2", "Condition": "Selected"}
+    )
+    assert predicate({"Q1_2": [True, False]}) == [True, False]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_display_evaluator(template, load_survey):
+    def skip(question_id, choice, destination):
+        return {
+            "ChoiceLocator": f"q://{question_id}/SelectableChoice/{choice}",
+            "Condition": "Selected",
+            "SkipToDestination": destination,
+        }
+
+    qsf = load_survey(
+        template,
+        QID3={
+            "DisplayLogic": logic(
+                [expression("q://QID2/SelectableChoice/1", "Selected")]
+            )
+        },
+        QID4={"SkipLogic": [skip("QID4", "5", "QID7"), skip("QID4", "4", "QID7")]},
+        QID8={"SkipLogic": [skip("QID8", "2", "ENDOFBLOCK")]},
+        QID9={"SkipLogic": [skip("QID9", "1", "ENDOFSURVEY")]},
+        QID10={
+            "DisplayLogic": logic(
+                [expression("Segment", "EqualTo", "A", logic_type="EmbeddedField")]
+            )
+        },
+    )
+    labels = {
+        q.question_id: {k: v["Display"] for k, v in q.choices.items()}
+        for q in qsf.questions
+        if isinstance(getattr(q, "choices", None), dict)
+    }
+    chunk = {
+        "Q2": [labels["QID2"]["1"], labels["QID2"]["2"], None],
+        "Q4": [labels["QID4"]["5"], None, labels["QID4"]["4"]],
+        "Q9": [None, labels["QID8"]["2"], None],
+        "Q10": [None, None, labels["QID9"]["1"]],
+        "Segment": ["A", "A", "B"],
+    }
+    shown = DisplayEvaluator(qsf, ResponseReader(qsf)).evaluate(chunk)
+    assert list(shown) == [q.question_id for q in qsf.questions]
+    assert shown["QID2"] == [True, True, True]
+    assert shown["QID3"] == [True, False, False]
+    assert shown["QID5"] == [False, True, False]
+    assert shown["QID11"] == [False, True, False]
+    assert shown["QID7"] == [True, True, True]
+    assert shown["QID9"] == [True, False, True]
+    assert shown["QID10"] == [True, False, False]
+    assert shown["QID12"] == [True, False, False]
+    assert DisplayEvaluator(qsf, ResponseReader(qsf)).evaluate({})["QID2"] == []
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_display_evaluator_branches(template, load_survey):
+    consent = expression("Consent", "EqualTo", "1", logic_type="EmbeddedField")
+
+    def flow(nodes):
+        return [
+            {
+                "Type": "Branch",
+                "FlowID": "FL_2",
+                "BranchLogic": logic([consent]),
+                "Flow": nodes,
+            },
+            {"Type": "Branch", "FlowID": "FL_3", "Flow": []},
+        ]
+
+    qsf = load_survey(template, flow=flow)
+    shown = DisplayEvaluator(qsf, ResponseReader(qsf)).evaluate({"Consent": ["1", "0"]})
+    assert shown["QID2"] == [True, False]
+
+    def twice(nodes):
+        return flow(nodes) + [
+            {
+                "Type": "Branch",
+                "FlowID": "FL_4",
+                "BranchLogic": logic([{**consent, "RightOperand": "2"}]),
+                "Flow": [{**nodes[0], "FlowID": "FL_5"}],
+            }
+        ]
+
+    qsf = load_survey(template, flow=twice)
+    shown = DisplayEvaluator(qsf, ResponseReader(qsf)).evaluate(
+        {"Consent": ["1", "0", "2"]}
+    )
+    assert shown["QID2"] == [True, False, True]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+@pytest.mark.parametrize("randomized", [False, True])
+def test_display_evaluator_end_survey(template, load_survey, randomized):
+    def blocks(payload):
+        block = payload["41"]
+        elements = block["BlockElements"]
+        index = elements.index({"QuestionID": "QID3", "Type": "Question"})
+        new = {**block, "ID": "BL_new", "BlockElements": elements[index:]}
+        return {
+            **payload,
+            "41": {**block, "BlockElements": elements[:index]},
+            "42": new,
+        }
+
+    def flow(nodes):
+        new = {"Type": "Standard", "ID": "BL_new", "FlowID": "FL_4"}
+        if randomized:
+            new = {
+                "Type": "BlockRandomizer",
+                "FlowID": "FL_5",
+                "SubSet": 1,
+                "Flow": [new],
+            }
+        screen_out = {
+            "Type": "Branch",
+            "FlowID": "FL_2",
+            "BranchLogic": logic(
+                [expression("q://QID2/SelectableChoice/1", "Selected")]
+            ),
+            "Flow": [{"Type": "EndSurvey", "FlowID": "FL_3"}],
+        }
+        return nodes + [screen_out, new]
+
+    qsf = load_survey(template, flow=flow, blocks=blocks)
+    shown = DisplayEvaluator(qsf, ResponseReader(qsf)).evaluate(
+        {"Q2": ["Better base salary in new role", "Career change"]}
+    )
+    assert shown["QID2"] == [True, True]
+    assert shown["QID3"] == [False, True]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_display_evaluator_unsupported(template, load_survey):
+    displayed = expression("q://QID2/SelectableChoice/1", "Displayed")
+    skip = {
+        "ChoiceLocator": "q://QID4/SelectableChoice/5",
+        "Condition": "Displayed",
+        "SkipToDestination": "ENDOFSURVEY",
+    }
+
+    def flow(nodes):
+        return [
+            {
+                "Type": "Branch",
+                "FlowID": "FL_2",
+                "BranchLogic": logic([displayed]),
+                "Flow": nodes,
+            }
+        ]
+
+    qsf = load_survey(
+        template,
+        flow=flow,
+        QID3={"DisplayLogic": logic([displayed])},
+        QID4={"SkipLogic": [skip]},
+    )
+    evaluator = DisplayEvaluator(qsf, ResponseReader(qsf))
+    assert [type(d.error) for d in evaluator.diagnostics] == [LogicNotValid] * 3
+    assert [d.data for d in evaluator.diagnostics[:2]] == [
+        qsf.get_question("QID3").data,
+        qsf.get_question("QID4").data,
+    ]
+    assert evaluator.diagnostics[2].data["FlowID"] == "FL_2"
+    shown = evaluator.evaluate({"Q2": [None, None], "Q4": ["x", None]})
+    assert all(mask == [True, True] for mask in shown.values())
+
+    simulator = PathSimulator(qsf, seed=1)
+    assert len(simulator.simulate(10).pages) == 10
@@ -1,3 +1,7 @@
+import asyncio
+import io
+import json
+from pathlib import Path
 import pytest
 from pyqsf.core.qsf import (
     QualtricsSurveyFile,
@@ -5,9 +9,12 @@ from pyqsf.core.qsf import (
     QSFNotValid,
     QuestionNotFound,
     ElementTypeNotFound,
+    SurveyFileFields,
 )
-from pyqsf.core.question import Question
-from pyqsf.core.block import BlockEntry
+from pyqsf.exceptions import BlockEntryNotFound, FieldWrongType, QuestionTypeNotFound
+from pyqsf.core.question import Question, MCQuestion
+from pyqsf.core.block import BlockEntry, PageBreak
+from pyqsf.core.page import Page
 
 
 @pytest.fixture
@@ -106,3 +113,490 @@ def test_survey_element_not_found(template):
     with pytest.raises(ElementTypeNotFound) as exc:
         QualtricsSurveyFile(template)
     assert str(exc.value) == "Survey Element of type `TEST` not recognized."
+
+    data = json.loads(Path(template).read_text())
+    for element in data["SurveyElements"]:
+        if element["Element"] == "TEST":
+            del element["Element"]
+    with pytest.raises(ElementTypeNotFound) as exc:
+        QualtricsSurveyFile.from_dict(data)
+    assert str(exc.value) == "Survey Element of type `None` not recognized."
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_get_question(template):
+    qsf = QualtricsSurveyFile(template)
+    for question in qsf.questions:
+        assert qsf.get_question(question.question_id) is question
+    with pytest.raises(QuestionNotFound):
+        qsf.get_question("TEST")
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_get_block(template):
+    qsf = QualtricsSurveyFile(template)
+    for block in qsf.blocks:
+        assert qsf.get_block(block.id) is block
+    with pytest.raises(BlockEntryNotFound):
+        qsf.get_block("TEST")
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_questions_typed_once(template):
+    qsf = QualtricsSurveyFile(template)
+    question = qsf.get_question("QID2")
+    assert isinstance(question, MCQuestion)
+    assert qsf.questions[qsf.questions.index(question)] is question
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_question_type_not_found(template):
+    data = json.loads(Path(template).read_text(encoding="UTF-8"))
+    for element in data["SurveyElements"]:
+        if element["Element"] == "SQ" and element["Payload"]["QuestionID"] == "QID1":
+            element["Payload"]["QuestionType"] = "TEST"
+    Path(template).write_text(json.dumps(data), encoding="UTF-8")
+    with pytest.raises(QuestionTypeNotFound) as exc:
+        QualtricsSurveyFile(template)
+    assert str(exc.value) == "Question type `TEST` not found"
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_question_id_wrong_type(template):
+    data = json.loads(Path(template).read_text(encoding="UTF-8"))
+    for element in data["SurveyElements"]:
+        if element["Element"] == "SQ" and element["Payload"]["QuestionID"] == "QID2":
+            element["Payload"]["QuestionID"] = 2
+    Path(template).write_text(json.dumps(data), encoding="UTF-8")
+    with pytest.raises(FieldWrongType):
+        QualtricsSurveyFile(template)
+    with pytest.raises(QuestionNotFound):
+        QualtricsSurveyFile(template, validation="off")
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_tolerant(template, lazy):
+    data = json.loads(Path(template).read_text(encoding="UTF-8"))
+    for element in data["SurveyElements"]:
+        if element["Element"] == "SQ":
+            payload = element["Payload"]
+            if payload["QuestionID"] == "QID1":
+                payload["QuestionType"] = "TEST"
+            elif payload["QuestionID"] == "QID2":
+                payload["QuestionID"] = 2
+            elif payload["QuestionID"] == "QID3":
+                payload["Configuration"] = []
+        if element["Element"] == "FL":
+            flow = element["Payload"]["Flow"]
+            flow.append({"Type": "Block", "ID": "TEST", "FlowID": "FL_1"})
+    unknown = {"SurveyID": "SV_1", "Element": "TEST", "PrimaryAttribute": "Test"}
+    data["SurveyElements"].append(unknown)
+
+    qsf = QualtricsSurveyFile.from_dict(data, tolerant=True, lazy=lazy)
+    _ = qsf.questions
+    assert sorted(type(d.error).__name__ for d in qsf.diagnostics) == [
+        "BlockEntryNotFound",
+        "ElementTypeNotFound",
+        "FieldWrongType",
+        "FieldWrongType",
+        "QuestionNotFound",
+        "QuestionTypeNotFound",
+    ]
+    diagnostic = qsf.diagnostics[1]
+    assert diagnostic.data is unknown
+    assert str(diagnostic) == "Survey Element of type `TEST` not recognized."
+    assert repr(diagnostic) == f"Diagnostic(ElementTypeNotFound: {diagnostic})"
+    assert [e.element for e in qsf.unknown_elements] == ["TEST"]
+
+    assert [q.question_id for q in qsf.questions][:3] == ["QID21", "QID1", "QID3"]
+    assert type(qsf.get_question("QID1")) is Question
+    assert type(qsf.get_question("QID3")) is Question
+    assert qsf.get_question("QID3").configuration == []
+    assert len(qsf.get_block_questions(qsf.blocks[0].id)) == 12
+    assert json.loads(qsf.dumps())["SurveyElements"][-1] == unknown
+
+    with pytest.raises(FieldWrongType):
+        QualtricsSurveyFile.from_dict(data)
+    assert QualtricsSurveyFile(template).diagnostics == ()
+
+
+def break_survey(data, case):
+    elements = data["SurveyElements"]
+    flow, blocks = (
+        next(e for e in elements if e["Element"] == k) for k in ("FL", "BL")
+    )
+    question = next(e for e in elements if e["PrimaryAttribute"] == "QID3")
+    if case == "no flow":
+        elements.remove(flow)
+    elif case == "no flow payload":
+        del flow["Payload"]
+    elif case == "no question payload":
+        del question["Payload"]
+    elif case == "question payload list":
+        question["Payload"] = []
+    elif case == "question payload str":
+        question["Payload"] = "TEST"
+    elif case == "element type":
+        elements.append("TEST")
+    elif case == "entry type":
+        data["SurveyEntry"] = ["TEST"]
+    elif case == "no blocks":
+        elements.remove(blocks)
+    elif case == "flow id":
+        flow["Payload"]["Flow"].append({"ID": "BL_1", "Type": "Standard"})
+    elif case == "block element":
+        blocks["Payload"]["41"]["BlockElements"].append({"Type": 1})
+        blocks["Payload"]["42"] = "TEST"
+    else:
+        data["SurveyEntry"]["SurveyName"] = 1
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "case, messages, questions",
+    [
+        ("no flow", ["Reason: Flow not present."], 0),
+        ("no blocks", ["Reason: Blocks not present.", "`BL_2l7KwScnz3ImHpb`"], 0),
+        ("flow id", ["`FlowID` wrong type."], 13),
+        ("block element", ["`Type` wrong type.", "`Payload` wrong type."], 13),
+        ("entry", ["`SurveyName` wrong type."], 13),
+        ("no flow payload", ["Flow field `Payload` wrong type."], 0),
+        ("no question payload", ["Question field `Payload`", "`QID3`"], 12),
+        ("question payload list", ["Question field `Payload`", "`QID3`"], 12),
+        ("question payload str", ["Question field `Payload`", "`QID3`"], 12),
+        ("element type", ["field `SurveyElements` wrong type."], 13),
+        ("entry type", ["field `SurveyEntry` wrong type."], 13),
+    ],
+)
+def test_tolerant_structure(template, case, messages, questions):
+    data = json.loads(Path(template).read_text(encoding="UTF-8"))
+    break_survey(data, case)
+    qsf = QualtricsSurveyFile.from_dict(data, tolerant=True)
+    assert len(qsf.diagnostics) == len(messages)
+    for diagnostic, message in zip(qsf.diagnostics, messages):
+        assert message in str(diagnostic)
+    assert len(qsf.questions) == questions
+    assert qsf.get_question("QID2").question_id == "QID2"
+
+    with pytest.raises((QSFNotValid, FieldWrongType)) as exc:
+        QualtricsSurveyFile.from_dict(data)
+    assert messages[0] in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_lazy(template):
+    eager = QualtricsSurveyFile(template)
+    qsf = QualtricsSurveyFile(template, lazy=True)
+    assert qsf._questions == {}
+    assert qsf._structure is None
+    assert qsf.entry.survey_name == eager.entry.survey_name
+    assert qsf.entry is qsf.entry
+
+    question = qsf.get_question("QID2")
+    assert isinstance(question, MCQuestion)
+    assert qsf.get_question("QID2") is question
+    assert list(qsf._questions) == ["QID2"]
+    with pytest.raises(QuestionNotFound):
+        qsf.get_question("TEST")
+
+    block = qsf.get_block(eager.blocks[0].id)
+    assert block.id == eager.blocks[0].id
+    assert qsf._structure is None
+
+    assert [q.question_id for q in qsf.questions] == [
+        q.question_id for q in eager.questions
+    ]
+    assert qsf.get_question("QID2") in qsf.questions
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_questions_blocks_cached(template):
+    qsf = QualtricsSurveyFile(template)
+    assert isinstance(qsf.questions, tuple)
+    assert isinstance(qsf.blocks, tuple)
+    assert qsf.questions is qsf.questions
+    assert qsf.blocks is qsf.blocks
+    assert tuple(qsf.iter_questions()) == qsf.questions
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_pages(template):
+    data = json.loads(Path(template).read_text(encoding="UTF-8"))
+    for element in data["SurveyElements"]:
+        if element["Element"] == "BL":
+            elements = element["Payload"]["41"]["BlockElements"]
+            elements.insert(2, {"Type": "Page Break"})
+            elements.append({"Type": "Custom"})
+    qsf = QualtricsSurveyFile.from_dict(data)
+    assert len(qsf.pages) == 12
+    assert qsf.pages is qsf.pages
+    page = qsf.pages[0]
+    assert isinstance(page, Page)
+    assert page.index == 0
+    assert page.block is qsf.blocks[0]
+    assert [q.question_id for q in page] == ["QID21", "QID1"]
+    assert len(page) == 2
+    for index, page in enumerate(qsf.pages):
+        assert page.index == index
+        for question in page:
+            assert qsf.page_of(question.question_id) is page
+    assert [len(p) for p in qsf.pages] == [2] + [1] * 11
+    with pytest.raises(QuestionNotFound):
+        qsf.page_of("TEST")
+
+    elements = qsf._get_structure()[qsf.blocks[0]]
+    breaks = [e for e in elements if isinstance(e, PageBreak)]
+    assert len(breaks) == 12
+    assert all(e is PageBreak() for e in breaks)
+    assert elements[-1].type == "Custom"
+
+    lazy = QualtricsSurveyFile(template, lazy=True)
+    assert lazy.page_of("QID2").index == 1
+    assert len(lazy.pages) == 12
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_flow(template):
+    qsf = QualtricsSurveyFile(template)
+    assert [b.id for b in qsf.flow.iter_blocks()] == [b.id for b in qsf.blocks]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_flow_edit(template):
+    qsf = QualtricsSurveyFile(template)
+    questions, blocks, table = qsf.questions, qsf.blocks, qsf.question_table()
+    assert len(qsf.pages) == 12
+    (node,) = qsf.flow.get_nodes()
+    qsf.flow.remove_node(node)
+    assert qsf.questions == qsf.blocks == qsf.pages == ()
+    assert len(qsf.question_table()) == 0
+
+    qsf.flow.insert_node(0, node)
+    assert qsf.questions == questions and qsf.questions is not questions
+    assert qsf.blocks == blocks
+    assert len(qsf.question_table()) == len(table)
+    assert qsf.page_of("QID2").index == 1
+
+
+@pytest.mark.parametrize(
+    "template",
+    (
+        [
+            "brand_perceptions.qsf",
+            "customer_service_contact_center.qsf",
+            "employee_exit_interview.qsf",
+            "needs_based_analytics.qsf",
+            "pricing_study.qsf",
+            "transactional_effort_customer_score.qsf",
+        ]
+    ),
+    indirect=True,
+)
+def test_stream(template):
+    eager = QualtricsSurveyFile(template)
+    qsf = QualtricsSurveyFile(template, stream=True)
+    assert qsf.entry.data == eager.entry.data
+    assert [b.id for b in qsf.blocks] == [b.id for b in eager.blocks]
+    assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+    assert SurveyFileFields.SURVEY_ELEMENTS.value not in qsf._json
+
+
+@pytest.mark.parametrize(
+    "template, message",
+    [
+        ("test.qsf", None),
+        ("corrupted.qsf", "Cannot load JSON."),
+        ("no_survey_entry.qsf", "SurveyEntry not present."),
+        ("no_survey_elements.qsf", "SurveyElements not present."),
+    ],
+    indirect=["template"],
+)
+def test_stream_not_valid(template, message):
+    if message is None:
+        with pytest.raises(FileNotFound):
+            QualtricsSurveyFile(template, stream=True)
+        return
+    with pytest.raises(QSFNotValid) as exc:
+        QualtricsSurveyFile(template, stream=True)
+    assert str(exc.value) == f"Provided QSF file is not valid. Reason: {message}"
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_alternative_sources(template):
+    eager = QualtricsSurveyFile(template)
+    content = Path(template).read_bytes()
+    data = json.loads(content)
+    sources = [
+        QualtricsSurveyFile.from_bytes(content),
+        QualtricsSurveyFile.from_bytes(bytearray(content), lazy=True),
+        QualtricsSurveyFile.from_dict(data),
+        QualtricsSurveyFile.from_fileobj(io.BytesIO(content)),
+        QualtricsSurveyFile.from_fileobj(io.StringIO(content.decode("UTF-8"))),
+        QualtricsSurveyFile.from_fileobj(io.BytesIO(content), stream=True),
+        QualtricsSurveyFile.from_fileobj(
+            io.StringIO(content.decode("UTF-8")), stream=True
+        ),
+        QualtricsSurveyFile.from_mmap(template),
+        QualtricsSurveyFile.from_mmap(template, lazy=True),
+    ]
+    for qsf in sources:
+        assert qsf.entry.data == eager.entry.data
+        assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"[]", b'{"SurveyEntry": 1', b"\xff\xfe\xfa"],
+)
+def test_alternative_sources_not_valid(tmpdir, content):
+    path = tmpdir.join("invalid.qsf")
+    Path(path).write_bytes(content)
+    loaders = [
+        lambda: QualtricsSurveyFile.from_bytes(content),
+        lambda: QualtricsSurveyFile.from_fileobj(io.BytesIO(content)),
+        lambda: QualtricsSurveyFile.from_fileobj(io.BytesIO(content), stream=True),
+        lambda: QualtricsSurveyFile.from_mmap(path),
+    ]
+    for loader in loaders:
+        with pytest.raises(QSFNotValid) as exc:
+            loader()
+        assert str(exc.value).endswith("Reason: Cannot load JSON.")
+
+
+def test_from_dict_not_valid():
+    with pytest.raises(QSFNotValid) as exc:
+        QualtricsSurveyFile.from_dict({"SurveyEntry": {}})
+    assert str(exc.value).endswith("Reason: SurveyEntry not present.")
+
+
+def test_from_mmap_file_not_found(tmpdir):
+    with pytest.raises(FileNotFound):
+        QualtricsSurveyFile.from_mmap(tmpdir.join("test.qsf"))
+
+
+@pytest.mark.parametrize("backend", ["auto", "json", "orjson"])
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf", "corrupted.qsf"]),
+    indirect=True,
+)
+def test_backend(template, backend):
+    content = Path(template).read_bytes()
+    if template.basename == "corrupted.qsf":
+        with pytest.raises(QSFNotValid) as exc:
+            QualtricsSurveyFile(template, backend=backend)
+        assert str(exc.value).endswith("Reason: Cannot load JSON.")
+        with pytest.raises(QSFNotValid):
+            QualtricsSurveyFile.from_bytes(content, backend=backend)
+        return
+    eager = QualtricsSurveyFile(template, backend="json")
+    for qsf in (
+        QualtricsSurveyFile(template, backend=backend),
+        QualtricsSurveyFile.from_bytes(content, backend=backend),
+        QualtricsSurveyFile.from_fileobj(io.BytesIO(content), backend=backend),
+    ):
+        assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_aload(template):
+    eager = QualtricsSurveyFile(template)
+    qsf = asyncio.run(QualtricsSurveyFile.aload(template, backend="json"))
+    assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+    with pytest.raises(FileNotFound):
+        asyncio.run(QualtricsSurveyFile.aload(Path(template).parent / "test.qsf"))
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_keep_data(template, lazy):
+    eager = QualtricsSurveyFile(template)
+    qsf = QualtricsSurveyFile(template, lazy=lazy, keep_data=False)
+    assert qsf.entry.survey_name == eager.entry.survey_name
+    assert [q.question_text for q in qsf.questions] == [
+        q.question_text for q in eager.questions
+    ]
+    assert qsf._json == {}
+    assert qsf.entry.data is None
+    for question in qsf.questions:
+        assert question.data is None
+        assert question.payload is None
+    for block in qsf.blocks:
+        assert block.data is None
+        assert all(element.data is None for element in block.elements)
+    assert qsf.flow.data is None
+    assert all(node.data is None for node in qsf.flow.iter_nodes())
+
+
+@pytest.mark.parametrize("validation", ["strict", "fast", "off"])
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_validation(template, validation):
+    eager = QualtricsSurveyFile(template)
+    qsf = QualtricsSurveyFile(template, validation=validation)
+    assert [q.data for q in qsf.questions] == [q.data for q in eager.questions]
+    assert all(q._level.value == validation for q in qsf.questions)
@@ -2,6 +2,7 @@ import pytest
 import json
 from pathlib import Path
 from pyqsf.core.question import (
+    QUESTION_TYPES,
     Question,
     QuestionField,
     QuestionType,
@@ -11,8 +12,18 @@ from pyqsf.core.question import (
     DBQuestion,
     MCQuestion,
     MCQuestionField,
+    MatrixQuestionField,
+    SideBySideQuestion,
+    SliderQuestion,
+    get_question_class,
+    register_question_type,
+)
+from pyqsf.core.validation import ValidationLevel
+from pyqsf.exceptions import (
+    FieldNotValid,
+    FieldWrongType,
+    QuestionTypeNotFound,
 )
-from pyqsf.exceptions import FlowNotFound, FieldWrongType, QuestionTypeNotFound
 
 
 @pytest.fixture
@@ -30,9 +41,8 @@ def test_question_init(question_example):
     data = question_example
     question = Question(data)
     for field in QuestionField:
-        assert (
-            question.__getattribute__(field.name.lower())
-            == data["Payload"][field.value]
+        assert question.__getattribute__(field.name.lower()) == data["Payload"].get(
+            field.value
         )
 
 
@@ -61,9 +71,8 @@ def test_mc_question(question_example):
     data = question_example
     mc_question = MCQuestion(data)
     for field in MCQuestionField:
-        assert (
-            mc_question.__getattribute__(field.name.lower())
-            == data["Payload"][field.value]
+        assert mc_question.__getattribute__(field.name.lower()) == data["Payload"].get(
+            field.value
         )
 
 
@@ -107,6 +116,8 @@ def test_question_return_mc_question(question_example):
 def test_question_return_te_question(question_example):
     question = QuestionFactory(QuestionType.TE.value, question_example)
     assert isinstance(question, TEQuestion)
+    assert question.search_source == question_example["Payload"]["SearchSource"]
+    assert question.default_choices is None
 
 
 @pytest.mark.parametrize(
@@ -117,6 +128,11 @@ def test_question_return_te_question(question_example):
 def test_question_return_question_question(question_example):
     question = QuestionFactory(QuestionType.MATRIX.value, question_example)
     assert isinstance(question, MatrixQuestion)
+    for field in MatrixQuestionField:
+        assert (
+            question.__getattribute__(field.name.lower())
+            == question_example["Payload"][field.value]
+        )
 
 
 @pytest.mark.parametrize(
@@ -127,3 +143,143 @@ def test_question_return_question_question(question_example):
 def test_question_return_db_question(question_example):
     question = QuestionFactory(QuestionType.DB.value, question_example)
     assert isinstance(question, DBQuestion)
+    assert question.choice_order == []
+    assert question.graphics is None
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_get_question_class(question_example):
+    assert get_question_class(question_example) is MatrixQuestion
+    payload = {**question_example["Payload"], "QuestionType": "TEST"}
+    assert get_question_class({**question_example, "Payload": payload}) is Question
+    payload = {**question_example["Payload"], "QuestionType": 1}
+    assert get_question_class({**question_example, "Payload": payload}) is Question
+    assert get_question_class({**question_example, "Payload": None}) is Question
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_question_validation_levels(question_example):
+    payload = {**question_example["Payload"], "NextChoiceId": True}
+    data = {**question_example, "Payload": payload}
+    assert isinstance(MCQuestion(data, "fast"), MCQuestion)
+    with pytest.raises(FieldWrongType):
+        MCQuestion(data, ValidationLevel.STRICT)
+
+    payload = {**question_example["Payload"], "QuestionText": None}
+    data = {**question_example, "Payload": payload}
+    assert MCQuestion(data, "off").question_text is None
+    with pytest.raises(FieldWrongType):
+        MCQuestion(data)
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_question_strict_question_id(question_example):
+    assert isinstance(Question(question_example, "strict"), Question)
+    data = {**question_example, "PrimaryAttribute": "QID2"}
+    assert isinstance(Question(data), Question)
+    with pytest.raises(FieldNotValid) as exc:
+        Question(data, "strict")
+    assert str(exc.value) == (
+        "Question field `QuestionID` not valid. "
+        "Expected to match PrimaryAttribute `QID2`."
+    )
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_mc_question_strict_choice_order(question_example):
+    payload = {**question_example["Payload"], "ChoiceOrder": [1, "2", 4]}
+    data = {**question_example, "Payload": payload}
+    assert isinstance(MCQuestion(data), MCQuestion)
+    with pytest.raises(FieldNotValid) as exc:
+        MCQuestion(data, "strict")
+    assert str(exc.value) == (
+        "MC Question field `ChoiceOrder` not valid. Choices `[4]` not found."
+    )
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["question_types.json"]),
+    indirect=True,
+)
+def test_question_types(question_example):
+    assert {QuestionType(e["Payload"]["QuestionType"]) for e in question_example} == (
+        set(QuestionType)
+        - {QuestionType.MC, QuestionType.DB, QuestionType.TE, QuestionType.MATRIX}
+    )
+    for data in question_example:
+        payload = data["Payload"]
+        question = QuestionFactory(payload["QuestionType"], data, "strict")
+        assert type(question) is QUESTION_TYPES[payload["QuestionType"]]
+        assert question.schema
+        for attr, key, _, _ in question.schema:
+            assert getattr(question, attr) == payload.get(key)
+        assert question.to_dict() == data
+
+    slider = QuestionFactory("Slider", question_example[0])
+    assert isinstance(slider, SliderQuestion)
+    assert slider.labels["2"] == {"Display": "Likely"}
+    side_by_side = QuestionFactory("SBS", question_example[2])
+    assert isinstance(side_by_side, SideBySideQuestion)
+    assert side_by_side.number_of_questions == 1
+    assert side_by_side.additional_questions["1"]["AnswerOrder"] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["question_types.json"]),
+    indirect=True,
+)
+def test_question_types_field_wrong_type(question_example):
+    payload = {**question_example[1]["Payload"], "Choices": None}
+    data = {**question_example[1], "Payload": payload}
+    with pytest.raises(FieldWrongType) as exc:
+        QuestionFactory("RO", data)
+    assert str(exc.value) == (
+        "Rank Order Question field `Choices` wrong type. "
+        "Expected `(<class 'dict'>, <class 'list'>)`, got `<class 'NoneType'>`."
+    )
+
+
+@pytest.mark.parametrize(
+    "question_example",
+    (["mc_question.json"]),
+    indirect=True,
+)
+def test_register_question_type(question_example, monkeypatch):
+    monkeypatch.setattr("pyqsf.core.question.QUESTION_TYPES", dict(QUESTION_TYPES))
+
+    class CustomQuestion(Question):
+        __slots__ = ("choices",)
+        kind = "Custom Question"
+        schema = (("choices", "Choices", (dict, list), True),)
+
+    register_question_type("Custom", CustomQuestion)
+    payload = {**question_example["Payload"], "QuestionType": "Custom"}
+    data = {**question_example, "Payload": payload}
+    assert get_question_class(data) is CustomQuestion
+    question = QuestionFactory("Custom", data)
+    assert question.choices == payload["Choices"]
+    assert question.to_dict() == data
+
+    register_question_type(QuestionType.MC.value, CustomQuestion)
+    assert isinstance(QuestionFactory("MC", question_example), CustomQuestion)
+    with pytest.raises(TypeError) as exc:
+        register_question_type("Custom", dict)
+    assert str(exc.value) == "Expected Question subclass, got `<class 'dict'>`."
@@ -0,0 +1,60 @@
+import io
+import json
+import pytest
+from pyqsf.core.reader import iter_qsf
+from pyqsf.exceptions import QSFNotValid
+
+
+DOCUMENT = {
+    "SurveyEntry": {"SurveyID": "SV_test123abc", "SurveyName": "Test"},
+    "SurveyElements": [
+        {"Element": "BL", "Payload": [1, 2.5, -3e2, True, None]},
+        {"Element": "SQ", "Payload": {"QuestionText": "Ünïcödé \"quoted\""}},
+    ],
+    "Count": 12345,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_qsf(chunk_size, indent):
+    text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+    result = list(iter_qsf(io.StringIO(text), "SurveyElements", chunk_size))
+    assert result == [
+        ("SurveyEntry", DOCUMENT["SurveyEntry"]),
+        ("SurveyElements", DOCUMENT["SurveyElements"][0]),
+        ("SurveyElements", DOCUMENT["SurveyElements"][1]),
+        ("Count", 12345),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("{}", []),
+        ('{"SurveyElements": []}', []),
+        ('{"SurveyElements": null}', [("SurveyElements", None)]),
+    ],
+)
+def test_iter_qsf_empty(text, expected):
+    assert list(iter_qsf(io.StringIO(text), "SurveyElements", 2)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[]",
+        '{"SurveyEntry": {}',
+        '{"SurveyEntry" {}}',
+        '{"SurveyElements": [{}, ]}',
+        '{"SurveyElements": [{} {}]}',
+        '{1: {}}',
+        '{"SurveyEntry": {}} {}',
+        '{"SurveyEntry": tru}',
+    ],
+)
+def test_iter_qsf_not_valid(text):
+    with pytest.raises(QSFNotValid) as exc:
+        list(iter_qsf(io.StringIO(text), "SurveyElements", 2))
+    assert str(exc.value) == "Provided QSF file is not valid. Reason: Cannot load JSON."
@@ -0,0 +1,196 @@
+import io
+import json
+from pathlib import Path
+import pytest
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.responses import ColumnKind, ResponseReader
+from pyqsf.exceptions import FileNotFound
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+def qsf_choices(template, question_id):
+    data = json.loads(Path(template).read_text(encoding="utf-8-sig"))
+    for element in data["SurveyElements"]:
+        if element.get("PrimaryAttribute") == question_id:
+            return element["Payload"]["Choices"]
+
+
+def export(*rows):
+    return "\n".join(",".join(row) for row in rows) + "\n"
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["customer_service_contact_center.qsf"]),
+    indirect=True,
+)
+def test_response_reader_single_choice(template, tmpdir, load_survey):
+    qsf = load_survey(
+        template,
+        QID28={
+            "RecodeValues": {"1": "7", "7": "1"},
+            "Choices": {
+                **qsf_choices(template, "QID28"),
+                "8": {"Display": "Other", "TextEntry": "true"},
+            },
+        },
+    )
+    reader = ResponseReader(qsf)
+    assert reader.get_column("Q2").kind is ColumnKind.CHOICE
+    assert reader.get_column("Q2").question is qsf.get_question("QID28")
+    assert reader.get_column("Q2_8_TEXT").choice == "8"
+    assert reader.get_column("Q8").kind is ColumnKind.TEXT
+    assert reader.get_column("StartDate").kind is ColumnKind.METADATA
+
+    path = tmpdir.join("responses.csv")
+    path.write(
+        export(
+            ["StartDate", "Q2", "Q2_8_TEXT", "Q7", "Q8"],
+            ["Start Date", "How satisfied", "Other", "Recommend", "Comments"],
+            ['{"ImportId":"startDate"}', "{}", "{}", "{}", "{}"],
+            ["2024-01-01", "7", "", "10", "Great"],
+            ["2024-01-02", "2", "", "0", ""],
+            ["2024-01-03", "Extremely dissatisfied", "text", "", "Bad"],
+            ["2024-01-04", "99"],
+        )
+    )
+    chunks = list(reader.read(str(path), chunk_size=3))
+    assert len(chunks) == 2
+    assert chunks[0] == {
+        "StartDate": ["2024-01-01", "2024-01-02", "2024-01-03"],
+        "Q2": [
+            "Extremely satisfied",
+            "Moderately satisfied",
+            "Extremely dissatisfied",
+        ],
+        "Q2_8_TEXT": [None, None, "text"],
+        "Q7": ["10", "0", None],
+        "Q8": ["Great", None, "Bad"],
+    }
+    assert chunks[1] == {
+        "StartDate": ["2024-01-04"],
+        "Q2": [None],
+        "Q2_8_TEXT": [None],
+        "Q7": [None],
+        "Q8": [None],
+    }
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["customer_service_contact_center.qsf"]),
+    indirect=True,
+)
+def test_response_reader_scale_codes(template, load_survey):
+    # 0-10 scale with choice IDs 1-11, labels that look like other codes
+    qsf = load_survey(
+        template,
+        QID3={
+            "Choices": {str(i + 1): {"Display": str(i)} for i in range(11)},
+            "ChoiceOrder": list(range(1, 12)),
+        },
+    )
+    rows = export(["Q7"], ["Recommend"], ["{}"], ["1"], ["2"], ["11"], ["0"])
+    chunk = next(ResponseReader(qsf).read(io.StringIO(rows)))
+    assert chunk["Q7"] == ["0", "1", "10", "0"]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["brand_perceptions.qsf"]),
+    indirect=True,
+)
+def test_response_reader_multiple_answer(template, tmpdir):
+    reader = ResponseReader(QualtricsSurveyFile(template))
+    column = reader.get_column("Q1_2")
+    assert column.kind is ColumnKind.SELECTED
+    assert column.choice == "2"
+
+    path = tmpdir.join("responses.tsv")
+    path.write("Q1_1\tQ1_2\tQ4\n1\t\tnice\n\tApple\t\n")
+    assert list(reader.read(str(path), skip_rows=0)) == [
+        {"Q1_1": [True, False], "Q1_2": [False, True], "Q4": ["nice", None]}
+    ]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["brand_perceptions.qsf"]),
+    indirect=True,
+)
+def test_response_reader_multiple_answer_export_tags(template, load_survey):
+    qsf = load_survey(template, QID1={"ChoiceDataExportTags": {"1": "apple"}})
+    assert qsf.get_question("QID1").choice_table.get_export_tag("1") == "apple"
+    reader = ResponseReader(qsf)
+    assert reader.get_column("apple").kind is ColumnKind.SELECTED
+    assert reader.get_column("apple").choice == "1"
+    assert reader.get_column("Q1_1").kind is ColumnKind.METADATA
+    assert list(reader.read(io.StringIO("apple,Q1_2\n1,\n"), skip_rows=0)) == [
+        {"apple": [True], "Q1_2": [False]}
+    ]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["needs_based_analytics.qsf"]),
+    indirect=True,
+)
+def test_response_reader_matrix(template, load_survey):
+    qsf = load_survey(
+        template,
+        QID1={"ChoiceDataExportTags": {"1": "feature_1"}},
+        QID2={
+            "SubSelector": "MultipleAnswer",
+            "Choices": {
+                "1": {"Display": "product feature 1"},
+                "2": {"Display": "Other", "TextEntry": True},
+            },
+        },
+    )
+    reader = ResponseReader(qsf)
+    assert reader.get_column("feature_1").kind is ColumnKind.ANSWER
+    assert reader.get_column("Q2_2").choice == "2"
+    assert reader.get_column("Q3_2_5").answer == "5"
+    assert reader.get_column("Q3_2_TEXT").kind is ColumnKind.TEXT
+
+    file = io.StringIO(
+        export(
+            ["feature_1", "Q2_2", "Q3_1_1", "Q3_2_TEXT"],
+            ["1", "Very important", "1", "other"],
+        )
+    )
+    assert list(reader.read(file, skip_rows=0)) == [
+        {
+            "feature_1": ["Extremely important"],
+            "Q2_2": ["Very important"],
+            "Q3_1_1": [True],
+            "Q3_2_TEXT": ["other"],
+        }
+    ]
+    assert list(reader.read(io.StringIO(""))) == []
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_response_reader_choice_list(template, load_survey):
+    qsf = load_survey(
+        template,
+        validation="off",
+        QID2={"DataExportTag": 2},
+        QID4={"Choices": "1"},
+    )
+    reader = ResponseReader(qsf)
+    assert reader.get_column("Q11").labels["0"] == "0"
+    assert reader.get_column("Q11").labels["10"] == "10"
+    assert reader.get_column("Q2").kind is ColumnKind.METADATA
+    assert reader.get_column("Q3").labels["1"]
+    assert reader.get_column("Q4").labels == {}
+    with pytest.raises(FileNotFound):
+        next(reader.read("test.csv"))
@@ -0,0 +1,67 @@
+import pytest
+from enum import Enum
+from pyqsf.core.element import ELEMENT_SCHEMA, Element, ElementField
+from pyqsf.core.flow import FLOW_ENTRY_SCHEMA, FLOW_NODE_SCHEMA, FlowEntry
+from pyqsf.core.schema import compile_schema, extract_fields
+from pyqsf.core.validation import ValidationLevel
+from pyqsf.exceptions import FieldWrongType
+
+
+class Target:
+    pass
+
+
+class TargetField(Enum):
+    FLAG = "Flag"
+
+
+def test_compile_schema():
+    schema = compile_schema(
+        ("element", ElementField.ELEMENT, str),
+        ("payload", ElementField.PAYLOAD, (dict, list), False),
+    )
+    assert schema == (
+        ("element", "Element", str, True),
+        ("payload", "Payload", (dict, list), False),
+    )
+    assert ELEMENT_SCHEMA[0] == ("element", "Element", str, True)
+    assert FlowEntry.schema == FLOW_ENTRY_SCHEMA
+    assert FLOW_ENTRY_SCHEMA[: len(FLOW_NODE_SCHEMA)] == FLOW_NODE_SCHEMA
+
+
+@pytest.mark.parametrize(
+    "source, level, error",
+    [
+        ({"Element": 1}, ValidationLevel.OFF, False),
+        ({"Element": "SQ"}, ValidationLevel.FAST, False),
+        ({"Element": 1}, ValidationLevel.FAST, True),
+        ({"Element": "SQ", "Payload": 1}, ValidationLevel.FAST, False),
+        ({"Element": "SQ", "Payload": 1}, ValidationLevel.STRICT, True),
+        ({"Element": "SQ", "Flag": True}, ValidationLevel.STRICT, True),
+        ({"Element": "SQ", "Flag": 1}, ValidationLevel.STRICT, False),
+    ],
+)
+def test_extract_fields(source, level, error):
+    schema = compile_schema(
+        ("element", ElementField.ELEMENT, str),
+        ("payload", ElementField.PAYLOAD, (dict, list), False),
+        ("flag", TargetField.FLAG, (int, str), False),
+    )
+    target = Target()
+    if error:
+        with pytest.raises(FieldWrongType):
+            extract_fields(target, "Element", source, schema, level)
+    else:
+        extract_fields(target, "Element", source, schema, level)
+        assert target.element == source["Element"]
+        assert target.payload == source.get("Payload")
+        assert target.flag == source.get("Flag")
+
+
+def test_extract_fields_message():
+    with pytest.raises(FieldWrongType) as exc:
+        Element({"Element": 1})
+    assert (
+        str(exc.value)
+        == "Element field `Element` wrong type. Expected `<class 'str'>`, got `<class 'int'>`."
+    )
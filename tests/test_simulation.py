@@ -0,0 +1,150 @@
+import re
+import pytest
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.simulation import PathSimulator, estimate_seconds
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+def logic(left, operator, logic_type="Question", right=None):
+    expression = {
+        "LogicType": logic_type,
+        "LeftOperand": left,
+        "Operator": operator,
+        "Type": "Expression",
+    }
+    if right is not None:
+        expression["RightOperand"] = right
+    return {"0": {"0": expression, "Type": "If"}, "Type": "BooleanExpression"}
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_path_simulator(template):
+    qsf = QualtricsSurveyFile(template)
+    result = PathSimulator(qsf, seed=1).simulate(25, batch_size=10)
+    assert len(result) == 25
+    assert set(result.pages) == {12}
+    assert set(result.questions) == {11}
+    seconds = sum(estimate_seconds(q) for q in qsf.questions) + 12 * 2.0
+    assert set(result.seconds) == {seconds}
+    summary = result.summary()
+    assert summary["pages"] == {
+        "mean": 12.0,
+        "min": 12,
+        "p50": 12,
+        "p90": 12,
+        "p99": 12,
+        "max": 12,
+    }
+    assert summary["seconds"]["mean"] == pytest.approx(seconds)
+
+    result = PathSimulator(qsf, timer=lambda question: 1.0).simulate(3)
+    assert list(result.seconds) == [13.0 + 12 * 2.0] * 3
+    assert PathSimulator(qsf).simulate(0).summary()["pages"] == {}
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_path_simulator_flow(template, load_survey):
+    def flow(nodes):
+        return [
+            {
+                "Type": "Branch",
+                "FlowID": "FL_2",
+                "BranchLogic": logic("Segment", "EqualTo", "EmbeddedField", "A"),
+                "Flow": [
+                    {
+                        "Type": "BlockRandomizer",
+                        "FlowID": "FL_3",
+                        "SubSet": "1",
+                        "Flow": [
+                            {"Type": "EndSurvey", "FlowID": "FL_4"},
+                            {"Type": "Group", "FlowID": "FL_5", "Flow": []},
+                        ],
+                    },
+                    {
+                        "Type": "Randomizer",
+                        "FlowID": "FL_6",
+                        "SubSet": 2,
+                        "Flow": [
+                            {"Type": "Group", "FlowID": "FL_7", "Flow": []},
+                            {"Type": "Group", "FlowID": "FL_8", "Flow": []},
+                            {"Type": "Group", "FlowID": "FL_9", "Flow": []},
+                        ],
+                    },
+                    {
+                        "Type": "Randomizer",
+                        "FlowID": "FL_10",
+                        "SubSet": "all",
+                        "Flow": [{**nodes[0], "FlowID": "FL_11"}],
+                    },
+                ],
+            },
+            {"Type": "Branch", "FlowID": "FL_12", "Flow": []},
+        ]
+
+    qsf = load_survey(template, flow=flow)
+    simulator = PathSimulator(qsf, seed=7, values={"Segment": ["A", "B"]})
+    result = simulator.simulate(400)
+    assert set(result.pages) == {0, 12}
+    assert 0.15 < result.summary()["pages"]["mean"] / 12 < 0.35
+    assert set(PathSimulator(qsf, seed=7).simulate(10).pages) == {0}
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_path_simulator_logic(template, load_survey):
+    qsf = load_survey(
+        template,
+        QID1={"DisplayLogic": logic("q://QID2/SelectableChoice/2", "Selected")},
+        QID3={"DisplayLogic": logic("q://QID2/SelectableChoice/1", "Selected")},
+        QID4={"DisplayLogic": logic("q://QID3/SelectableChoice/1", "NotSelected")},
+        QID5={
+            "DisplayLogic": logic("q://QID12/ChoiceTextEntryValue", "NotEmpty"),
+        },
+    )
+    result = PathSimulator(qsf, seed=3).simulate(500)
+    assert set(result.questions) == {9, 10}
+    assert set(result.pages) == {10, 11}
+    assert result.summary()["questions"]["p99"] == 10
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["brand_perceptions.qsf"]),
+    indirect=True,
+)
+def test_path_simulator_multiple_answer(template, load_survey):
+    qsf = load_survey(
+        template,
+        QID2={"DisplayLogic": logic("q://QID1/SelectableChoice/2", "Selected")},
+    )
+    result = PathSimulator(qsf, seed=5).simulate(200)
+    assert len(set(result.questions)) == 2
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["needs_based_analytics.qsf"]),
+    indirect=True,
+)
+def test_estimate_seconds(template, load_survey):
+    qsf = load_survey(template, validation="off", QID1={"QuestionText": None})
+    question = qsf.get_question("QID1")
+    assert estimate_seconds(question) == 3.0 * len(question.choices)
+    question = qsf.get_question("QID2")
+    words = len(re.sub(r"<[^>]*>", " ", question.question_text).split())
+    assert estimate_seconds(question) == 3.0 * len(question.choices) + words * 0.25
@@ -0,0 +1,123 @@
+import asyncio
+import io
+import pickle
+from pathlib import Path
+import pytest
+from pyqsf.core import stats as stats_module
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.stats import LoadPhase, LoadStats, measure
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_stats(template):
+    qsf = QualtricsSurveyFile(template, stats=True)
+    stats = qsf.stats
+    assert set(stats.seconds) == {phase.value for phase in LoadPhase}
+    assert stats.calls["questions"] == 13
+    assert stats.calls["decode"] == 1
+    assert stats.total == pytest.approx(sum(stats.seconds.values()))
+    assert stats.elements == {
+        "BL": 1,
+        "FL": 1,
+        "PL": 1,
+        "PROJ": 1,
+        "QC": 1,
+        "RS": 1,
+        "SCO": 1,
+        "SO": 1,
+        "SQ": 13,
+        "STAT": 1,
+    }
+    assert stats.questions == {"DB": 2, "MC": 10, "TE": 1}
+    assert stats.to_dict()["questions"] == stats.questions
+    assert QualtricsSurveyFile(template).stats is None
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_stats_sources(template):
+    content = Path(template).read_bytes()
+    stream = QualtricsSurveyFile(template, stream=True, stats=True).stats
+    assert "read" not in stream.seconds
+    assert stream.calls["parse"] == sum(stream.elements.values())
+
+    fileobj = QualtricsSurveyFile.from_fileobj(io.BytesIO(content), stats=True)
+    assert fileobj.stats.calls["read"] == 1
+
+    lazy = QualtricsSurveyFile.from_bytes(content, lazy=True, stats=True)
+    assert set(lazy.stats.seconds) == {"decode"}
+    lazy.get_question("QID2")
+    assert lazy.stats.questions == {"MC": 1}
+
+    shared = LoadStats()
+    for _ in range(2):
+        QualtricsSurveyFile.from_bytes(content, stats=shared)
+    assert shared.calls["decode"] == 2
+    assert shared.elements["SQ"] == 26
+
+
+def test_stats_nested(monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(stats_module, "perf_counter", lambda: next(clock))
+    calls = []
+    stats = LoadStats(hook=lambda phase, seconds: calls.append((phase, seconds)))
+    with stats.phase(LoadPhase.COMPOSE):
+        with stats.phase(LoadPhase.QUESTIONS):
+            pass
+        with measure(stats, LoadPhase.QUESTIONS):
+            pass
+    with measure(None, LoadPhase.READ):
+        pass
+    assert calls == [("questions", 1), ("questions", 1), ("compose", 3)]
+    assert stats.seconds == {"questions": 2, "compose": 3}
+    assert stats.calls == {"questions": 2, "compose": 1}
+    assert stats.total == 5
+
+
+def test_stats_concurrent(monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(stats_module, "perf_counter", lambda: next(clock))
+    stats = LoadStats()
+
+    async def load(outer, inner):
+        with stats.phase(outer):
+            await asyncio.sleep(0)
+            with stats.phase(inner):
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(
+            load(LoadPhase.COMPOSE, LoadPhase.QUESTIONS),
+            load(LoadPhase.DECODE, LoadPhase.FLOW),
+        )
+
+    asyncio.run(main())
+    assert stats.seconds == {"questions": 2, "compose": 4, "flow": 2, "decode": 4}
+    assert stats.total == 12
+    assert stats_module._SPANS.get() == ()
+
+
+def test_stats_pickle():
+    stats = LoadStats(hook=lambda phase, seconds: None)
+    with stats.phase(LoadPhase.READ):
+        stats.count_element("SQ")
+        stats.count_question("MC")
+    restored = pickle.loads(pickle.dumps(stats))
+    assert restored.hook is None
+    assert restored.to_dict() == stats.to_dict()
+    with restored.phase(LoadPhase.READ):
+        pass
+    assert restored.calls == {"read": 2}
@@ -0,0 +1,76 @@
+import pytest
+from array import array
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.table import QuestionTable, TableColumn
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_question_table(template):
+    qsf = QualtricsSurveyFile(template)
+    table = qsf.question_table()
+    assert table is qsf.question_table()
+    assert len(table) == len(qsf.questions)
+    assert table.question_ids == tuple(q.question_id for q in qsf.questions)
+    assert table.data_export_tags == tuple(q.data_export_tag for q in qsf.questions)
+    assert table.questions_at(range(len(table))) == list(qsf.questions)
+
+    types = table.categories("question_type")
+    codes = table.codes(TableColumn.QUESTION_TYPE)
+    assert isinstance(codes, array)
+    for row, question in enumerate(qsf.questions):
+        assert types[codes[row]] == question.question_type
+        assert table.categories("selector")[table.codes("selector")[row]] == (
+            question.selector
+        )
+    assert table.categories("block") == tuple(b.id for b in qsf.blocks)
+    for code, block in enumerate(qsf.blocks):
+        rows = table.where(block=block.id)
+        assert [table.question_at(r) for r in rows] == [
+            e for e in qsf._get_structure()[block] if e in qsf.questions
+        ]
+        assert (
+            list(table.codes("block")).count(code) == table.count_by("block")[block.id]
+        )
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_question_table_filters(template):
+    table = QualtricsSurveyFile(template).question_table()
+    mc_rows = table.where(question_type="MC")
+    assert len(mc_rows) == table.count_by("question_type")["MC"]
+    assert all(q.question_type == "MC" for q in table.questions_at(mc_rows))
+    assert table.where(question_type="MC", selector="SAVR") == array(
+        "i",
+        [r for r in mc_rows if table.question_at(r).selector == "SAVR"],
+    )
+    assert table.where(question_type="TEST") == array("i")
+    assert table.where() == array("i", range(len(table)))
+
+    groups = table.group_by("question_type")
+    assert sorted(r for rows in groups.values() for r in rows) == list(
+        range(len(table))
+    )
+    assert groups["TE"] == table.where(question_type="TE")
+    assert {k: len(v) for k, v in groups.items()} == table.count_by("question_type")
+
+
+def test_question_table_empty():
+    table = QuestionTable([], [], [])
+    assert len(table) == 0
+    assert table.group_by("selector") == {}
+    assert table.count_by("block") == {}
+    with pytest.raises(ValueError):
+        table.codes("test")
@@ -0,0 +1,23 @@
+import pytest
+from pyqsf.core.element import Element
+from pyqsf.core.validation import (
+    ValidationLevel,
+    get_validation,
+    set_validation,
+)
+
+
+@pytest.fixture
+def default_level():
+    yield
+    set_validation(ValidationLevel.FAST)
+
+
+def test_get_validation(default_level):
+    assert get_validation() is ValidationLevel.FAST
+    assert get_validation("strict") is ValidationLevel.STRICT
+    set_validation("off")
+    assert get_validation() is ValidationLevel.OFF
+    assert Element({})._level is ValidationLevel.OFF
+    with pytest.raises(ValueError):
+        get_validation("TEST")
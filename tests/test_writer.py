@@ -0,0 +1,172 @@
+import io
+import json
+from pathlib import Path
+import pytest
+from pyqsf.core.flow import GroupNode
+from pyqsf.core.qsf import QualtricsSurveyFile
+from pyqsf.core.reader import iter_qsf
+from pyqsf.core.writer import encode, write_document
+from pyqsf.exceptions import QSFNotSerializable
+
+
+@pytest.fixture
+def template(datadir, request):
+    return datadir.join(request.param)
+
+
+def read_text(template):
+    return Path(template).read_text(encoding="utf-8-sig").strip()
+
+
+def element_texts(text):
+    return [encode(element) for element in json.loads(text)["SurveyElements"]]
+
+
+def test_encode():
+    assert (
+        encode({"A": "a/b", "B": [1, None, True]}) == '{"A":"a\\/b","B":[1,null,true]}'
+    )
+    assert encode("Ünï") == '"\\u00dcn\\u00ef"'
+
+
+def test_write_document():
+    file = io.StringIO()
+    write_document(
+        file,
+        {"SurveyEntry": {"SurveyID": "SV_1"}, "SurveyElements": None, "Count": 2},
+        "SurveyElements",
+        [({"Element": "BL"}, None), ({}, '{ "Element" : "SQ" }')],
+    )
+    assert file.getvalue() == (
+        '{"SurveyEntry":{"SurveyID":"SV_1"},'
+        '"SurveyElements":[{"Element":"BL"},{ "Element" : "SQ" }],"Count":2}'
+    )
+
+
+def test_iter_qsf_text():
+    text = '{"SurveyElements": [ {"A": "a\\/b"} , {"B" :1}], "Count": 1}'
+    assert list(iter_qsf(io.StringIO(text), "SurveyElements", 2, text=True)) == [
+        ("SurveyElements", ({"A": "a/b"}, '{"A": "a\\/b"}')),
+        ("SurveyElements", ({"B": 1}, '{"B" :1}')),
+        ("Count", 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (
+        [
+            "brand_perceptions.qsf",
+            "customer_service_contact_center.qsf",
+            "employee_exit_interview.qsf",
+            "needs_based_analytics.qsf",
+            "pricing_study.qsf",
+            "transactional_effort_customer_score.qsf",
+        ]
+    ),
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"lazy": True},
+        {"keep_source": True},
+        {"keep_source": True, "stream": True},
+    ],
+)
+def test_round_trip(template, options):
+    qsf = QualtricsSurveyFile(template, **options)
+    assert qsf.dumps() == read_text(template)
+    assert qsf.to_dict() == json.loads(read_text(template))
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_keep_source(template):
+    text = read_text(template).replace('"Element":"SO"', '"Element" : "SO"', 1)
+    qsf = QualtricsSurveyFile.from_bytes(text.encode("utf-8"), keep_source=True)
+    assert len(qsf._sources) == len(element_texts(text))
+    assert qsf.dumps() == text
+    assert QualtricsSurveyFile.from_bytes(text.encode("utf-8")).dumps() != text
+
+    qsf = QualtricsSurveyFile.from_fileobj(io.StringIO(text), keep_source=True)
+    assert qsf.dumps() == text
+    qsf = QualtricsSurveyFile.from_fileobj(io.StringIO(text))
+    assert not qsf._sources
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_write_changes(template, tmp_path):
+    qsf = QualtricsSurveyFile(template, keep_source=True)
+    question = qsf.get_question("QID2")
+    question.question_text = "Changed/text"
+    question.choices["1"]["Display"] = "Changed choice"
+    flow = qsf.flow
+    group = GroupNode({"Type": "Group", "FlowID": "FL_9", "Description": "Group"})
+    flow.insert_node(len(flow.get_nodes()), group)
+    flow.move_node(flow.get_nodes()[-2], 0, group)
+    block = qsf.blocks[0]
+    block.elements.pop()
+    qsf.entry.survey_name = "Changed name"
+
+    path = tmp_path / "survey.qsf"
+    qsf.write(str(path))
+    written = path.read_text(encoding="utf-8")
+    assert written == qsf.dumps()
+
+    changed = QualtricsSurveyFile(str(path))
+    assert changed.entry.survey_name == "Changed name"
+    assert changed.get_question("QID2").question_text == "Changed/text"
+    assert changed.get_question("QID2").choices["1"]["Display"] == "Changed choice"
+    assert len(changed.blocks[0].elements) == len(block.elements)
+    assert changed._get_flow().get_paths(block.id)[0][0].flow_id == "FL_9"
+
+    before = element_texts(read_text(template))
+    after = element_texts(written)
+    kinds = [element["Element"] for element in json.loads(written)["SurveyElements"]]
+    assert len(before) == len(after)
+    for kind, old, new in zip(kinds, before, after):
+        if kind not in ("BL", "FL", "SQ"):
+            assert old == new
+    assert sum(old != new for old, new in zip(before, after)) == 3
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_write_block_keys(template):
+    data = json.loads(read_text(template))
+    qsf = QualtricsSurveyFile.from_dict(data)
+    block = qsf._get_blocks()
+    assert list(block.to_dict()["Payload"]) == ["1", "41"]
+    block.block_elements.pop(0)
+    assert list(block.to_dict()["Payload"]) == ["1"]
+    block.payload = list(block.payload.values())
+    assert block.to_dict()["Payload"] == [block.block_elements[0].to_dict()]
+
+
+@pytest.mark.parametrize(
+    "template",
+    (["employee_exit_interview.qsf"]),
+    indirect=True,
+)
+def test_write_not_serializable(template):
+    qsf = QualtricsSurveyFile(template, keep_data=False)
+    with pytest.raises(QSFNotSerializable) as exc:
+        qsf.dumps()
+    assert str(exc.value) == (
+        "QSF cannot be serialized. Reason: Raw data released, load with keep_data=True."
+    )
+    qsf = QualtricsSurveyFile(template, stream=True)
+    with pytest.raises(QSFNotSerializable):
+        qsf.to_dict()